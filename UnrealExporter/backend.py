@@ -0,0 +1,226 @@
+'''
+The backend module of the UnrealExporter package
+'''
+
+# Import statements
+import abc
+
+# Base class for abstract classes, the metaclass syntax differs between Python 2 and 3
+_Abstract = abc.ABCMeta("_Abstract", (object,), {})
+
+# The scene queries the exporter's scene-wide passes make, answered in bulk with plain names and lists
+# Nodes go in and come out as names, so no PyNode is built for a node the exporter never uses
+# Every method is abstract, CmdsBackend answers them with maya.cmds, the stand-in scene has its own, see benchmarks/standin.py
+class SceneBackend(_Abstract):
+
+    # Gets the type and every type it inherits from, from the base type down
+    @abc.abstractmethod
+    def getInheritedTypes(self, nodeType):
+
+        raise NotImplementedError
+
+    # Gets the values of numeric plugs, one float per plug
+    @abc.abstractmethod
+    def getAttributes(self, plugs):
+
+        raise NotImplementedError
+
+    # Gets the animatable channels of the given nodes, as plug names
+    @abc.abstractmethod
+    def listChannels(self, nodes):
+
+        raise NotImplementedError
+
+    # Gets the nodes connected to any of the given nodes, of a node type if one is given, as names
+    @abc.abstractmethod
+    def listConnections(self, nodes, nodeType = None):
+
+        raise NotImplementedError
+
+    # Gets every node under a node, as a list of full paths and a list of types, and the set of the referenced ones
+    @abc.abstractmethod
+    def listDescendants(self, node):
+
+        raise NotImplementedError
+
+    # Gets every IK handle in the scene with the joints its solver rotates, as (handle full path, joint full paths)
+    # The joints run from the start joint down to the parent of the end effector
+    @abc.abstractmethod
+    def listIkHandles(self):
+
+        raise NotImplementedError
+
+    # Gets the incoming connections of the given nodes or plugs, as (destination plug, source plug, source node type)
+    # DAG source nodes come with full paths
+    @abc.abstractmethod
+    def listSourceConnections(self, nodes):
+
+        raise NotImplementedError
+
+    # Gets every node in the scene with its type, as a list of names and a list of types in scene order
+    # With dag only DAG nodes are listed, with long names are full paths
+    @abc.abstractmethod
+    def listNodeTypes(self, dag = False, long = False):
+
+        raise NotImplementedError
+
+# Scene backend on maya.cmds, every query is one command returning strings
+# maya.cmds is imported when the backend is made, it is already loaded inside Maya
+class CmdsBackend(SceneBackend):
+
+    def __init__(self):
+
+        import maya.cmds
+
+        self.cmds = maya.cmds
+
+    # Gets the type and every type it inherits from, from the base type down
+    def getInheritedTypes(self, nodeType):
+
+        return self.cmds.nodeType(nodeType, inherited = True, isTypeName = True) or [nodeType]
+
+    # Gets the values of numeric plugs, one float per plug
+    # Every plug goes into one selection list and is read through the API, instead of one getAttr each
+    def getAttributes(self, plugs):
+
+        if not plugs:
+
+            return []
+
+        import maya.api.OpenMaya
+
+        selection = maya.api.OpenMaya.MSelectionList()
+
+        for plug in plugs:
+
+            selection.add(plug)
+
+        return [selection.getPlug(i).asDouble() for i in range(len(plugs))]
+
+    # Gets the animatable channels of the given nodes, as plug names
+    def listChannels(self, nodes):
+
+        if not nodes:
+
+            return []
+
+        return self.cmds.listAnimatable(nodes) or []
+
+    # Gets the nodes connected to any of the given nodes, of a node type if one is given, as names
+    def listConnections(self, nodes, nodeType = None):
+
+        # listConnections errors out on an empty list
+        if not nodes:
+
+            return []
+
+        if nodeType is None:
+
+            return self.cmds.listConnections(nodes) or []
+
+        return self.cmds.listConnections(nodes, type = nodeType) or []
+
+    # Gets every node under a node, as a list of full paths and a list of types, and the set of the referenced ones
+    def listDescendants(self, node):
+
+        paths = self.cmds.listRelatives(node, allDescendents = True, fullPath = True) or []
+
+        if not paths:
+
+            return [], [], set()
+
+        # One ls for the types of every node, and one for the referenced ones
+        entries = self.cmds.ls(paths, long = True, showType = True) or []
+        nodeTypes = dict(zip(entries[0::2], entries[1::2]))
+
+        referenced = set(self.cmds.ls(paths, long = True, referencedNodes = True) or [])
+
+        return paths, [nodeTypes.get(path) for path in paths], referenced
+
+    # Gets every IK handle in the scene with the joints its solver rotates, as (handle full path, joint full paths)
+    # The joints run from the start joint down to the parent of the end effector
+    def listIkHandles(self):
+
+        handles = []
+
+        for handle in self.cmds.ls(type = "ikHandle", long = True) or []:
+
+            startJoint = (self.cmds.ls(self.cmds.ikHandle(handle, query = True, startJoint = True), long = True) or [None])[0]
+            effector = (self.cmds.ls(self.cmds.ikHandle(handle, query = True, endEffector = True), long = True) or [None])[0]
+
+            if not startJoint or not effector:
+
+                continue
+
+            # Climb from the effector's parent up to the start joint, the effector sits under the end of the chain
+            joints = []
+
+            path = effector.rpartition("|")[0]
+
+            while path and path != startJoint:
+
+                joints.append(path)
+
+                path = path.rpartition("|")[0]
+
+            # A start joint that isn't above the effector leaves only the joints the solver was given
+            joints = [startJoint] + list(reversed(joints)) if path else [startJoint]
+
+            handles.append((handle, joints))
+
+        return handles
+
+    # Gets the incoming connections of the given nodes or plugs, as (destination plug, source plug, source node type)
+    # DAG source nodes come with full paths
+    def listSourceConnections(self, nodes):
+
+        if not nodes:
+
+            return []
+
+        # listConnections with connections returns destination, source, destination, source...
+        connections = self.cmds.listConnections(nodes, source = True, destination = False, connections = True,
+                                                plugs = True, fullNodeName = True) or []
+
+        sources = connections[1::2]
+
+        if not sources:
+
+            return []
+
+        # One ls for the types of every source node
+        entries = self.cmds.ls(list(set(source.partition(".")[0] for source in sources)), long = True, showType = True) or []
+        nodeTypes = dict(zip(entries[0::2], entries[1::2]))
+
+        return [(destination, source, nodeTypes.get(source.partition(".")[0]))
+                    for destination, source in zip(connections[0::2], sources)]
+
+    # Gets every node in the scene with its type, as a list of names and a list of types in scene order
+    # With dag only DAG nodes are listed, with long names are full paths
+    def listNodeTypes(self, dag = False, long = False):
+
+        # ls with showType returns name, type, name, type...
+        entries = self.cmds.ls(dag = dag, long = long, showType = True) or []
+
+        return entries[0::2], entries[1::2]
+
+# The shared scene backend
+_backend = None
+
+# Gets the shared scene backend, a CmdsBackend unless another one was set
+def getBackend():
+
+    global _backend
+
+    if _backend is None:
+
+        _backend = CmdsBackend()
+
+    return _backend
+
+# Sets the shared scene backend, None goes back to the default on next use
+def setBackend(backend):
+
+    global _backend
+
+    _backend = backend
@@ -0,0 +1,115 @@
+'''
+The bakeContext module of the UnrealExporter package
+'''
+
+# Import statements
+import pymel.core
+
+# Evaluation mode used while baking, DG bakes faster
+BAKE_EVALUATION_MODE = "off"
+
+# Puts Maya in the fast bake configuration, DG evaluation and an unmanaged viewport,
+# and puts the user's configuration back exactly as it was
+# Nestable and ref-counted, only the outermost entry switches, so back to back bakes
+# in a batch don't rebuild the evaluation graph between them
+# Use it with the with statement, or enter and exit
+class BakeContext:
+
+    def __init__(self):
+
+        # Number of entries that haven't exited yet
+        self.depth = 0
+
+        # The user's evaluation mode and viewport state, captured on the outermost entry
+        self.evaluationMode = None
+        self.paneManaged = None
+
+        # Evaluation mode switches made, and the ones nested entries didn't have to make
+        self.switches = 0
+        self.savedSwitches = 0
+
+    def __enter__(self):
+
+        self.enter()
+
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+
+        self.exit()
+
+        return False
+
+    # Switches to the bake configuration on the outermost entry
+    def enter(self):
+
+        self.depth += 1
+
+        # Already in the bake configuration, a switch there and one back are saved
+        if self.depth > 1:
+
+            self.savedSwitches += 2
+
+            return
+
+        self.evaluationMode = pymel.core.evaluationManager(q = True, mode = True)[0]
+
+        if self.evaluationMode != BAKE_EVALUATION_MODE:
+
+            pymel.core.evaluationManager(mode = BAKE_EVALUATION_MODE)
+
+            self.switches += 1
+
+        # Without the UI there is no viewport
+        self.paneManaged = None
+
+        if not pymel.core.about(batch = True):
+
+            self.paneManaged = bool(pymel.core.mel.eval("paneLayout -q -manage $gMainPane"))
+
+            if self.paneManaged:
+
+                pymel.core.mel.eval("paneLayout -e -manage false $gMainPane")
+
+    # Puts the user's configuration back on the outermost exit
+    def exit(self):
+
+        if self.depth == 0:
+
+            return
+
+        self.depth -= 1
+
+        if self.depth > 0:
+
+            return
+
+        if self.evaluationMode != BAKE_EVALUATION_MODE:
+
+            pymel.core.evaluationManager(mode = self.evaluationMode)
+
+            self.switches += 1
+
+        if self.paneManaged:
+
+            pymel.core.mel.eval("paneLayout -e -manage true $gMainPane")
+
+    # Clears the switch counts
+    def resetCounts(self):
+
+        self.switches = 0
+        self.savedSwitches = 0
+
+# The shared bake context
+_bakeContext = None
+
+# Gets the shared bake context
+def getBakeContext():
+
+    global _bakeContext
+
+    if _bakeContext is None:
+
+        _bakeContext = BakeContext()
+
+    return _bakeContext
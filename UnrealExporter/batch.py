@@ -0,0 +1,156 @@
+'''
+The batch module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+
+import pymel.core
+
+# Import bakeContext, tracer, transaction, utils and ueAsset modules from UnrealExporter package
+import UnrealExporter.bakeContext
+import UnrealExporter.tracer
+import UnrealExporter.transaction
+import UnrealExporter.utils
+import UnrealExporter.ueAsset
+
+# Export types
+ANIMATION = "animation"
+MESH = "mesh"
+SKELETON = "skeleton"
+
+# Export types that need the asset baked first
+BAKED_TYPES = (ANIMATION, SKELETON)
+
+# Exports a list of Unreal assets with a shared bake
+# Every asset's bake nodes are collected and baked with one bakeResults call per frame range,
+# then each asset finishes its prep and writes its own fbx
+class BatchExporter:
+
+    def __init__(self, assets = None):
+
+        # List of (asset, exportType) pairs in export order
+        self.entries = []
+
+        # Number of bakes run by this batch
+        self.bakeCount = 0
+
+        # Add any assets given
+        for asset in assets or []:
+
+            self.addAsset(asset)
+
+    # Adds an asset to the batch
+    # If no export type is given, the default for the asset class is used
+    def addAsset(self, asset, exportType = None):
+
+        if exportType is None:
+
+            exportType = getDefaultExportType(asset)
+
+        self.entries.append((asset, exportType))
+
+    # Bakes every asset in the batch, one pass per frame range
+    # Each node is baked over the range of the assets that use it, assets sharing a range share the bake
+    @UnrealExporter.tracer.traced("batchBake")
+    def bake(self):
+
+        # Nodes in the order they were collected, each with the union of its assets' frame ranges
+        nodeRanges = collections.OrderedDict()
+
+        # Loop through all assets that need baking
+        for asset in self.getBakedAssets():
+
+            # Create any helper nodes needed for the bake
+            asset.setupBake()
+
+            startTime, endTime = asset.frameRange
+
+            # Collect the asset's nodes, widening the range of any already recorded
+            for node in asset.getBakeNodes():
+
+                if node in nodeRanges:
+
+                    nodeRanges[node] = (min(startTime, nodeRanges[node][0]), max(endTime, nodeRanges[node][1]))
+
+                else:
+
+                    nodeRanges[node] = (startTime, endTime)
+
+        # Group the nodes by range, so a short asset isn't baked over a longer one's range
+        rangeNodes = collections.OrderedDict()
+
+        for node, frameRange in nodeRanges.items():
+
+            rangeNodes.setdefault(frameRange, []).append(node)
+
+        # Bake each group at once
+        for (startTime, endTime), bakeNodes in rangeNodes.items():
+
+            UnrealExporter.utils.bakeRange(bakeNodes, startTime, endTime)
+
+            self.bakeCount += 1
+
+        # Clean up after the bake
+        for asset in self.getBakedAssets():
+
+            asset.finishBake()
+
+    # Bakes then exports every asset in the batch
+    # With transactional exports on, the whole batch is rolled back once every fbx is written
+    @UnrealExporter.tracer.traced("batch")
+    def export(self):
+
+        transaction = UnrealExporter.transaction.Transaction(assets = [asset for asset, exportType in self.entries],
+                                                                enabled = UnrealExporter.utils.TRANSACTIONAL_EXPORT)
+
+        # The fast bake configuration is kept for the whole batch
+        with transaction, UnrealExporter.bakeContext.getBakeContext():
+
+            # Bake everything first
+            self.bake()
+
+            # Then write each fbx
+            for asset, exportType in self.entries:
+
+                writeAsset(asset, exportType)
+
+    # Gets the assets in the batch that need baking
+    def getBakedAssets(self):
+
+        return [asset for asset, exportType in self.entries if exportType in BAKED_TYPES]
+
+# Gets the default export type for an asset
+def getDefaultExportType(asset):
+
+    # Static meshes only export the mesh
+    if isinstance(asset, UnrealExporter.ueAsset.StaticMesh):
+
+        return MESH
+
+    # Skeletal meshes and cameras export animation
+    return ANIMATION
+
+# Writes the fbx for an asset that has already been prepped
+def writeAsset(asset, exportType):
+
+    # If it's an animation export
+    if exportType == ANIMATION:
+
+        asset.writeAnimation()
+
+    # If it's a skeletal mesh export
+    elif exportType == SKELETON:
+
+        asset.writeSkeletonMesh()
+
+    # If it's a static mesh export
+    elif exportType == MESH:
+
+        asset.exportMesh()
+
+    # If it's none of those
+    else:
+
+        # Error out
+        pymel.core.error("Unknown export type: " + str(exportType))
@@ -0,0 +1,309 @@
+'''
+The callCounter module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+import os
+import sys
+import types
+
+import maya.cmds
+import pymel.core
+
+# Node and attribute methods counted on every pymel class that defines them
+COUNTED_METHODS = ("attr",
+                    "exists",
+                    "get",
+                    "getAttr",
+                    "getChildren",
+                    "getParent",
+                    "getShape",
+                    "getShapes",
+                    "inputs",
+                    "isReferenced",
+                    "isVisible",
+                    "listConnections",
+                    "listHistory",
+                    "listRelatives",
+                    "longName",
+                    "name",
+                    "namespace",
+                    "nodeType",
+                    "outputs",
+                    "referenceFile",
+                    "set",
+                    "setAttr",
+                    "setParent",
+                    "type")
+
+# Counts the calls the exporter makes into Maya, by function and by call site
+# Wraps every command on pymel.core, maya.cmds and mel, and the node methods in COUNTED_METHODS
+# Only the outermost call is counted, calls pymel makes on its own behalf are not round trips from the exporter
+# The wrappers are only in place while something is being measured, so the counter costs nothing otherwise
+# budget caps the calls one measured export may make, functionBudgets caps single functions
+class CallCounter:
+
+    def __init__(self, budget = None, functionBudgets = None):
+
+        self.budget = budget
+        self.functionBudgets = dict(functionBudgets or {})
+
+        # Calls by function, and by (function, call site)
+        self.counts = collections.Counter()
+        self.sites = collections.Counter()
+
+        # Reports of every finished measure
+        self.reports = []
+
+        # Patched (owner, name, original, owned) entries, and how many measures are open
+        self.patches = []
+        self.measures = 0
+
+        # How many counted calls deep the exporter is
+        self.depth = 0
+
+    # Counts a call, then makes it
+    def call(self, name, func, args, kwargs):
+
+        if not self.depth:
+
+            caller = sys._getframe(2)
+
+            self.counts[name] += 1
+            self.sites[(name, "%s:%d %s" % (os.path.basename(caller.f_code.co_filename),
+                                            caller.f_lineno,
+                                            caller.f_code.co_name))] += 1
+
+        self.depth += 1
+
+        try:
+
+            return func(*args, **kwargs)
+
+        finally:
+
+            self.depth -= 1
+
+    # Gets the budgets a report went over, as (function, calls, budget), the total is "total"
+    def getOverBudget(self, report):
+
+        overBudget = []
+
+        if self.budget is not None and report["total"] > self.budget:
+
+            overBudget.append(("total", report["total"], self.budget))
+
+        for name, budget in sorted(self.functionBudgets.items()):
+
+            calls = report["counts"].get(name, 0)
+
+            if calls > budget:
+
+                overBudget.append((name, calls, budget))
+
+        return overBudget
+
+    # Raises an error listing every measured export that went over budget
+    def checkBudgets(self):
+
+        failures = []
+
+        for report in self.reports:
+
+            for name, calls, budget in report["overBudget"]:
+
+                failures.append("%s %s: %d calls, budget %d" % (report["label"], name, calls, budget))
+
+        if failures:
+
+            pymel.core.error("Call budget exceeded\n" + "\n".join(failures))
+
+    # Puts the wrappers in place
+    def install(self):
+
+        # Commands
+        self.patchCallables(pymel.core, "")
+        self.patchCallables(maya.cmds, "cmds.")
+
+        # Mel commands are looked up on the fly, so mel is wrapped as a whole
+        self.patch(pymel.core, "mel", MelCounter(self, pymel.core.mel))
+
+        # Node and attribute methods
+        for value in list(vars(pymel.core).values()):
+
+            if not isinstance(value, type):
+
+                continue
+
+            for name in COUNTED_METHODS:
+
+                method = value.__dict__.get(name)
+
+                if isinstance(method, types.FunctionType):
+
+                    self.patch(value, name, self.wrap("%s.%s" % (value.__name__, name), method))
+
+    # Counts the calls made inside the with block, the report is added to reports when it ends
+    # Measures nest, an outer one counts the calls of the ones inside it
+    def measure(self, label):
+
+        return Measure(self, label)
+
+    # Replaces an attribute, remembering how to put it back
+    def patch(self, owner, name, value):
+
+        self.patches.append((owner, name, getattr(owner, name), name in vars(owner)))
+
+        setattr(owner, name, value)
+
+    # Wraps every public function on a module, or on an object standing in for one
+    def patchCallables(self, owner, prefix):
+
+        for name in dir(owner):
+
+            if name.startswith("_"):
+
+                continue
+
+            value = getattr(owner, name)
+
+            if isinstance(value, (types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+
+                self.patch(owner, name, self.wrap(prefix + name, value))
+
+    # Clears the counts and reports
+    def reset(self):
+
+        self.counts = collections.Counter()
+        self.sites = collections.Counter()
+        self.reports = []
+
+    # Takes the wrappers back out
+    def uninstall(self):
+
+        for owner, name, original, owned in reversed(self.patches):
+
+            if owned:
+
+                setattr(owner, name, original)
+
+            else:
+
+                delattr(owner, name)
+
+        self.patches = []
+
+    # Wraps a function so calls to it are counted under name
+    def wrap(self, name, func):
+
+        counter = self
+
+        def countedCall(*args, **kwargs):
+
+            return counter.call(name, func, args, kwargs)
+
+        countedCall.__name__ = func.__name__
+        countedCall.__doc__ = func.__doc__
+
+        return countedCall
+
+# Counts mel commands, they are looked up on the mel object when they are called
+class MelCounter:
+
+    def __init__(self, counter, mel):
+
+        self.counter = counter
+        self.mel = mel
+
+    def __getattr__(self, name):
+
+        value = getattr(self.mel, name)
+
+        if not callable(value):
+
+            return value
+
+        return self.counter.wrap("mel." + name, value)
+
+# The calls made during one measured export
+class Measure:
+
+    def __init__(self, counter, label):
+
+        self.counter = counter
+        self.label = label
+
+    def __enter__(self):
+
+        counter = self.counter
+
+        if not counter.measures:
+
+            counter.install()
+
+        counter.measures += 1
+
+        self.counts = collections.Counter(counter.counts)
+        self.sites = collections.Counter(counter.sites)
+
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+
+        counter = self.counter
+
+        counter.measures -= 1
+
+        if not counter.measures:
+
+            counter.uninstall()
+
+        counts = counter.counts - self.counts
+        sites = counter.sites - self.sites
+
+        report = {"label" : self.label,
+                    "total" : sum(counts.values()),
+                    "counts" : dict(counts),
+                    "sites" : dict(("%s %s" % site, calls) for site, calls in sites.items())}
+
+        report["overBudget"] = counter.getOverBudget(report)
+
+        counter.reports.append(report)
+
+        self.report = report
+
+        return False
+
+# The shared call counter
+_callCounter = None
+
+# Formats a measure's report, with the functions and call sites that made the most calls
+def formatReport(report, top = 10):
+
+    lines = ["%s: %d calls" % (report["label"], report["total"])]
+
+    for title, calls in (("functions", report["counts"]), ("call sites", report["sites"])):
+
+        lines.append("  top %s" % title)
+
+        for name, count in sorted(calls.items(), key = lambda item: (-item[1], item[0]))[:top]:
+
+            lines.append("    %7d  %s" % (count, name))
+
+    for name, calls, budget in report["overBudget"]:
+
+        lines.append("  over budget: %s %d calls, budget %d" % (name, calls, budget))
+
+    return "\n".join(lines)
+
+# Gets the shared call counter
+def getCallCounter():
+
+    global _callCounter
+
+    if _callCounter is None:
+
+        _callCounter = CallCounter()
+
+    return _callCounter
@@ -0,0 +1,211 @@
+'''
+The cameras module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+import math
+
+import maya.cmds
+import pymel.core
+
+# Import curves and tracer modules from UnrealExporter package
+import UnrealExporter.curves
+import UnrealExporter.tracer
+
+# Rotation added around the camera's own Y axis, Maya cameras look down -Z and Unreal cameras down +X
+OFFSET_ROTATE_Y = 90.0
+
+# Lens attributes written onto the export camera
+LENS_ATTRIBUTES = ("focalLength",
+                    "horizontalFilmAperture",
+                    "verticalFilmAperture",
+                    "nearClipPlane",
+                    "farClipPlane")
+
+# Channels written onto the export camera, as (attribute, anim curve type)
+TRANSLATE_CHANNELS = (("translateX", "animCurveTL"), ("translateY", "animCurveTL"), ("translateZ", "animCurveTL"))
+ROTATE_CHANNELS = (("rotateX", "animCurveTA"), ("rotateY", "animCurveTA"), ("rotateZ", "animCurveTA"))
+
+# Writes the source camera's animation onto the export camera over a frame range, retimed to start on frame 0
+# The source is sampled once, world matrices, rotate pivot and animated lens attributes, and converted analytically,
+# so nothing is baked and no helper nodes are made
+# The export camera sits on the source's world rotate pivot, where the parentConstraint bake this replaced put it
+# With NumPy every frame is converted in one vectorized pass
+# Returns the curve keys written, as plug name: (curve type, times, values)
+@UnrealExporter.tracer.traced("cameraConvert")
+def convertCamera(source, target, startTime, endTime):
+
+    frames, matrices, pivots, lens = sampleCamera(source, startTime, endTime)
+
+    try:
+
+        import numpy
+
+    except ImportError:
+
+        numpy = None
+
+    if numpy is not None:
+
+        translate, rotate = convertMatrices(matrices, pivots = pivots)
+
+        translate = translate.tolist()
+        rotate = rotate.tolist()
+
+    else:
+
+        # Without NumPy, convert frame by frame and Euler filter the curves in Maya afterwards
+        framePivots = pivots if isinstance(pivots, list) else [pivots] * len(matrices)
+
+        converted = [convertMatrix(matrix, pivot = pivot) for matrix, pivot in zip(matrices, framePivots)]
+
+        translate = [[frame[0][axis] for frame in converted] for axis in range(3)]
+        rotate = [UnrealExporter.curves.minimizeRotation([frame[1][axis] for frame in converted]) for axis in range(3)]
+
+    # Keys start on frame 0 for export
+    times = [frame - frames[0] for frame in frames]
+
+    curveKeys = collections.OrderedDict()
+
+    targetName = target.name()
+
+    for (attr, curveType), values in zip(TRANSLATE_CHANNELS + ROTATE_CHANNELS, translate + rotate):
+
+        curveKeys[targetName + "." + attr] = (curveType, times, values)
+
+    # Animated lens attributes get curves, static ones are set once
+    targetShapeName = target.getShape().name()
+
+    for attr, values in lens.items():
+
+        if isinstance(values, list):
+
+            curveKeys[targetShapeName + "." + attr] = ("animCurveTU", times, values)
+
+        else:
+
+            pymel.core.setAttr(targetShapeName + "." + attr, values)
+
+    UnrealExporter.curves.setCurveKeys(curveKeys)
+
+    if numpy is None:
+
+        pymel.core.filterCurve(target.listConnections(type = "animCurveTA"), filter = "euler")
+
+    return curveKeys
+
+# Converts one flat 4x4 world matrix into Unreal ready translate and rotate, in degrees with the xyz rotate order
+# The translation is the world position of the pivot, given in the camera's object space
+# Same as convertMatrices for a single frame, without the Euler filter
+def convertMatrix(matrix, offsetRotateY = OFFSET_ROTATE_Y, pivot = (0.0, 0.0, 0.0)):
+
+    # Scale is dropped before the offset, which would otherwise mix differently scaled axes
+    rows = [[matrix[row * 4 + column] for column in range(3)] for row in range(3)]
+    rows = [[value / math.sqrt(sum(v * v for v in row)) for value in row] for row in rows]
+
+    # The offset turns the camera in its own space, so it multiplies first
+    c = math.cos(math.radians(offsetRotateY))
+    s = math.sin(math.radians(offsetRotateY))
+
+    offset = [[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]]
+
+    rows = [[sum(offset[row][k] * rows[k][column] for k in range(3)) for column in range(3)] for row in range(3)]
+
+    sy = max(-1.0, min(1.0, -rows[0][2]))
+    cy = math.sqrt(rows[0][0] ** 2 + rows[0][1] ** 2)
+
+    # Looking straight up or down, X and Z turn about the same axis, so Z is kept at 0
+    if cy < 1e-6:
+
+        rotate = [math.atan2(rows[1][0] * sy, rows[1][1]), math.asin(sy), 0.0]
+
+    else:
+
+        rotate = [math.atan2(rows[1][2], rows[2][2]), math.asin(sy), math.atan2(rows[0][1], rows[0][0])]
+
+    translate = [matrix[12 + column] + sum(pivot[k] * matrix[k * 4 + column] for k in range(3)) for column in range(3)]
+
+    return translate, [math.degrees(angle) for angle in rotate]
+
+# Converts world matrices into Unreal ready translate and rotate arrays, needs NumPy
+# matrices is one flat 4x4 matrix per frame, as Maya gives them, or an array shaped (frames, 4, 4)
+# pivots is the pivot in the camera's object space, one for every frame or one per frame, the translation is its world position
+# Returns translate and rotate shaped (3, frames), the rotations in degrees with the xyz rotate order and Euler filtered
+def convertMatrices(matrices, offsetRotateY = OFFSET_ROTATE_Y, pivots = (0.0, 0.0, 0.0)):
+
+    import numpy
+
+    matrices = numpy.asarray(matrices, dtype = float).reshape(-1, 4, 4)
+
+    pivots = numpy.broadcast_to(numpy.asarray(pivots, dtype = float).reshape(-1, 3), (len(matrices), 3))
+
+    translate = matrices[:, 3, :3] + numpy.matmul(pivots[:, numpy.newaxis, :], matrices[:, :3, :3])[:, 0]
+
+    # Scale is dropped before the offset, which would otherwise mix differently scaled axes
+    rows = matrices[:, :3, :3] / numpy.linalg.norm(matrices[:, :3, :3], axis = 2)[:, :, numpy.newaxis]
+
+    angle = numpy.radians(offsetRotateY)
+
+    offset = numpy.array([[numpy.cos(angle), 0.0, -numpy.sin(angle)],
+                            [0.0, 1.0, 0.0],
+                            [numpy.sin(angle), 0.0, numpy.cos(angle)]])
+
+    # The offset turns the camera in its own space, so it multiplies first
+    rows = numpy.matmul(offset, rows)
+
+    sy = numpy.clip(-rows[:, 0, 2], -1.0, 1.0)
+    cy = numpy.hypot(rows[:, 0, 0], rows[:, 0, 1])
+
+    # Looking straight up or down, X and Z turn about the same axis, so Z is kept at 0
+    gimbal = cy < 1e-6
+
+    rotate = numpy.array([numpy.where(gimbal,
+                                        numpy.arctan2(rows[:, 1, 0] * sy, rows[:, 1, 1]),
+                                        numpy.arctan2(rows[:, 1, 2], rows[:, 2, 2])),
+                            numpy.arcsin(sy),
+                            numpy.where(gimbal, 0.0, numpy.arctan2(rows[:, 0, 1], rows[:, 0, 0]))])
+
+    rotate = UnrealExporter.curves.eulerFilterArrays(numpy.degrees(rotate)[numpy.newaxis])[0]
+
+    return translate.T.copy(), rotate
+
+# Samples a camera over a frame range, without changing the current time
+# Returns the frames, one flat world matrix per frame, the rotate pivot and the lens attributes,
+# as a list of values per frame for animated ones and a single value for the rest
+def sampleCamera(source, startTime, endTime):
+
+    frames = list(range(int(startTime), int(endTime) + 1))
+
+    matrixPlug = source.name() + ".worldMatrix[0]"
+
+    matrices = [maya.cmds.getAttr(matrixPlug, time = frame) for frame in frames]
+
+    # getAttr gives the pivot as [(x, y, z)]
+    pivotPlug = source.name() + ".rotatePivot"
+
+    if maya.cmds.connectionInfo(pivotPlug, isDestination = True):
+
+        pivots = [tuple(maya.cmds.getAttr(pivotPlug, time = frame)[0]) for frame in frames]
+
+    else:
+
+        pivots = tuple(maya.cmds.getAttr(pivotPlug)[0])
+
+    lens = collections.OrderedDict()
+
+    shapeName = source.getShape().name()
+
+    for attr in LENS_ATTRIBUTES:
+
+        plug = shapeName + "." + attr
+
+        if maya.cmds.connectionInfo(plug, isDestination = True):
+
+            lens[attr] = [maya.cmds.getAttr(plug, time = frame) for frame in frames]
+
+        else:
+
+            lens[attr] = maya.cmds.getAttr(plug)
+
+    return frames, matrices, pivots, lens
@@ -0,0 +1,347 @@
+'''
+The curves module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+import math
+
+import maya.cmds
+import pymel.core
+
+# Import backend and transaction modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.transaction
+
+# Anim curve types whose keys are angles
+ANGULAR_CURVE_TYPES = ("animCurveTA",)
+
+# Axis index per rotation attribute
+ROTATE_AXES = {"rotateX" : 0, "rotateY" : 1, "rotateZ" : 2, "rx" : 0, "ry" : 1, "rz" : 2}
+
+# Middle axis of each rotate order, xyz, yzx, zxy, xzy, yxz, zyx
+# The equivalent rotation flips the middle axis to 180 - angle and adds 180 to the others
+MIDDLE_AXES = (1, 2, 0, 2, 0, 1)
+
+# Euler filters the rotation curves on the given nodes in one vectorized pass, needs NumPy
+# Every rotation curve is read in bulk, filtered with eulerFilterArrays and only changed curves are written back
+def eulerFilter(nodes):
+
+    import numpy
+
+    plugCurves = {}
+
+    curveKeys = getCurveKeys(nodes, "animCurveTA", plugCurves)
+
+    # Rotation curves by node, as axis: plug name
+    rotations = collections.OrderedDict()
+
+    for plugName, (curveType, times, values) in curveKeys.items():
+
+        nodeName, sep, attr = plugName.rpartition(".")
+
+        if curveType in ANGULAR_CURVE_TYPES and attr in ROTATE_AXES:
+
+            rotations.setdefault(nodeName, {})[ROTATE_AXES[attr]] = plugName
+
+    # Full x, y, z sets keyed on the same frames are filtered together, by key count
+    triples = collections.OrderedDict()
+    singles = []
+
+    for nodeName, plugNames in rotations.items():
+
+        times = [curveKeys[plugName][1] for plugName in plugNames.values()]
+
+        if len(plugNames) == 3 and times[0] == times[1] == times[2]:
+
+            triples.setdefault(len(times[0]), []).append((nodeName, [plugNames[axis] for axis in range(3)]))
+
+        else:
+
+            singles.extend(plugNames.values())
+
+    filtered = {}
+
+    for frameCount, entries in triples.items():
+
+        array = numpy.array([[curveKeys[plugName][2] for plugName in plugNames] for nodeName, plugNames in entries],
+                                dtype = float)
+
+        # Only nodes that would switch solution with some rotate order need theirs looked up
+        mayFlip = numpy.zeros(len(entries), dtype = bool)
+
+        for axis in range(3):
+
+            mayFlip |= getSolutionSwitches(array, [axis] * len(entries)).any(axis = 1)
+
+        middleAxes = [1] * len(entries)
+
+        flipping = numpy.flatnonzero(mayFlip)
+
+        # Every rotate order in one query
+        rotateOrders = UnrealExporter.backend.getBackend().getAttributes([entries[i][0] + ".rotateOrder" for i in flipping])
+
+        for i, rotateOrder in zip(flipping, rotateOrders):
+
+            middleAxes[i] = MIDDLE_AXES[int(rotateOrder)]
+
+        array = eulerFilterArrays(array, middleAxes)
+
+        for (nodeName, plugNames), values in zip(entries, array):
+
+            filtered.update(zip(plugNames, values))
+
+    # Curves without a full set are unwrapped on their own
+    for plugName in singles:
+
+        filtered[plugName] = unwrapArrays(numpy.array([curveKeys[plugName][2]], dtype = float))[0]
+
+    # Write back the curves that changed
+    changed = collections.OrderedDict()
+
+    for plugName, values in filtered.items():
+
+        curveType, times, oldValues = curveKeys[plugName]
+
+        if not numpy.array_equal(values, oldValues):
+
+            changed[plugName] = (curveType, times, values.tolist())
+
+    setCurveKeys(changed, plugCurves)
+
+    return changed
+
+# Euler filters rotation arrays, shaped (nodes, 3, frames) in degrees, and returns the filtered copy
+# middleAxes gives the middle axis of each node's rotate order, y for all of them by default
+# On every frame the rotation or its equivalent is picked, whichever is closer to the frame before,
+# then every axis is unwrapped
+def eulerFilterArrays(rotations, middleAxes = None):
+
+    import numpy
+
+    rotations = numpy.asarray(rotations, dtype = float)
+
+    if rotations.shape[-1] < 2:
+
+        return rotations.copy()
+
+    if middleAxes is None:
+
+        middleAxes = [1] * rotations.shape[0]
+
+    switches = getSolutionSwitches(rotations, middleAxes)
+
+    # Frames on the other solution are the ones after an odd number of switches
+    flips = numpy.concatenate([numpy.zeros((rotations.shape[0], 1), dtype = int),
+                                numpy.cumsum(switches, axis = 1) % 2], axis = 1)
+
+    chosen = numpy.where(flips[:, numpy.newaxis, :] == 1, getEquivalentArrays(rotations, middleAxes), rotations)
+
+    return unwrapArrays(chosen)
+
+# Gets the equivalent of every rotation in arrays shaped (nodes, 3, frames)
+# 180 is added to the outer axes and the middle axis becomes 180 - angle
+def getEquivalentArrays(rotations, middleAxes):
+
+    import numpy
+
+    middle = numpy.arange(3)[numpy.newaxis, :] == numpy.asarray(middleAxes)[:, numpy.newaxis]
+
+    return numpy.where(middle[:, :, numpy.newaxis], 180.0 - rotations, rotations + 180.0)
+
+# Gets the frames, after the first, where the equivalent rotation is closer to the frame before,
+# shaped (nodes, frames - 1)
+# An equivalent is as far from an equivalent as the rotations are from each other,
+# so whether a frame switches solution doesn't depend on the solutions picked before it
+def getSolutionSwitches(rotations, middleAxes):
+
+    import numpy
+
+    equivalents = getEquivalentArrays(rotations, middleAxes)
+
+    previous = rotations[:, :, :-1]
+
+    stayDistance = numpy.abs(wrapArrays(rotations[:, :, 1:] - previous)).sum(axis = 1)
+    switchDistance = numpy.abs(wrapArrays(equivalents[:, :, 1:] - previous)).sum(axis = 1)
+
+    return (switchDistance < stayDistance).astype(int)
+
+# Reads the keys off of every anim curve driving the given nodes
+# Returns plug name: (curve type, times, values), and fills plugCurves with plug name: curve name when it is given
+# All the curves are read in three key queries, split up where the key index starts over
+def getCurveKeys(nodes, curveType = "animCurve", plugCurves = None):
+
+    curveKeys = collections.OrderedDict()
+
+    if not nodes:
+
+        return curveKeys
+
+    # One bulk query for every curve and the plug it drives, as plug, curve, plug, curve...
+    connections = maya.cmds.listConnections([str(node) for node in nodes],
+                                                source = True,
+                                                destination = False,
+                                                type = curveType,
+                                                connections = True) or []
+
+    plugNames = connections[0::2]
+    curveNames = connections[1::2]
+
+    if not curveNames:
+
+        return curveKeys
+
+    # A curve can drive more than one plug, only read it once
+    uniqueCurves = list(collections.OrderedDict.fromkeys(curveNames))
+
+    typeEntries = maya.cmds.ls(uniqueCurves, showType = True)
+    curveTypes = dict(zip(typeEntries[0::2], typeEntries[1::2]))
+
+    indices = maya.cmds.keyframe(uniqueCurves, q = True, indexValue = True) or []
+    times = maya.cmds.keyframe(uniqueCurves, q = True, timeChange = True) or []
+    values = maya.cmds.keyframe(uniqueCurves, q = True, valueChange = True) or []
+
+    starts = [i for i, index in enumerate(indices) if index == 0]
+
+    keys = {}
+
+    if len(starts) == len(uniqueCurves):
+
+        for curveName, start, end in zip(uniqueCurves, starts, starts[1:] + [len(indices)]):
+
+            keys[curveName] = (times[start:end], values[start:end])
+
+    else:
+
+        # Curves without keys throw off the split, read each curve on its own
+        for curveName in uniqueCurves:
+
+            keys[curveName] = (maya.cmds.keyframe(curveName, q = True, timeChange = True) or [],
+                                maya.cmds.keyframe(curveName, q = True, valueChange = True) or [])
+
+    for plugName, curveName in zip(plugNames, curveNames):
+
+        curveKeys[plugName] = (curveTypes[curveName], list(keys[curveName][0]), list(keys[curveName][1]))
+
+        if plugCurves is not None:
+
+            plugCurves[plugName] = curveName
+
+    return curveKeys
+
+# Keeps every angle within 180 degrees of the one before it
+# Same as the minimizeRotation bake option, so a range can be sampled in pieces and minimized afterwards
+def minimizeRotation(values):
+
+    minimized = []
+
+    for value in values:
+
+        if minimized:
+
+            value += 360.0 * math.floor((minimized[-1] - value) / 360.0 + 0.5)
+
+        minimized.append(value)
+
+    return minimized
+
+# Unwraps angle arrays along their last axis, so no value is more than 180 degrees from the one before it
+# Gives the same values as minimizeRotation for every row at once
+def unwrapArrays(values):
+
+    import numpy
+
+    values = numpy.asarray(values, dtype = float)
+
+    if values.shape[-1] < 2:
+
+        return values.copy()
+
+    # Whole turns to add to each value, built up from the jumps between neighbours
+    turns = numpy.floor(-numpy.diff(values, axis = -1) / 360.0 + 0.5)
+    turns = numpy.cumsum(turns, axis = -1)
+
+    unwrapped = values.copy()
+    unwrapped[..., 1:] += 360.0 * turns
+
+    return unwrapped
+
+# Wraps angle arrays into -180 to 180
+def wrapArrays(values):
+
+    return (values + 180.0) % 360.0 - 180.0
+
+# Writes keys onto the anim curves of plugs, as given by getCurveKeys
+# An existing curve of the same time keyed type is cleared first, any other plug gets a new curve connected in its place
+# Driven keys are animCurveU* curves keyed on their input, time keys written onto them would be read as input values
+# plugCurves gives the curve driving each plug as getCurveKeys found it, plugs left out are looked up in one bulk query
+# Angles are given in degrees, like getCurveKeys reads them
+def setCurveKeys(curveKeys, plugCurves = None):
+
+    if not curveKeys:
+
+        return
+
+    if plugCurves is None:
+
+        plugCurves = getPlugCurves(list(curveKeys))
+
+    # One ls for the type of every existing curve
+    existing = list(collections.OrderedDict.fromkeys(plugCurves[plugName] for plugName in curveKeys if plugName in plugCurves))
+
+    typeEntries = (maya.cmds.ls(existing, showType = True) or []) if existing else []
+    curveTypes = dict(zip(typeEntries[0::2], typeEntries[1::2]))
+
+    transaction = UnrealExporter.transaction.getActive()
+
+    writes = collections.OrderedDict()
+
+    for plugName, (curveType, times, values) in curveKeys.items():
+
+        curveName = plugCurves.get(plugName)
+
+        if curveName is not None and curveTypes.get(curveName) == curveType:
+
+            # The keys are written through the API, which is not undoable
+            if transaction is not None:
+
+                transaction.recordCurve(curveName, curveType)
+
+        else:
+
+            curveName = pymel.core.createNode(curveType, name = plugName.split("|")[-1].replace(":", "_").replace(".", "_")).name()
+
+            pymel.core.connectAttr(curveName + ".output", plugName, force = True)
+
+        writes[curveName] = (curveType, times, values)
+
+    writeCurveKeys(writes)
+
+# Gets the anim curve driving each of the given plugs, as plug name: curve name, in one bulk query
+def getPlugCurves(plugNames):
+
+    # listConnections with connections returns plug, curve, plug, curve...
+    connections = maya.cmds.listConnections(plugNames, source = True, destination = False, type = "animCurve",
+                                            connections = True) or []
+
+    return dict(zip(connections[0::2], connections[1::2]))
+
+# Replaces the keys of anim curves, as curve name: (curve type, times, values), angles are given in degrees
+# Every curve is cleared with one cutKey, then keyed in one pass through the API
+def writeCurveKeys(curveKeys):
+
+    if not curveKeys:
+
+        return
+
+    pymel.core.cutKey(list(curveKeys), clear = True)
+
+    for curve, (curveType, times, values) in zip(pymel.core.ls(list(curveKeys)), curveKeys.values()):
+
+        # The API takes angles in radians
+        if curveType in ANGULAR_CURVE_TYPES:
+
+            values = [math.radians(value) for value in values]
+
+        # One call for all of the curve's keys
+        curve.addKeys(times, values)
@@ -0,0 +1,289 @@
+'''
+The drivers module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+
+# Import backend module from UnrealExporter package
+import UnrealExporter.backend
+
+# Node types that change over time on their own, anything downstream of one of them is animated
+# Anim curves keyed on time are animCurveT*, driven keys (animCurveU*) only follow their input
+TIME_NODE_TYPES = ("time",
+                    "expression",
+                    "animCurveTA",
+                    "animCurveTL",
+                    "animCurveTT",
+                    "animCurveTU",
+                    "motionPath",
+                    "cacheFile",
+                    "nucleus",
+                    "hairSystem",
+                    "nCloth",
+                    "nParticle",
+                    "particle")
+
+# Attributes whose value depends on the transforms above their node
+MATRIX_ATTRIBUTES = ("worldMatrix", "worldInverseMatrix", "parentMatrix", "parentInverseMatrix")
+
+# Node types the walk knows how values pass through, a type is modeled when it is, or inherits from, one of these
+# Transforms, constraints and IK handles follow their connections, the transforms above them, and for handles the joints they solve
+# Anything else upstream could change a channel in a way the connections don't show, so nothing is taken to be static
+MODELED_NODE_TYPES = TIME_NODE_TYPES + ("transform",
+                                        "shape",
+                                        "animCurve",
+                                        "geometryFilter",
+                                        "objectSet",
+                                        "displayLayer",
+                                        "unitConversion",
+                                        "blendWeighted",
+                                        "pairBlend",
+                                        "animBlendNodeBase",
+                                        "mute",
+                                        "plusMinusAverage",
+                                        "multiplyDivide",
+                                        "addDoubleLinear",
+                                        "multDoubleLinear",
+                                        "reverse",
+                                        "condition",
+                                        "clamp",
+                                        "setRange",
+                                        "remapValue",
+                                        "blendColors",
+                                        "choice",
+                                        "distanceBetween",
+                                        "decomposeMatrix",
+                                        "composeMatrix",
+                                        "multMatrix",
+                                        "inverseMatrix",
+                                        "wtAddMatrix",
+                                        "network")
+
+# Gets the full paths of every node above a full path, from the parent up
+def getAncestors(path):
+
+    ancestors = []
+
+    while path.count("|") > 1:
+
+        path = path.rpartition("|")[0]
+
+        ancestors.append(path)
+
+    return ancestors
+
+# Gets the name a node is matched on, its leaf name
+# Names come back with and without paths from different queries, nodes sharing a leaf name are treated as one,
+# which can only make more channels driven, never fewer
+def getNodeKey(name):
+
+    return name.partition(".")[0].split("|")[-1]
+
+# Gets the key a plug is matched on, the node's leaf name and the attribute
+def getPlugKey(plug):
+
+    node, sep, attr = plug.partition(".")
+
+    return getNodeKey(node) + sep + attr
+
+# Splits the channels a bake would key on the given nodes into the ones that are driven over time and the ones that aren't
+# A channel is driven when anything upstream of it is a time dependent node, see TIME_NODE_TYPES
+# When anything upstream is of a type the walk doesn't model, every channel is driven
+# Returns the driven and the static channels as plug names, in channel order
+def splitChannels(nodes):
+
+    channels = UnrealExporter.backend.getBackend().listChannels([str(node) for node in nodes])
+
+    graph = UpstreamGraph(channels)
+
+    if graph.getUnmodeledTypes():
+
+        return list(channels), []
+
+    driven = graph.getDrivenNodes()
+
+    drivenChannels = []
+    staticChannels = []
+
+    for channel in channels:
+
+        if graph.channelSources[getPlugKey(channel)] & driven:
+
+            drivenChannels.append(channel)
+
+        else:
+
+            staticChannels.append(channel)
+
+    return drivenChannels, staticChannels
+
+# Everything upstream of a set of channels, through connections, the transforms above matrix inputs,
+# and the IK handles of joints a solver rotates without any connection on their rotations
+# Each level of the graph is one bulk query, the first level is followed per channel, the rest per node
+# Nodes are stored by key, see getNodeKey
+class UpstreamGraph:
+
+    def __init__(self, channels):
+
+        # Source nodes per channel, and source nodes per node
+        self.channelSources = collections.defaultdict(set)
+        self.upstream = collections.defaultdict(set)
+
+        # Node type and name, as it was returned, per node
+        self.nodeTypes = {}
+        self.names = {}
+
+        # IK handles by the key of every joint their solver rotates
+        self.solvers = collections.defaultdict(list)
+
+        self.build(channels)
+
+    # Adds the transforms above a node upstream of it, returns the ones to query next
+    def addAncestors(self, key, node):
+
+        found = []
+
+        for ancestor in getAncestors(node):
+
+            self.upstream[key].add(getNodeKey(ancestor))
+
+            found.extend(self.addNode(ancestor, None))
+
+        return found
+
+    # Records a node upstream, returns the nodes to query next
+    # The IK handles solving a joint are upstream of it, and a handle is placed by the transforms above it
+    def addNode(self, node, nodeType):
+
+        key = getNodeKey(node)
+
+        if key in self.names:
+
+            return []
+
+        self.names[key] = node
+        self.nodeTypes[key] = nodeType
+
+        found = [node]
+
+        for handle in self.solvers.get(key, []):
+
+            self.upstream[key].add(getNodeKey(handle))
+
+            found.extend(self.addNode(handle, "ikHandle"))
+
+        if nodeType == "ikHandle":
+
+            found.extend(self.addAncestors(key, node))
+
+        return found
+
+    # Adds the source of a connection to a set of upstream nodes, returns the nodes to query next
+    def addSource(self, sources, source, nodeType):
+
+        node, sep, attr = source.partition(".")
+
+        key = getNodeKey(node)
+
+        sources.add(key)
+
+        found = self.addNode(node, nodeType)
+
+        # A matrix depends on the transforms above the node as well
+        if attr.startswith(MATRIX_ATTRIBUTES):
+
+            found.extend(self.addAncestors(key, node))
+
+        return found
+
+    # Walks the graph up from the channels a level at a time
+    def build(self, channels):
+
+        backend = UnrealExporter.backend.getBackend()
+
+        for handle, joints in backend.listIkHandles():
+
+            for joint in joints:
+
+                self.solvers[getNodeKey(joint)].append(handle)
+
+        frontier = []
+
+        # The first level is followed per channel
+        for destination, source, nodeType in backend.listSourceConnections(channels):
+
+            frontier.extend(self.addSource(self.channelSources[getPlugKey(destination)], source, nodeType))
+
+        # Channels of a joint an IK solver rotates are driven by its handles
+        for channel in channels:
+
+            for handle in self.solvers.get(getNodeKey(channel), []):
+
+                self.channelSources[getPlugKey(channel)].add(getNodeKey(handle))
+
+                frontier.extend(self.addNode(handle, "ikHandle"))
+
+        # Then every node upstream
+        while frontier:
+
+            level = frontier
+            frontier = []
+
+            for destination, source, nodeType in backend.listSourceConnections(level):
+
+                frontier.extend(self.addSource(self.upstream[getNodeKey(destination)], source, nodeType))
+
+    # Gets the nodes that change over time, the time dependent nodes and everything downstream of them
+    def getDrivenNodes(self):
+
+        downstream = collections.defaultdict(set)
+
+        for node, sources in self.upstream.items():
+
+            for source in sources:
+
+                downstream[source].add(node)
+
+        timeNodes = [node for node, nodeType in self.nodeTypes.items() if nodeType in TIME_NODE_TYPES]
+
+        driven = set(timeNodes)
+        stack = list(timeNodes)
+
+        while stack:
+
+            node = stack.pop()
+
+            for child in downstream[node]:
+
+                if child not in driven:
+
+                    driven.add(child)
+                    stack.append(child)
+
+        return driven
+
+    # Gets the types upstream that the walk doesn't model, see MODELED_NODE_TYPES
+    # The transforms above matrix inputs and IK handles are taken as they come, without a type
+    def getUnmodeledTypes(self):
+
+        backend = UnrealExporter.backend.getBackend()
+
+        unmodeled = set()
+
+        for nodeType in set(self.nodeTypes.values()):
+
+            if nodeType is None:
+
+                continue
+
+            if not any(inherited in MODELED_NODE_TYPES for inherited in backend.getInheritedTypes(nodeType)):
+
+                unmodeled.add(nodeType)
+
+        return sorted(unmodeled)
+
+    # Gets the names of the upstream nodes of the given types
+    def listNodes(self, nodeTypes):
+
+        return [self.names[node] for node, nodeType in self.nodeTypes.items() if nodeType in nodeTypes]
@@ -0,0 +1,159 @@
+'''
+The fbxOptions module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+import json
+import os
+
+import pymel.core
+
+# Options whose mel command takes its value as a plain argument, e.g. FBXExportUpAxis z
+# Every other option is set with -v, switches and numbers alike, e.g. FBXExportBakeComplexStart -v 1
+POSITIONAL_OPTIONS = ("FBXExportUpAxis",
+                        "FBXExportConvertUnitString",
+                        "FBXExportAxisConversionMethod",
+                        "FBXExportScaleFactor")
+
+# Keeps track of the options last sent to the FBX plugin, so an export only sends the ones that changed
+# The plugin's options live for the whole session, new and opened scenes keep them
+# Anything else that sets them, the FBX export dialog or FBXResetExport, leaves the tracked state stale,
+# invalidate it and the next export sends every option again
+class FBXOptionState:
+
+    def __init__(self):
+
+        # Last value sent for every option, by mel command
+        self.applied = {}
+
+        # Options sent and options left alone because they were already set
+        self.sent = 0
+        self.skipped = 0
+
+    # Sends the options that differ from what the plugin already has
+    # Returns the (mel command, value) pairs that were sent
+    def apply(self, options):
+
+        changed = []
+
+        for command, value in options:
+
+            if command in self.applied and self.applied[command] == value:
+
+                self.skipped += 1
+
+                continue
+
+            melCommand = getattr(pymel.core.mel, command)
+
+            # Only the options documented that way take their value straight, everything else is set with v
+            if command in POSITIONAL_OPTIONS:
+
+                melCommand(value)
+
+            else:
+
+                melCommand(v = value)
+
+            self.applied[command] = value
+            self.sent += 1
+
+            changed.append((command, value))
+
+        return changed
+
+    # Forgets what the plugin has, every option is sent again
+    def invalidate(self):
+
+        self.applied = {}
+
+    # Clears the sent and skipped counts
+    def resetCounts(self):
+
+        self.sent = 0
+        self.skipped = 0
+
+# The shared fbx option state
+_optionState = None
+
+# Gets the shared fbx option state
+def getOptionState():
+
+    global _optionState
+
+    if _optionState is None:
+
+        _optionState = FBXOptionState()
+
+    return _optionState
+
+# Loads export profiles from a json file, or a yaml file when PyYAML is installed
+# Profiles map a name to the options they set, a profile's "extends" entry names the profile it starts from:
+#     {"skeletal" : {"FBXExportTangents" : false},
+#      "skeletalAscii" : {"extends" : "skeletal", "FBXExportInAscii" : true}}
+# Returns the profiles as name : (extends, ((mel command, value), ...)), in file order
+def loadProfileFile(profileFilePath):
+
+    with open(profileFilePath) as profileFile:
+
+        # Yaml profile files need PyYAML
+        if os.path.splitext(profileFilePath)[1].lower() in (".yaml", ".yml"):
+
+            try:
+
+                import yaml
+
+            except ImportError:
+
+                pymel.core.error("PyYAML is needed to read yaml profile files: " + profileFilePath)
+
+            data = yaml.safe_load(profileFile)
+
+        else:
+
+            # Keep the option order, python 2 dicts don't
+            data = json.load(profileFile, object_pairs_hook = collections.OrderedDict)
+
+    if not isinstance(data, dict):
+
+        pymel.core.error("Export profile file must map profile names to options: " + profileFilePath)
+
+    profiles = collections.OrderedDict()
+
+    for name, entries in data.items():
+
+        if not isinstance(entries, dict):
+
+            pymel.core.error("Export profile %s must map FBX options to values" % name)
+
+        extends = None
+        options = []
+
+        for command, value in entries.items():
+
+            if command == "extends":
+
+                extends = value
+
+                continue
+
+            # Only FBX plugin commands can be profile options
+            if not command.startswith("FBX"):
+
+                pymel.core.error("Export profile %s has an unknown option: %s" % (name, command))
+
+            # Strings come back as unicode in python 2, the mel commands take str
+            if hasattr(value, "encode"):
+
+                value = str(value)
+
+            elif not isinstance(value, (bool, int, float)):
+
+                pymel.core.error("Export profile %s option %s must be a switch, number or string" % (name, command))
+
+            options.append((str(command), value))
+
+        profiles[str(name)] = (extends, tuple(options))
+
+    return profiles
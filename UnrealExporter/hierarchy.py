@@ -0,0 +1,110 @@
+'''
+The hierarchy module of the UnrealExporter package
+'''
+
+# Import statements
+import pymel.core
+
+# Import backend and utils modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.utils
+
+# Snapshot of the DAG hierarchy built from one ls call
+# Nodes are stored by index, parents, children, types and namespaces are plain lists,
+# so climbing or walking the hierarchy needs no calls into Maya
+class Hierarchy:
+
+    def __init__(self):
+
+        # Full path, parent index, child indices, node type and namespace per node
+        self.paths = []
+        self.parents = []
+        self.children = []
+        self.types = []
+        self.namespaces = []
+
+        # Node index by full path
+        self.indices = {}
+
+        self.build()
+
+    # Builds the snapshot with a single traversal of the DAG
+    def build(self):
+
+        paths, nodeTypes = UnrealExporter.backend.getBackend().listNodeTypes(dag = True, long = True)
+
+        for path, nodeType in zip(paths, nodeTypes):
+
+            self.indices[path] = len(self.paths)
+
+            self.paths.append(path)
+            self.types.append(nodeType)
+            self.namespaces.append(UnrealExporter.utils.getNamespace(path.split("|")[-1]))
+            self.children.append([])
+
+        # Link every node to its parent
+        for index, path in enumerate(self.paths):
+
+            parent = self.indices.get(path.rpartition("|")[0], -1)
+
+            self.parents.append(parent)
+
+            if parent != -1:
+
+                self.children[parent].append(index)
+
+    # Gets every descendant of a node
+    def getDescendants(self, index):
+
+        descendants = []
+        stack = list(reversed(self.children[index]))
+
+        while stack:
+
+            child = stack.pop()
+
+            descendants.append(child)
+
+            stack.extend(reversed(self.children[child]))
+
+        return descendants
+
+    # Gets the constraints under a node that come from another namespace
+    # e.g. object interaction
+    def getForeignConstraints(self, index):
+
+        namespace = self.namespaces[index]
+
+        return [child for child in self.getDescendants(index)
+                    if self.namespaces[child] != namespace and "Constraint" in self.types[child]]
+
+    # Gets the index of a node
+    def getIndex(self, node):
+
+        return self.indices[node.longName()]
+
+    # Gets the node at an index
+    def getNode(self, index):
+
+        return pymel.core.PyNode(self.paths[index])
+
+    # Gets the top joint of the joint chain a node is in
+    def getRootJoint(self, index):
+
+        parent = self.parents[index]
+
+        while parent != -1 and self.types[parent] == "joint":
+
+            index = parent
+            parent = self.parents[index]
+
+        return index
+
+    # Gets the absolute top node above a node
+    def getTopNode(self, index):
+
+        while self.parents[index] != -1:
+
+            index = self.parents[index]
+
+        return index
@@ -0,0 +1,449 @@
+'''
+The incremental module of the UnrealExporter package
+'''
+
+# Import statements
+import hashlib
+import json
+import os
+import time
+
+import maya.cmds
+import pymel.core
+
+# Import backend, batch, drivers, sceneIndex, ueAsset and utils modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.batch
+import UnrealExporter.drivers
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Name of the manifest kept in each export directory
+MANIFEST_NAME = "ueExportManifest.json"
+
+# Seconds to wait on another process's manifest lock before taking it over
+MANIFEST_LOCK_TIMEOUT = 30.0
+
+# Lens attributes that end up in a camera fbx
+CAMERA_ATTRIBUTES = ("focalLength",
+                        "horizontalFilmAperture",
+                        "verticalFilmAperture",
+                        "nearClipPlane",
+                        "farClipPlane")
+
+# Record of the fingerprint each fbx in a directory was last exported with
+class Manifest:
+
+    def __init__(self, directory):
+
+        self.path = os.path.join(directory, MANIFEST_NAME)
+
+        # Entries by fbx file name, and the ones set since loading
+        self.entries = {}
+        self.updated = {}
+
+        if os.path.exists(self.path):
+
+            with open(self.path) as manifestFile:
+
+                self.entries = json.load(manifestFile)
+
+    # Gets the entry for an fbx file, or None if it was never exported
+    def get(self, fileName):
+
+        return self.entries.get(fileName)
+
+    # Writes the manifest next to the fbx files
+    # Parallel exports can share a directory, so the entries on disk are merged in under a lock
+    def save(self):
+
+        lockPath = self.path + ".lock"
+
+        self.lock(lockPath)
+
+        try:
+
+            entries = {}
+
+            if os.path.exists(self.path):
+
+                with open(self.path) as manifestFile:
+
+                    entries = json.load(manifestFile)
+
+            entries.update(self.updated)
+
+            with open(self.path, "w") as manifestFile:
+
+                json.dump(entries, manifestFile, indent = 2, sort_keys = True)
+
+            self.entries = entries
+
+        finally:
+
+            os.remove(lockPath)
+
+    # Waits for and takes the manifest lock
+    def lock(self, lockPath):
+
+        start = time.time()
+
+        while True:
+
+            try:
+
+                os.close(os.open(lockPath, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+
+                return
+
+            except OSError:
+
+                # Take over locks left behind by a crashed process
+                if time.time() - start > MANIFEST_LOCK_TIMEOUT:
+
+                    return
+
+                time.sleep(0.05)
+
+    # Records the fingerprint an fbx file was exported with
+    def set(self, fileName, assetName, exportType, fingerprint):
+
+        self.entries[fileName] = {"asset" : assetName,
+                                    "exportType" : exportType,
+                                    "fingerprint" : fingerprint}
+
+        self.updated[fileName] = self.entries[fileName]
+
+# Batch exporter that skips assets whose inputs have not changed since the last export
+# Each asset is fingerprinted before the bake, off of its undeformed meshes, skin weights,
+# everything upstream of its animation, frame range and fbx options
+class IncrementalExporter(UnrealExporter.batch.BatchExporter):
+
+    def __init__(self, assets = None, force = False):
+
+        UnrealExporter.batch.BatchExporter.__init__(self, assets)
+
+        # Export everything, but still update the manifests
+        self.force = force
+
+        # What was exported or skipped on the last export, and why
+        self.report = []
+
+    # Exports the assets that changed and returns the report
+    def export(self):
+
+        manifests = {}
+        pending = []
+
+        # Report entries in export order
+        report = [None] * len(self.entries)
+
+        # Fingerprint everything before anything gets baked
+        for index, (asset, exportType) in enumerate(self.entries):
+
+            directory, fileName = os.path.split(asset.exportFilePath)
+
+            if directory not in manifests:
+
+                manifests[directory] = Manifest(directory)
+
+            fingerprint = fingerprintAsset(asset, exportType)
+            reason = self.getExportReason(manifests[directory].get(fileName),
+                                            fingerprint,
+                                            asset.exportFilePath)
+
+            # If nothing changed, skip it
+            if reason is None:
+
+                report[index] = createReportEntry(asset, exportType, "skipped", "unchanged")
+
+                continue
+
+            pending.append((index, asset, exportType, manifests[directory], fileName, fingerprint, reason))
+
+        # Export only the changed assets
+        entries = self.entries
+        self.entries = [(asset, exportType) for index, asset, exportType, manifest, fileName, fingerprint, reason in pending]
+
+        try:
+
+            UnrealExporter.batch.BatchExporter.export(self)
+
+        finally:
+
+            self.entries = entries
+
+        # Record the new fingerprints
+        for index, asset, exportType, manifest, fileName, fingerprint, reason in pending:
+
+            manifest.set(fileName, asset.name, exportType, fingerprint)
+
+            report[index] = createReportEntry(asset, exportType, "exported", reason)
+
+        for manifest in manifests.values():
+
+            manifest.save()
+
+        self.report = report
+
+        return self.report
+
+    # Gets why an asset needs exporting, or None if it can be skipped
+    def getExportReason(self, entry, fingerprint, exportFilePath):
+
+        if self.force:
+
+            return "forced"
+
+        if entry is None:
+
+            return "not in manifest"
+
+        if not os.path.exists(exportFilePath):
+
+            return "fbx missing"
+
+        if entry["fingerprint"] != fingerprint:
+
+            return "inputs changed"
+
+        return None
+
+# Creates an entry for the export report
+def createReportEntry(asset, exportType, status, reason):
+
+    return {"asset" : asset.name,
+            "file" : asset.exportFilePath,
+            "exportType" : exportType,
+            "status" : status,
+            "reason" : reason}
+
+# Fingerprints everything that goes into an asset's fbx
+def fingerprintAsset(asset, exportType):
+
+    digest = hashlib.sha1()
+
+    # Adds a labelled value to the fingerprint
+    def add(label, value):
+
+        digest.update(repr((label, value)).encode("utf-8"))
+
+    add("asset", (asset.__class__.__name__, asset.name, exportType))
+    add("options", getExportOptions(asset, exportType))
+
+    # Static meshes only export geometry
+    if exportType != UnrealExporter.batch.MESH:
+
+        add("range", tuple(asset.frameRange))
+
+        # Reduced keys come out different for different tolerances
+        tolerances = UnrealExporter.utils.KEY_REDUCTION_TOLERANCES
+
+        add("keyReduction", sorted(tolerances.items()) if tolerances is not None else None)
+
+        # Selective bakes key static channels once, only added when on so older manifests still match
+        if UnrealExporter.utils.SELECTIVE_BAKE:
+
+            add("selectiveBake", True)
+
+    # Stripped joints are left out of the fbx, only added when on so older manifests still match
+    if isinstance(asset, UnrealExporter.ueAsset.SkeletalMesh) and asset.boneMap is not None:
+
+        add("boneMap", asset.boneMap)
+
+    # Geometry, topology and points, read off of the shape before any deformer
+    for mesh in getFingerprintMeshes(asset):
+
+        counts, vertices = mesh.getVertices()
+        points = pymel.core.xform("%s.vtx[*]" % getOriginalShape(mesh), q = True, objectSpace = True, translation = True)
+
+        add(str(mesh), (list(counts), list(vertices), points))
+
+    # Static mesh placement
+    if isinstance(asset, UnrealExporter.ueAsset.StaticMesh):
+
+        for mesh in asset.geometry:
+
+            add(str(mesh), pymel.core.xform(mesh.getParent(), q = True, worldSpace = True, matrix = True))
+
+    # Skin weights
+    if isinstance(asset, UnrealExporter.ueAsset.SkeletalMesh):
+
+        for skin in asset.skins:
+
+            for mesh in skin.getGeometry():
+
+                add(str(skin), ([str(influence) for influence in skin.getInfluence()],
+                                [list(weights) for weights in skin.getWeights(mesh)]))
+
+    # Camera lens
+    if isinstance(asset, UnrealExporter.ueAsset.Camera):
+
+        add("lens", [asset.objShape.getAttr(attr) for attr in CAMERA_ATTRIBUTES])
+
+    # Static meshes carry no animation
+    if exportType == UnrealExporter.batch.MESH:
+
+        return digest.hexdigest()
+
+    # Everything upstream of the animated nodes, through blends, layers, constraints and IK handles
+    backend = UnrealExporter.backend.getBackend()
+
+    nodes = [str(node) for node in getFingerprintNodes(asset)]
+
+    graph = UnrealExporter.drivers.UpstreamGraph(backend.listChannels(nodes))
+
+    # The time node has nothing of its own to fingerprint
+    upstream = [graph.names[key] for key in sorted(graph.names) if graph.nodeTypes[key] != "time"]
+
+    # Every node by full path and type, asset nodes first, reparenting or retargeting a constraint changes these
+    # One ls for every path and type, ls with showType returns path, type, path, type...
+    listed = maya.cmds.ls(nodes + upstream, long = True, showType = True) or []
+
+    entries = []
+    seen = set()
+    inherited = {}
+
+    for entry in zip(listed[0::2], listed[1::2]):
+
+        if entry in seen:
+
+            continue
+
+        seen.add(entry)
+        entries.append(entry)
+
+        if entry[1] not in inherited:
+
+            inherited[entry[1]] = backend.getInheritedTypes(entry[1])
+
+    add("nodes", entries)
+
+    startTime = asset.frameRange[0]
+
+    for path, nodeType in entries:
+
+        # Anim curve keys, driven keys included
+        if "animCurve" in inherited[nodeType]:
+
+            add(path, (pymel.core.keyframe(path, q = True, timeChange = True, valueChange = True),
+                        pymel.core.keyTangent(path, q = True, inAngle = True),
+                        pymel.core.keyTangent(path, q = True, outAngle = True)))
+
+            continue
+
+        if nodeType == "expression":
+
+            add(path, maya.cmds.expression(path, q = True, string = True))
+
+        # Local matrices hold joint orients and rest poses as well as the channels
+        if "transform" in inherited[nodeType]:
+
+            add(path, maya.cmds.getAttr(path + ".matrix", time = startTime))
+
+    # Channel values on the first frame, keyed or not, unkeyed control values and blend weights included
+    for plug in backend.listChannels([path for path, nodeType in entries if "animCurve" not in inherited[nodeType]]):
+
+        add(plug, maya.cmds.getAttr(plug, time = startTime))
+
+    return digest.hexdigest()
+
+# Formats the export report for printing
+def formatReport(report):
+
+    lines = []
+
+    for entry in report:
+
+        lines.append("%-8s %-30s %-10s %s" % (entry["status"], entry["asset"], entry["exportType"], entry["reason"]))
+
+    exported = len([entry for entry in report if entry["status"] == "exported"])
+
+    lines.append("%d exported, %d skipped" % (exported, len(report) - exported))
+
+    return "\n".join(lines)
+
+# Gets the options of the export profile an asset is written with
+def getExportOptions(asset, exportType):
+
+    getExportProfile = UnrealExporter.utils.getExportProfile
+
+    if exportType == UnrealExporter.batch.MESH:
+
+        return getExportProfile("static")
+
+    if isinstance(asset, UnrealExporter.ueAsset.Camera):
+
+        return getExportProfile("camera")
+
+    if exportType == UnrealExporter.batch.SKELETON:
+
+        return getExportProfile("skeletal")
+
+    return getExportProfile("anim")
+
+# Gets the nodes whose animation goes into an asset's fbx, everything upstream of them is fingerprinted too
+def getFingerprintNodes(asset):
+
+    nodes = []
+
+    # Everything in the asset's namespace
+    if asset.namespace:
+
+        nodes.extend(UnrealExporter.sceneIndex.listNodes(asset.namespace, "transform"))
+
+    # Skeletal meshes also pick up blendshape weights and whatever drives their external constraints
+    if isinstance(asset, UnrealExporter.ueAsset.SkeletalMesh):
+
+        nodes.extend(asset.blendShapes)
+
+        for constraint in asset.constraints:
+
+            nodes.extend(constraint.listConnections(type = "transform"))
+
+    # Cameras pick up their own animation and anything they are parented under
+    if isinstance(asset, UnrealExporter.ueAsset.Camera):
+
+        node = asset.camTransform
+
+        while node is not None:
+
+            nodes.append(node)
+
+            node = node.getParent()
+
+        nodes.append(asset.objShape)
+
+    unique = []
+    seen = set()
+
+    for node in nodes:
+
+        if node not in seen:
+
+            seen.add(node)
+            unique.append(node)
+
+    return unique
+
+# Gets the shape a mesh's deformers start from, the mesh itself when nothing deforms it
+def getOriginalShape(mesh):
+
+    shapes = [shape for shape in mesh.listHistory(type = "mesh") if shape != mesh and shape.getAttr("intermediateObject")]
+
+    # The furthest upstream is the one nothing deforms
+    return shapes[-1] if shapes else mesh
+
+# Gets the meshes that go into an asset's fbx
+def getFingerprintMeshes(asset):
+
+    if isinstance(asset, UnrealExporter.ueAsset.SkeletalMesh):
+
+        return asset.geometry + [UnrealExporter.utils.getShape(mesh) for mesh in asset.bsMeshes]
+
+    if isinstance(asset, UnrealExporter.ueAsset.StaticMesh):
+
+        return asset.geometry
+
+    return []
@@ -0,0 +1,149 @@
+'''
+The keyRange module of the UnrealExporter package
+'''
+
+# Import statements
+import math
+
+import maya.cmds
+
+# Import backend and drivers modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.drivers
+
+# Anim curves keyed on time
+KEYED_CURVE_TYPES = ("animCurveTA", "animCurveTL", "animCurveTT", "animCurveTU")
+
+# Clamps a key range grown by handles to the playback range, as whole frames
+def clampRange(keyRange, handles, startTime, endTime):
+
+    start = max(startTime, math.floor(keyRange[0] - handles))
+    end = min(endTime, math.ceil(keyRange[1] + handles))
+
+    # Keys that are all outside of the playback range still get one frame
+    if end < start:
+
+        end = start = min(max(start, startTime), endTime)
+
+    return start, end
+
+# Gets the range the keys of the time keyed curves upstream of the nodes move over, as (start, end)
+# Every curve is found with the upstream walk in UnrealExporter.drivers, IK handles and their pole vectors included,
+# and read with one bulk query per key property
+# None when something upstream changes over time without keys, an expression or a simulation, when a curve keeps moving
+# past its keys, or when the walk met a node type it doesn't model, so the range can't be known
+# A single frame on the first key when nothing moves, and on startTime when there are no keys at all
+def getKeyRange(nodes, startTime):
+
+    channels = UnrealExporter.backend.getBackend().listChannels([str(node) for node in nodes])
+
+    graph = UnrealExporter.drivers.UpstreamGraph(channels)
+
+    # Anything else that changes over time has no keys to go by
+    unkeyed = [nodeType for nodeType in graph.nodeTypes.values()
+                if nodeType in UnrealExporter.drivers.TIME_NODE_TYPES and nodeType not in KEYED_CURVE_TYPES]
+
+    if unkeyed or graph.getUnmodeledTypes():
+
+        return None
+
+    curves = graph.listNodes(KEYED_CURVE_TYPES)
+
+    if not curves:
+
+        return startTime, startTime
+
+    # Cycling, oscillating or linear infinity moves on outside of the keys
+    infinities = ((maya.cmds.setInfinity(curves, q = True, preInfinite = True) or []) +
+                    (maya.cmds.setInfinity(curves, q = True, postInfinite = True) or []))
+
+    if any(infinity != "constant" for infinity in infinities):
+
+        return None
+
+    indices = maya.cmds.keyframe(curves, q = True, indexValue = True) or []
+    times = maya.cmds.keyframe(curves, q = True, timeChange = True) or []
+    values = maya.cmds.keyframe(curves, q = True, valueChange = True) or []
+    inAngles = maya.cmds.keyTangent(curves, q = True, inAngle = True) or []
+    outAngles = maya.cmds.keyTangent(curves, q = True, outAngle = True) or []
+
+    if not times:
+
+        return startTime, startTime
+
+    try:
+
+        import numpy
+
+    except ImportError:
+
+        numpy = None
+
+    # With NumPy every key is scanned in one vectorized pass
+    if numpy is not None:
+
+        movingRange = getMovingRange(indices, times, values, inAngles, outAngles)
+
+    else:
+
+        movingRange = getMovingRangeLoop(indices, times, values, inAngles, outAngles)
+
+    if movingRange is None:
+
+        return times[0], times[0]
+
+    return movingRange
+
+# Gets the range the keys of a set of curves move over, needs NumPy
+# The keys of every curve come one after another, as flat lists, each curve's first key has index 0
+# A segment between two keys holds still when both keys have the same value and flat tangents on the sides facing each other,
+# the range runs from the first key of the first moving segment to the last key of the last one, None when nothing moves
+def getMovingRange(indices, times, values, inAngles, outAngles):
+
+    import numpy
+
+    indices = numpy.asarray(indices)
+    times = numpy.asarray(times, dtype = float)
+    values = numpy.asarray(values, dtype = float)
+
+    # Segments between neighbouring keys of the same curve
+    sameCurve = indices[1:] != 0
+
+    moving = sameCurve & ((values[1:] != values[:-1]) |
+                            (numpy.asarray(outAngles, dtype = float)[:-1] != 0.0) |
+                            (numpy.asarray(inAngles, dtype = float)[1:] != 0.0))
+
+    segments = numpy.flatnonzero(moving)
+
+    if not len(segments):
+
+        return None
+
+    return float(times[segments].min()), float(times[segments + 1].max())
+
+# Gets the range the keys of a set of curves move over, one key at a time
+# Same as getMovingRange, without NumPy
+def getMovingRangeLoop(indices, times, values, inAngles, outAngles):
+
+    start = None
+    end = None
+
+    for i in range(1, len(times)):
+
+        # The first key of a curve starts a new one
+        if indices[i] == 0:
+
+            continue
+
+        if values[i] == values[i - 1] and outAngles[i - 1] == 0.0 and inAngles[i] == 0.0:
+
+            continue
+
+        start = times[i - 1] if start is None else min(start, times[i - 1])
+        end = times[i] if end is None else max(end, times[i])
+
+    if start is None:
+
+        return None
+
+    return float(start), float(end)
@@ -0,0 +1,268 @@
+'''
+The reduction module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+
+import maya.cmds
+import pymel.core
+
+# Import curves module from UnrealExporter package
+import UnrealExporter.curves
+
+# Largest error allowed per channel group, in cm, degrees or plain units
+DEFAULT_TOLERANCES = {"translate" : 0.001,
+                        "rotate" : 0.01,
+                        "scale" : 0.0001,
+                        "weight" : 0.0001,
+                        "other" : 0.0001}
+
+# Channel group per anim curve type, unitless curves are split up by attribute name
+CURVE_TYPE_GROUPS = {"animCurveTL" : "translate",
+                        "animCurveTA" : "rotate"}
+
+# Creates an empty reduction report
+def createReport():
+
+    return {"curves" : 0,
+            "constantCurves" : 0,
+            "keysBefore" : 0,
+            "keysAfter" : 0,
+            "fbxBytes" : None,
+            "groups" : {}}
+
+# Formats a reduction report for printing
+def formatReport(report):
+
+    lines = []
+
+    for group in sorted(report["groups"]):
+
+        stats = report["groups"][group]
+
+        lines.append("%-10s curves=%-6d constant=%-6d keys=%d->%d maxError=%.6g" % (group,
+                                                                                    stats["curves"],
+                                                                                    stats["constantCurves"],
+                                                                                    stats["keysBefore"],
+                                                                                    stats["keysAfter"],
+                                                                                    stats["maxError"]))
+
+    lines.append("%d curves, %d constant, %d keys down to %d" % (report["curves"],
+                                                                    report["constantCurves"],
+                                                                    report["keysBefore"],
+                                                                    report["keysAfter"]))
+
+    if report["fbxBytes"] is not None:
+
+        lines.append("fbx size %d bytes" % report["fbxBytes"])
+
+    return "\n".join(lines)
+
+# Gets the channel group of a curve, which picks its tolerance
+# Blend shape weights can go by their target's name, so the type of the node is needed to tell them apart
+def getChannelGroup(plugName, curveType, nodeType = None):
+
+    if curveType in CURVE_TYPE_GROUPS:
+
+        return CURVE_TYPE_GROUPS[curveType]
+
+    nodeName, sep, attr = plugName.rpartition(".")
+
+    if attr.startswith("scale") or attr in ("sx", "sy", "sz"):
+
+        return "scale"
+
+    if attr.startswith("weight") or nodeType == "blendShape":
+
+        return "weight"
+
+    return "other"
+
+# Gets how far keys are from the straight line between two other keys
+def getLineErrors(times, values, startKeys, endKeys, keys):
+
+    import numpy
+
+    startTimes = times[startKeys]
+    spans = times[endKeys] - startTimes
+
+    # Keys on top of their start key measure against it
+    weights = numpy.where(spans > 0, (times[keys] - startTimes) / numpy.where(spans > 0, spans, 1.0), 0.0)
+
+    line = values[startKeys] + (values[endKeys] - values[startKeys]) * weights
+
+    return numpy.abs(values[keys] - line)
+
+# Simplifies curve key arrays, returns a keep mask and the largest error per curve
+# times and values are lists of 1d arrays, one per curve, tolerances is one value per curve
+# Every curve is split up Douglas-Peucker style, all at once: each pass measures how far every open span's
+# keys are from a straight line between its end keys, and splits the spans that are out of tolerance at their worst key
+def reduceArrays(times, values, tolerances):
+
+    import numpy
+
+    counts = numpy.array([len(curveTimes) for curveTimes in times], dtype = int)
+
+    if not len(counts) or not counts.sum():
+
+        return [numpy.ones(count, dtype = bool) for count in counts], numpy.zeros(len(counts))
+
+    allTimes = numpy.concatenate([numpy.asarray(curveTimes, dtype = float) for curveTimes in times])
+    allValues = numpy.concatenate([numpy.asarray(curveValues, dtype = float) for curveValues in values])
+
+    ends = numpy.cumsum(counts)
+    starts = ends - counts
+
+    # The first and last key of every curve stay
+    keep = numpy.zeros(len(allTimes), dtype = bool)
+    keep[starts[counts > 0]] = True
+    keep[ends[counts > 0] - 1] = True
+
+    # Open spans, as first and last key index and tolerance
+    spanStarts = starts[counts > 2]
+    spanEnds = ends[counts > 2] - 1
+    spanTolerances = numpy.asarray(tolerances, dtype = float)[counts > 2]
+
+    while len(spanStarts):
+
+        # The keys inside each span
+        lengths = spanEnds - spanStarts - 1
+        span = numpy.repeat(numpy.arange(len(spanStarts)), lengths)
+        offsets = numpy.arange(len(span)) - numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+        inner = spanStarts[span] + 1 + offsets
+
+        errors = getLineErrors(allTimes, allValues, spanStarts[span], spanEnds[span], inner)
+
+        # Worst key per span, the first one when there is a tie
+        order = numpy.lexsort((-errors, span))
+        first = numpy.cumsum(lengths) - lengths
+        worst = inner[order[first]]
+        worstErrors = errors[order[first]]
+
+        split = worstErrors > spanTolerances
+
+        keep[worst[split]] = True
+
+        # Spans that are out of tolerance become two spans
+        spanStarts, spanEnds, spanTolerances = (numpy.concatenate([spanStarts[split], worst[split]]),
+                                                numpy.concatenate([worst[split], spanEnds[split]]),
+                                                numpy.concatenate([spanTolerances[split], spanTolerances[split]]))
+
+        # Spans without keys inside are done
+        splittable = spanEnds - spanStarts > 1
+
+        spanStarts, spanEnds, spanTolerances = spanStarts[splittable], spanEnds[splittable], spanTolerances[splittable]
+
+    # Measure what is left, every key against the line between the kept keys around it
+    indices = numpy.arange(len(allTimes))
+
+    previous = numpy.maximum.accumulate(numpy.where(keep, indices, 0))
+    following = numpy.minimum.accumulate(numpy.where(keep, indices, len(allTimes))[::-1])[::-1]
+
+    errors = numpy.where(keep, 0.0, getLineErrors(allTimes, allValues, previous, numpy.minimum(following, len(allTimes) - 1), indices))
+
+    maxErrors = numpy.zeros(len(counts))
+    maxErrors[counts > 0] = numpy.maximum.reduceat(errors, starts[counts > 0])
+
+    return numpy.split(keep, ends[:-1]), maxErrors
+
+# Simplifies the curves driving the given nodes and returns the reduction report
+# Curves that stay within tolerance of a constant are replaced by a static value,
+# the rest keep only the keys needed to stay within tolerance with linear in-betweens
+# tolerances is by channel group, groups that are left out use DEFAULT_TOLERANCES
+def reduceCurves(nodes, tolerances = None):
+
+    import numpy
+
+    groupTolerances = dict(DEFAULT_TOLERANCES)
+    groupTolerances.update(tolerances or {})
+
+    report = createReport()
+
+    plugCurves = {}
+
+    curveKeys = UnrealExporter.curves.getCurveKeys(nodes, plugCurves = plugCurves)
+
+    if not curveKeys:
+
+        return report
+
+    plugNames = list(curveKeys)
+
+    # Node types for the unitless curves, in one query
+    nodeNames = []
+
+    for plugName in plugNames:
+
+        nodeName = plugName.rpartition(".")[0]
+
+        if curveKeys[plugName][0] not in CURVE_TYPE_GROUPS and nodeName not in nodeNames:
+
+            nodeNames.append(nodeName)
+
+    typeEntries = maya.cmds.ls(nodeNames, showType = True) if nodeNames else []
+    nodeTypes = dict(zip(typeEntries[0::2], typeEntries[1::2]))
+
+    groups = [getChannelGroup(plugName, curveKeys[plugName][0], nodeTypes.get(plugName.rpartition(".")[0]))
+                for plugName in plugNames]
+    curveTolerances = [groupTolerances[group] for group in groups]
+
+    times = [numpy.asarray(curveKeys[plugName][1], dtype = float) for plugName in plugNames]
+    values = [numpy.asarray(curveKeys[plugName][2], dtype = float) for plugName in plugNames]
+
+    keeps, maxErrors = reduceArrays(times, values, curveTolerances)
+
+    constants = collections.OrderedDict()
+    reduced = collections.OrderedDict()
+
+    for i, plugName in enumerate(plugNames):
+
+        curveType = curveKeys[plugName][0]
+        group = groups[i]
+
+        stats = report["groups"].setdefault(group, {"curves" : 0,
+                                                    "constantCurves" : 0,
+                                                    "keysBefore" : 0,
+                                                    "keysAfter" : 0,
+                                                    "maxError" : 0.0})
+
+        stats["curves"] += 1
+        stats["keysBefore"] += len(values[i])
+
+        # A channel that never leaves tolerance of its middle value becomes static
+        if len(values[i]) and values[i].max() - values[i].min() <= 2.0 * curveTolerances[i]:
+
+            constants[plugName] = (values[i].max() + values[i].min()) / 2.0
+
+            stats["constantCurves"] += 1
+            stats["maxError"] = max(stats["maxError"], (values[i].max() - values[i].min()) / 2.0)
+
+            continue
+
+        stats["keysAfter"] += int(keeps[i].sum())
+        stats["maxError"] = max(stats["maxError"], float(maxErrors[i]))
+
+        if not keeps[i].all():
+
+            reduced[plugName] = (curveType, times[i][keeps[i]].tolist(), values[i][keeps[i]].tolist())
+
+    # Constant channels lose their curve and keep the value
+    if constants:
+
+        pymel.core.delete(maya.cmds.listConnections(list(constants), source = True, destination = False, type = "animCurve"))
+
+        for plugName, value in constants.items():
+
+            pymel.core.setAttr(plugName, float(value))
+
+    UnrealExporter.curves.setCurveKeys(reduced, plugCurves)
+
+    for stats in report["groups"].values():
+
+        report["curves"] += stats["curves"]
+        report["constantCurves"] += stats["constantCurves"]
+        report["keysBefore"] += stats["keysBefore"]
+        report["keysAfter"] += stats["keysAfter"]
+
+    return report
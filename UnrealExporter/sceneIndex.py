@@ -0,0 +1,186 @@
+'''
+The sceneIndex module of the UnrealExporter package
+'''
+
+# Import statements
+import pymel.core
+
+# Import backend, utils, hierarchy and tracer modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.utils
+import UnrealExporter.hierarchy
+import UnrealExporter.tracer
+
+# Indexes every node in the scene by namespace and node type
+# One ls traversal replaces the per-asset wildcard scans,
+# the index rebuilds itself on the next query after it is invalidated
+# Nodes are indexed by name, only the ones a query returns are made into PyNodes
+class SceneIndex:
+
+    def __init__(self):
+
+        # Node names by namespace, then by exact node type, as (order, name) pairs
+        self.buckets = {}
+
+        # PyNodes made for the names queries returned
+        self.nodes = {}
+
+        # Inherited types for every exact node type seen
+        self.inheritedTypes = {}
+
+        # Hierarchy snapshot, built on first use
+        self.hierarchy = None
+
+        # Maya callback ids used to invalidate the index
+        self.callbackIds = []
+
+        self.dirty = True
+
+    # Builds the index with a single traversal of the scene
+    @UnrealExporter.tracer.traced("sceneIndex")
+    def build(self):
+
+        self.buckets = {}
+        self.nodes = {}
+
+        names, nodeTypes = UnrealExporter.backend.getBackend().listNodeTypes()
+
+        for order, (name, nodeType) in enumerate(zip(names, nodeTypes)):
+
+            # Grab the namespace from the leaf name
+            namespace = UnrealExporter.utils.getNamespace(name.split("|")[-1])
+
+            self.buckets.setdefault(namespace, {}).setdefault(nodeType, []).append((order, name))
+
+        self.dirty = False
+
+    # Gets the hierarchy snapshot, building it if the scene changed
+    def getHierarchy(self):
+
+        if self.hierarchy is None:
+
+            self.hierarchy = UnrealExporter.hierarchy.Hierarchy()
+
+        return self.hierarchy
+
+    # Gets the exact type and all types it inherits from
+    def getInheritedTypes(self, nodeType):
+
+        if nodeType not in self.inheritedTypes:
+
+            self.inheritedTypes[nodeType] = set(UnrealExporter.backend.getBackend().getInheritedTypes(nodeType))
+
+        return self.inheritedTypes[nodeType]
+
+    # Marks the index as out of date
+    def invalidate(self, *args):
+
+        self.dirty = True
+        self.hierarchy = None
+
+    # Lists nodes in a namespace of a type, same as ls(namespace + "*", type = nodeType)
+    def listNodes(self, namespace, nodeType):
+
+        nodes = []
+
+        for name in self.listNodeNames(namespace, nodeType):
+
+            if name not in self.nodes:
+
+                self.nodes[name] = pymel.core.PyNode(name)
+
+            nodes.append(self.nodes[name])
+
+        return nodes
+
+    # Lists the names of the nodes in a namespace of a type, without making PyNodes
+    def listNodeNames(self, namespace, nodeType):
+
+        if self.dirty:
+
+            self.build()
+
+        found = []
+
+        # Loop through each node type in the namespace
+        for bucketType, nodes in self.buckets.get(namespace, {}).items():
+
+            # Keep the nodes of the type or any type derived from it
+            if nodeType in self.getInheritedTypes(bucketType):
+
+                found.extend(nodes)
+
+        # Return them in scene order
+        found.sort(key = lambda item: item[0])
+
+        return [name for order, name in found]
+
+    # Stops invalidating the index on scene changes
+    def unwatch(self):
+
+        if self.callbackIds:
+
+            import maya.api.OpenMaya
+
+            maya.api.OpenMaya.MMessage.removeCallbacks(self.callbackIds)
+
+        self.callbackIds = []
+
+    # Invalidates the index whenever nodes are added, removed, renamed or reparented,
+    # or a scene is opened
+    # Outside of Maya the index has to be invalidated by hand
+    def watch(self):
+
+        if self.callbackIds:
+
+            return
+
+        try:
+
+            import maya.api.OpenMaya as om
+
+        except ImportError:
+
+            return
+
+        self.callbackIds = [om.MDGMessage.addNodeAddedCallback(self.invalidate, "dependNode"),
+                            om.MDGMessage.addNodeRemovedCallback(self.invalidate, "dependNode"),
+                            om.MNodeMessage.addNameChangedCallback(om.MObject(), self.invalidate),
+                            om.MDagMessage.addParentAddedCallback(self.invalidate),
+                            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self.invalidate),
+                            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self.invalidate)]
+
+# The shared scene index
+_sceneIndex = None
+
+# Gets the hierarchy snapshot from the shared scene index
+def getHierarchy():
+
+    return getSceneIndex().getHierarchy()
+
+# Gets the shared scene index
+def getSceneIndex():
+
+    global _sceneIndex
+
+    if _sceneIndex is None:
+
+        _sceneIndex = SceneIndex()
+        _sceneIndex.watch()
+
+    return _sceneIndex
+
+# Invalidates the shared scene index
+def invalidate():
+
+    getSceneIndex().invalidate()
+
+# Lists nodes in a namespace of a type from the shared scene index
+def listNodes(namespace, nodeType):
+
+    return getSceneIndex().listNodes(namespace, nodeType)
+
+# Lists the names of the nodes in a namespace of a type from the shared scene index
+def listNodeNames(namespace, nodeType):
+
+    return getSceneIndex().listNodeNames(namespace, nodeType)
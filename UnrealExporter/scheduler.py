@@ -0,0 +1,323 @@
+'''
+The scheduler module of the UnrealExporter package
+'''
+
+# Import statements
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Default worker script, the headless job runner
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ueBatch.py")
+
+# Seconds between checks on running workers
+POLL_INTERVAL = 0.05
+
+# A job waiting for, or running in, a worker process
+class WorkerJob:
+
+    def __init__(self, index, job):
+
+        self.index = index
+        self.job = job
+        self.attempts = 0
+        self.process = None
+        self.startTime = None
+        self.jobFilePath = None
+        self.resultFilePath = None
+        self.logFilePath = None
+
+# Spreads independent export jobs across a pool of worker processes
+# Every job runs in its own headless interpreter through the ueBatch job runner,
+# the worker gets a one-job job file and writes back a json result file
+# Other kinds of workers override getWorkerCommand, writeJobFile, readResult and createFailedResult
+class Scheduler:
+
+    def __init__(self, workers = 4, timeout = None, retries = 0, interpreter = None, standin = False):
+
+        # Number of worker processes running at once
+        self.workers = max(1, workers)
+
+        # Seconds a job may run before its worker is killed, None for no limit
+        self.timeout = timeout
+
+        # Times a job is run again after its worker crashes or times out
+        self.retries = retries
+
+        # Interpreter the workers run in, e.g. mayapy
+        self.interpreter = interpreter or sys.executable
+
+        # Run the workers against the stand-in scene
+        self.standin = standin
+
+        # Events in the order they happened, as dicts
+        self.log = []
+
+    # Creates the result for a job whose worker did not finish it
+    def createFailedResult(self, workerJob, error):
+
+        return createFailedResult(workerJob, error)
+
+    # Builds the command line for a worker
+    def getWorkerCommand(self, workerJob, incremental):
+
+        command = [self.interpreter, WORKER_SCRIPT, workerJob.jobFilePath, "--result", workerJob.resultFilePath]
+
+        if incremental:
+
+            command.append("--incremental")
+
+        if self.standin:
+
+            command.append("--standin")
+
+        return command
+
+    # Records a scheduler event
+    def logEvent(self, event, workerJob, **details):
+
+        entry = {"time" : time.time(), "event" : event, "job" : workerJob.index, "scene" : workerJob.job.get("scene")}
+        entry.update(details)
+
+        self.log.append(entry)
+
+    # Runs every job and returns their results in job order
+    def run(self, jobs, incremental = False):
+
+        self.log = []
+
+        workDir = tempfile.mkdtemp(prefix = "ueSchedule")
+
+        pending = [WorkerJob(index, job) for index, job in enumerate(jobs)]
+        running = []
+        results = [None] * len(pending)
+
+        try:
+
+            while pending or running:
+
+                # Fill every free worker
+                while pending and len(running) < self.workers:
+
+                    workerJob = pending.pop(0)
+
+                    self.startJob(workerJob, workDir, incremental)
+
+                    running.append(workerJob)
+
+                time.sleep(POLL_INTERVAL)
+
+                # Check on the running workers
+                for workerJob in list(running):
+
+                    result = self.pollJob(workerJob)
+
+                    if result is None:
+
+                        continue
+
+                    running.remove(workerJob)
+
+                    # Crashed and timed out jobs go back in the queue while they have retries left
+                    if result.get("retry") and workerJob.attempts <= self.retries:
+
+                        self.logEvent("retry", workerJob, attempt = workerJob.attempts, reason = result["error"])
+
+                        pending.append(workerJob)
+
+                        continue
+
+                    result.pop("retry", None)
+                    result["attempts"] = workerJob.attempts
+
+                    results[workerJob.index] = result
+
+        finally:
+
+            # Don't leave workers behind if the scheduler is interrupted
+            for workerJob in running:
+
+                if workerJob.process.poll() is None:
+
+                    workerJob.process.kill()
+                    workerJob.process.wait()
+
+            shutil.rmtree(workDir, ignore_errors = True)
+
+        return results
+
+    # Checks a running job, returns its result once the worker is done
+    def pollJob(self, workerJob):
+
+        elapsed = time.time() - workerJob.startTime
+
+        # Kill workers that ran out of time
+        if workerJob.process.poll() is None:
+
+            if self.timeout is None or elapsed < self.timeout:
+
+                return None
+
+            workerJob.process.kill()
+            workerJob.process.wait()
+
+            self.logEvent("timeout", workerJob, elapsed = elapsed)
+
+            return self.createFailedResult(workerJob, "timed out after %.1fs" % elapsed)
+
+        self.logEvent("finish", workerJob, elapsed = elapsed, returnCode = workerJob.process.returncode)
+
+        # No result file means the worker crashed
+        if not os.path.exists(workerJob.resultFilePath):
+
+            error = "worker exited with code %d" % workerJob.process.returncode
+
+            # Add the end of the worker's output
+            with open(workerJob.logFilePath) as logFile:
+
+                output = logFile.read().strip().splitlines()[-5:]
+
+            if output:
+
+                error += ": " + " / ".join(output)
+
+            return self.createFailedResult(workerJob, error)
+
+        return self.readResult(workerJob)
+
+    # Reads the result a worker wrote
+    def readResult(self, workerJob):
+
+        with open(workerJob.resultFilePath) as resultFile:
+
+            summary = json.load(resultFile)
+
+        return summary["jobs"][0]
+
+    # Writes the job file for a job and starts its worker
+    def startJob(self, workerJob, workDir, incremental):
+
+        workerJob.attempts += 1
+
+        baseName = os.path.join(workDir, "job%d_%d" % (workerJob.index, workerJob.attempts))
+
+        workerJob.jobFilePath = baseName + ".json"
+        workerJob.resultFilePath = baseName + "_result.json"
+        workerJob.logFilePath = baseName + ".log"
+
+        self.writeJobFile(workerJob)
+
+        # The worker's output goes to a log file, read back if it crashes
+        with open(workerJob.logFilePath, "w") as logFile:
+
+            workerJob.process = subprocess.Popen(self.getWorkerCommand(workerJob, incremental),
+                                                    stdout = logFile,
+                                                    stderr = subprocess.STDOUT)
+
+        workerJob.startTime = time.time()
+
+        self.logEvent("start", workerJob, attempt = workerJob.attempts)
+
+    # Writes the job file a worker runs
+    def writeJobFile(self, workerJob):
+
+        # Paths are already absolute, so the worker resolves them the same way
+        with open(workerJob.jobFilePath, "w") as jobFile:
+
+            json.dump({"jobs" : [workerJob.job]}, jobFile)
+
+# Creates the result for a job whose worker did not finish it
+def createFailedResult(workerJob, error):
+
+    return {"scene" : workerJob.job["scene"],
+            "status" : "failed",
+            "error" : error,
+            "retry" : True,
+            "assets" : [{"node" : assetJob["node"],
+                            "output" : assetJob["output"],
+                            "type" : assetJob.get("type"),
+                            "status" : "failed",
+                            "reason" : error} for assetJob in workerJob.job.get("assets", [])]}
+
+# Splits scene jobs into worker jobs, so a job file with fewer scenes than workers still fills every worker
+# Each scene's assets are dealt out in runs of neighbouring assets, every run opens the scene in its own worker
+# Scenes aren't split when there are as many as workers, a split scene is opened and its shared bake run once per part
+# Returns the worker jobs and, for each one, the index of the scene job it came from
+def splitJobs(jobs, workers):
+
+    parts = []
+    owners = []
+
+    for index, job in enumerate(jobs):
+
+        assets = job.get("assets", [])
+
+        # Workers left over after one each per scene are shared out between the scenes
+        count = max(1, min(len(assets), workers // max(1, len(jobs))))
+
+        if count == 1:
+
+            parts.append(job)
+            owners.append(index)
+
+            continue
+
+        for part in range(count):
+
+            partJob = dict(job)
+            partJob["assets"] = assets[part * len(assets) // count:(part + 1) * len(assets) // count]
+
+            parts.append(partJob)
+            owners.append(index)
+
+    return parts, owners
+
+# Merges the results of split worker jobs back into one result per scene job, in job order
+# The assets of a scene keep their job order, the scene fails if any of its parts did
+def mergeResults(jobs, owners, results):
+
+    grouped = [[] for job in jobs]
+
+    for owner, result in zip(owners, results):
+
+        grouped[owner].append(result)
+
+    merged = []
+
+    for job, parts in zip(jobs, grouped):
+
+        if len(parts) == 1:
+
+            merged.append(parts[0])
+
+            continue
+
+        result = {"scene" : job["scene"],
+                    "status" : "ok",
+                    "assets" : [],
+                    "parts" : len(parts),
+                    "attempts" : max(part.get("attempts", 1) for part in parts),
+                    "elapsed" : max(part.get("elapsed", 0.0) for part in parts)}
+
+        for part in parts:
+
+            result["assets"].extend(part["assets"])
+
+            if part["status"] != "ok":
+
+                result["status"] = part["status"]
+
+                # The first part that failed gives the scene's error
+                for key in ("error", "traceback"):
+
+                    if key in part:
+
+                        result.setdefault(key, part[key])
+
+        merged.append(result)
+
+    return merged
@@ -0,0 +1,216 @@
+'''
+The sharding module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import pymel.core
+
+# Import curves, scheduler and utils modules from UnrealExporter package
+import UnrealExporter.curves
+import UnrealExporter.scheduler
+import UnrealExporter.utils
+
+# Worker script that bakes one shard
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ueBakeShard.py")
+
+# Runs shard bakes in worker processes
+# Each worker opens a copy of the scene, bakes its part of the frame range and writes back the raw keys
+class ShardScheduler(UnrealExporter.scheduler.Scheduler):
+
+    # Creates the result for a shard whose worker did not finish it
+    def createFailedResult(self, workerJob, error):
+
+        return {"status" : "failed", "error" : error, "retry" : True}
+
+    # Builds the command line for a shard worker
+    def getWorkerCommand(self, workerJob, incremental):
+
+        command = [self.interpreter, WORKER_SCRIPT, workerJob.jobFilePath, "--result", workerJob.resultFilePath]
+
+        if self.standin:
+
+            command.append("--standin")
+
+        return command
+
+    # Reads the keys a shard worker wrote
+    def readResult(self, workerJob):
+
+        with open(workerJob.resultFilePath) as resultFile:
+
+            return json.load(resultFile)
+
+    # Writes the shard a worker bakes
+    def writeJobFile(self, workerJob):
+
+        with open(workerJob.jobFilePath, "w") as jobFile:
+
+            json.dump(workerJob.job, jobFile)
+
+# Bakes one shard in a worker and returns its raw keys
+def bakeShard(job):
+
+    # Open the copy of the scene
+    pymel.core.openFile(job["scene"], force = True)
+
+    # Run the scene up to the shard, so simulations and stateful expressions reach it the way a serial bake does
+    for frame in range(job.get("preRollStart", job["startTime"]), job["startTime"]):
+
+        pymel.core.currentTime(frame, update = True)
+
+    nodes = [pymel.core.PyNode(name) for name in job["nodes"]]
+
+    # Rotations are minimized after stitching, so shard borders unwrap the same as a serial bake
+    options = dict(UnrealExporter.utils.BAKE_OPTIONS)
+    options["minimizeRotation"] = False
+
+    UnrealExporter.utils.bakeThis(nodes, time = (job["startTime"], job["endTime"]), **options)
+
+    # Shapes get baked along with their transforms, plugs from selective bakes only key themselves
+    keyNodes = []
+
+    for node in nodes + [UnrealExporter.utils.getShape(node) for node in nodes if not isinstance(node, pymel.core.Attribute)]:
+
+        if node is not None and node not in keyNodes:
+
+            keyNodes.append(node)
+
+    curveKeys = UnrealExporter.curves.getCurveKeys(keyNodes)
+
+    return {"status" : "ok",
+            "startTime" : job["startTime"],
+            "endTime" : job["endTime"],
+            "curves" : [[plugName, curveType, times, values]
+                            for plugName, (curveType, times, values) in curveKeys.items()]}
+
+# Bakes nodes over a frame range in shards across worker processes
+# The workers bake without minimizing rotations, the stitched curves are minimized over the whole range,
+# so the keys come out the same as one serial bake with the same options
+# Each shard first steps through preRoll frames before its own, None steps from startTime,
+# which simulations and expressions that keep state between frames need to come out the same as a serial bake
+def bakeSharded(nodes, startTime, endTime, shardFrames, workers = 4, interpreter = None, timeout = None, retries = 1,
+                preRoll = 0):
+
+    # The benchmarks' stand-in scene installs itself as pymel.core, its workers need it too
+    standin = getattr(pymel.core, "STANDIN", False)
+
+    scheduler = ShardScheduler(workers = workers,
+                                timeout = timeout,
+                                retries = retries,
+                                interpreter = interpreter or getWorkerInterpreter(standin),
+                                standin = standin)
+
+    workDir = tempfile.mkdtemp(prefix = "ueShard")
+
+    try:
+
+        # The workers bake off of the scene as it is now, bake helper nodes included
+        scenePath = os.path.join(workDir, "shardScene.mb")
+
+        pymel.core.exportAll(scenePath, force = True, preserveReferences = True, type = "mayaBinary")
+
+        # Selective bakes pass plugs, str gives a plug or a node name
+        nodeNames = [str(node) for node in nodes]
+
+        jobs = [{"scene" : scenePath,
+                    "nodes" : nodeNames,
+                    "startTime" : start,
+                    "endTime" : end,
+                    "preRollStart" : startTime if preRoll is None else max(startTime, start - preRoll)}
+                    for start, end in splitRange(startTime, endTime, shardFrames)]
+
+        results = scheduler.run(jobs)
+
+    finally:
+
+        shutil.rmtree(workDir, ignore_errors = True)
+
+    # Every shard is needed for a seamless curve
+    errors = ["frames %s-%s: %s" % (job["startTime"], job["endTime"], result["error"])
+                for job, result in zip(jobs, results) if result["status"] != "ok"]
+
+    if errors:
+
+        pymel.core.error("Sharded bake failed, " + "; ".join(errors))
+
+    curveKeys = stitchShards(results, UnrealExporter.utils.BAKE_OPTIONS.get("minimizeRotation"))
+
+    UnrealExporter.curves.setCurveKeys(curveKeys)
+
+    return curveKeys
+
+# Gets the interpreter shard workers run in, mayapy when running in Maya
+def getWorkerInterpreter(standin = False):
+
+    mayaLocation = os.environ.get("MAYA_LOCATION")
+
+    if mayaLocation and not standin:
+
+        return os.path.join(mayaLocation, "bin", "mayapy.exe" if sys.platform == "win32" else "mayapy")
+
+    return sys.executable
+
+# Splits a frame range into shards of whole frames, as inclusive (start, end) pairs
+def splitRange(startTime, endTime, shardFrames):
+
+    shards = []
+
+    start = int(startTime)
+    end = int(endTime)
+
+    while start <= end:
+
+        shards.append((start, min(end, start + shardFrames - 1)))
+
+        start += shardFrames
+
+    return shards
+
+# Joins shard results, in frame order, into one set of curve keys per plug
+# Rotations are minimized across the joined range when minimize is on
+def stitchShards(results, minimize = True):
+
+    curveKeys = collections.OrderedDict()
+
+    for index, result in enumerate(results):
+
+        plugNames = set()
+
+        for plugName, curveType, times, values in result["curves"]:
+
+            if plugName not in curveKeys:
+
+                # A curve that is missing from the first shards would leave a gap
+                if index > 0:
+
+                    pymel.core.error("Shard curves don't match, %s is missing before frame %s" % (plugName, result["startTime"]))
+
+                curveKeys[plugName] = (curveType, [], [])
+
+            curveKeys[plugName][1].extend(times)
+            curveKeys[plugName][2].extend(values)
+
+            plugNames.add(plugName)
+
+        missing = [plugName for plugName in curveKeys if plugName not in plugNames]
+
+        if missing:
+
+            pymel.core.error("Shard curves don't match, %s is missing from frame %s" % (missing[0], result["startTime"]))
+
+    if minimize:
+
+        for plugName, (curveType, times, values) in curveKeys.items():
+
+            if curveType in UnrealExporter.curves.ANGULAR_CURVE_TYPES:
+
+                curveKeys[plugName] = (curveType, times, UnrealExporter.curves.minimizeRotation(values))
+
+    return curveKeys
@@ -0,0 +1,164 @@
+'''
+The skeleton module of the UnrealExporter package
+'''
+
+# Import statements
+import json
+import os
+
+import pymel.core
+
+# Import backend and tracer modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.tracer
+
+# Largest skin weight a joint can have on every exported vertex and still be stripped
+DEFAULT_WEIGHT_TOLERANCE = 0.0001
+
+# Gets the largest weight each influence has on any vertex of the given meshes, by influence full path
+# Each mesh's weights are read with one call, and reduced with one NumPy max when NumPy is available
+def getMaxWeights(skins, meshes):
+
+    try:
+
+        import numpy
+
+    except ImportError:
+
+        numpy = None
+
+    meshNames = set(str(mesh) for mesh in meshes)
+
+    maxWeights = {}
+
+    for skin in skins:
+
+        # Full paths, so joints with the same name in different places don't share a weight
+        influences = [influence.longName() for influence in skin.getInfluence()]
+
+        for mesh in skin.getGeometry():
+
+            # Skinned geometry that isn't exported doesn't count
+            if str(mesh) not in meshNames:
+
+                continue
+
+            weights = list(skin.getWeights(mesh))
+
+            if not weights:
+
+                continue
+
+            if numpy is not None:
+
+                meshWeights = numpy.asarray(weights, dtype = float).max(axis = 0).tolist()
+
+            else:
+
+                meshWeights = [max(column) for column in zip(*weights)]
+
+            for influence, weight in zip(influences, meshWeights):
+
+                maxWeights[influence] = max(maxWeights.get(influence, 0.0), weight)
+
+    return maxWeights
+
+# Finds the joints to strip, the ones weighted within tolerance that have no joint under them that isn't
+# Joints and weights are both keyed by full path, returns the stripped paths in the given order
+def findStrippedJoints(paths, maxWeights, tolerance):
+
+    kept = set()
+
+    # Sorted backwards every joint comes before its parent, so a kept joint keeps the joints above it
+    for path in sorted(paths, reverse = True):
+
+        if path in kept or maxWeights.get(path, 0.0) > tolerance:
+
+            kept.add(path)
+            kept.add(path.rpartition("|")[0])
+
+    return [path for path in paths if path not in kept]
+
+# Creates the bone map of a stripped skeleton
+# Joints are given as full paths, the map lists the kept bones, parents first, with their parent bone, and the stripped joints
+# When no joint has any weight nothing is stripped
+# Bones are named by leaf name, so when two joints share one nothing is stripped either, removeJoints couldn't tell them apart
+def createBoneMap(paths, maxWeights, tolerance):
+
+    stripped = set(findStrippedJoints(paths, maxWeights, tolerance))
+
+    if len(stripped) == len(paths) or len(set(path.split("|")[-1] for path in paths)) != len(paths):
+
+        stripped = set()
+
+    kept = set(paths) - stripped
+
+    bones = []
+
+    for path in sorted(kept):
+
+        parent = path.rpartition("|")[0]
+
+        bones.append([path.split("|")[-1], parent.split("|")[-1] if parent in kept else None])
+
+    return {"bones" : bones,
+            "stripped" : sorted(path.split("|")[-1] for path in stripped)}
+
+# Gets the path of the bone map written next to an fbx
+def getBoneMapPath(fbxPath):
+
+    return os.path.splitext(fbxPath)[0] + ".boneMap.json"
+
+# Reads a bone map
+def readBoneMap(path):
+
+    with open(path) as boneMapFile:
+
+        return json.load(boneMapFile)
+
+# Removes the stripped joints under a root, found with one bulk query and deleted with one delete
+# Joints under a stripped joint go with it, referenced joints can't be deleted and are moved out from under the root instead
+# Returns the full paths of the removed joints
+@UnrealExporter.tracer.traced("jointStrip")
+def removeJoints(root, stripped):
+
+    paths, nodeTypes, referenced = UnrealExporter.backend.getBackend().listDescendants(root.longName())
+
+    deleted = []
+    unparented = []
+
+    for path, nodeType in zip(paths, nodeTypes):
+
+        if nodeType != "joint" or path.split("|")[-1] not in stripped:
+
+            continue
+
+        # Already going with its parent
+        if path.rpartition("|")[0].split("|")[-1] in stripped:
+
+            continue
+
+        if path in referenced:
+
+            unparented.append(path)
+
+        else:
+
+            deleted.append(path)
+
+    if deleted:
+
+        pymel.core.delete(deleted)
+
+    if unparented:
+
+        pymel.core.parent(unparented, world = True)
+
+    return deleted + unparented
+
+# Writes a bone map
+def writeBoneMap(path, boneMap):
+
+    with open(path, "w") as boneMapFile:
+
+        json.dump(boneMap, boneMapFile, indent = 2, sort_keys = True)
@@ -0,0 +1,285 @@
+'''
+The tracer module of the UnrealExporter package
+'''
+
+# Import statements
+import functools
+import json
+import os
+import time
+
+import maya.cmds
+
+# Wall clock for spans, python 2 has no perf_counter
+wallTime = getattr(time, "perf_counter", time.time)
+
+# CPU time for spans, python 2 has no process_time
+try:
+
+    cpuTime = time.process_time
+
+except AttributeError:
+
+    cpuTime = time.clock
+
+# A span that does nothing, handed out while the tracer is off
+class NullSpan:
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+
+        return False
+
+NULL_SPAN = NullSpan()
+
+# Times one stage of an export, nested spans are timed as part of the one around them
+class Span:
+
+    def __init__(self, tracer, name, args):
+
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+        # Wall time spent in the spans inside this one
+        self.childWall = 0.0
+
+    def __enter__(self):
+
+        tracer = self.tracer
+
+        self.depth = len(tracer.stack)
+
+        tracer.stack.append(self)
+
+        if tracer.countSceneNodes:
+
+            self.sceneNodes = len(maya.cmds.ls())
+
+        self.cpuStart = cpuTime()
+        self.wallStart = wallTime()
+
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+
+        wall = wallTime() - self.wallStart
+        cpu = cpuTime() - self.cpuStart
+
+        tracer = self.tracer
+
+        tracer.stack.pop()
+
+        if tracer.stack:
+
+            tracer.stack[-1].childWall += wall
+
+        event = {"name" : self.name,
+                    "start" : self.wallStart - tracer.origin,
+                    "wall" : wall,
+                    "self" : wall - self.childWall,
+                    "cpu" : cpu,
+                    "depth" : self.depth,
+                    "args" : self.args}
+
+        # Nodes the stage added, or removed when negative
+        if tracer.countSceneNodes:
+
+            event["sceneNodes"] = len(maya.cmds.ls()) - self.sceneNodes
+
+        if excType is not None:
+
+            event["error"] = excType.__name__
+
+        tracer.events.append(event)
+
+        return False
+
+# Records nested wall and CPU timings of the export stages, with the number of nodes each one worked on
+# Off until started, while it is off a traced call costs one check
+# Traces are written as json lines, one span per line, or in the Chrome trace format (chrome://tracing)
+class Tracer:
+
+    def __init__(self):
+
+        self.enabled = False
+
+        # Also count the scene's nodes around every span, costs an ls on both ends
+        self.countSceneNodes = False
+
+        # Finished spans, in the order they finished, and the ones still open
+        self.events = []
+        self.stack = []
+
+        # Span start times are relative to this
+        self.origin = wallTime()
+
+    # Clears the recorded spans
+    def clear(self):
+
+        self.events = []
+        self.stack = []
+        self.origin = wallTime()
+
+    # Gets the recorded spans, in the order they started
+    def getEvents(self):
+
+        return sorted(self.events, key = lambda event: (event["start"], event["depth"]))
+
+    # Gets a span timing a stage, node lists passed as nodes are recorded as their count
+    # Use it with the with statement
+    def span(self, name, **args):
+
+        if not self.enabled:
+
+            return NULL_SPAN
+
+        if "nodes" in args and not isinstance(args["nodes"], int):
+
+            args["nodes"] = len(args["nodes"])
+
+        return Span(self, name, args)
+
+    # Starts recording, clearing anything recorded before
+    def start(self, countSceneNodes = False):
+
+        self.clear()
+
+        self.countSceneNodes = countSceneNodes
+        self.enabled = True
+
+    # Stops recording, the recorded spans are kept
+    def stop(self):
+
+        self.enabled = False
+
+    # Totals the recorded spans by stage
+    # Returns name : {"count", "wall", "self", "cpu"}
+    def summarize(self):
+
+        totals = {}
+
+        for event in self.events:
+
+            total = totals.setdefault(event["name"], {"count" : 0, "wall" : 0.0, "self" : 0.0, "cpu" : 0.0})
+
+            total["count"] += 1
+
+            for key in ("wall", "self", "cpu"):
+
+                total[key] += event[key]
+
+        return totals
+
+    # Writes the recorded spans, in the Chrome trace format for .json files and as json lines otherwise
+    def write(self, traceFilePath):
+
+        if os.path.splitext(traceFilePath)[1].lower() == ".json":
+
+            self.writeChromeTrace(traceFilePath)
+
+        else:
+
+            self.writeJSONLines(traceFilePath)
+
+    # Writes the recorded spans in the Chrome trace format, times in microseconds
+    def writeChromeTrace(self, traceFilePath):
+
+        traceEvents = []
+
+        for event in self.getEvents():
+
+            args = dict(event["args"])
+            args["cpuMs"] = event["cpu"] * 1000.0
+
+            for key in ("sceneNodes", "error"):
+
+                if key in event:
+
+                    args[key] = event[key]
+
+            traceEvents.append({"name" : event["name"],
+                                "cat" : "ueExport",
+                                "ph" : "X",
+                                "ts" : event["start"] * 1000000.0,
+                                "dur" : event["wall"] * 1000000.0,
+                                "pid" : os.getpid(),
+                                "tid" : 0,
+                                "args" : args})
+
+        with open(traceFilePath, "w") as traceFile:
+
+            json.dump({"traceEvents" : traceEvents, "displayTimeUnit" : "ms"}, traceFile)
+
+    # Writes the recorded spans as json lines, times in seconds
+    def writeJSONLines(self, traceFilePath):
+
+        with open(traceFilePath, "w") as traceFile:
+
+            for event in self.getEvents():
+
+                traceFile.write(json.dumps(event, sort_keys = True) + "\n")
+
+# The shared tracer, created up front so traced calls can check it without a function call
+_tracer = Tracer()
+
+# Describes a call to an asset's method for its span
+def describeAsset(asset, *args, **kwargs):
+
+    return {"asset" : str(asset.node)}
+
+# Describes a call to an asset's method on a list of nodes for its span
+def describeAssetNodes(asset, nodes, *args, **kwargs):
+
+    return {"asset" : str(asset.node), "nodes" : len(nodes)}
+
+# Describes a call on a node list for its span, a single node counts as one and None as none
+def describeNodes(nodes = None, *args, **kwargs):
+
+    if nodes is None:
+
+        return {"nodes" : 0}
+
+    return {"nodes" : len(nodes) if isinstance(nodes, (list, tuple)) else 1}
+
+# Formats the tracer's totals by stage as a table, slowest stages first
+def formatSummary(totals):
+
+    lines = ["%-18s %6s %10s %10s %10s" % ("stage", "count", "wall", "self", "cpu")]
+
+    for name, total in sorted(totals.items(), key = lambda item: -item[1]["wall"]):
+
+        lines.append("%-18s %6d %9.3fs %9.3fs %9.3fs" % (name, total["count"], total["wall"], total["self"], total["cpu"]))
+
+    return "\n".join(lines)
+
+# Gets the shared tracer
+def getTracer():
+
+    return _tracer
+
+# Decorates a function so every call to it is a span while the tracer is on
+# describe gets the call's arguments and returns the span's args, like the asset or the nodes worked on
+def traced(name, describe = None):
+
+    def decorate(func):
+
+        @functools.wraps(func)
+        def tracedCall(*args, **kwargs):
+
+            if not _tracer.enabled:
+
+                return func(*args, **kwargs)
+
+            spanArgs = describe(*args, **kwargs) if describe is not None else {}
+
+            with _tracer.span(name, **spanArgs):
+
+                return func(*args, **kwargs)
+
+        return tracedCall
+
+    return decorate
@@ -0,0 +1,194 @@
+'''
+The transaction module of the UnrealExporter package
+'''
+
+# Import statements
+import collections
+
+import maya.cmds
+import pymel.core
+
+# Import backend module from UnrealExporter package
+import UnrealExporter.backend
+
+# The transaction exports run in, None outside of one
+ACTIVE = None
+
+# Records the scene changes an export makes and rolls them back in memory once the fbx is written,
+# so the scene never needs to be reopened from disk
+# Commands are recorded in one chunk on Maya's undo queue, key writes through the API are not undoable,
+# so the keys of curves that were in the scene before are journaled before they are written
+# The scene's nodes, types and hierarchy are compared before and after to verify the rollback
+# Use it with the with statement, nested transactions join the one already running
+# When enabled is False nothing is recorded or rolled back
+class Transaction:
+
+    def __init__(self, name = "ueExport", assets = None, enabled = True):
+
+        self.name = name
+        self.enabled = enabled
+
+        # Assets whose cached elements go stale when the scene rolls back
+        self.assets = list(assets or [])
+
+        # Descriptions of every recorded change, in order
+        self.journal = []
+
+        # Keys of curves that were in the scene before, as (curve, curve type, times, values), in write order
+        self.curveKeys = []
+        self.journaledCurves = set()
+
+        # Scene state and anim curves from before the transaction
+        self.sceneState = None
+        self.startCurves = set()
+
+        self.undoState = None
+        self.nested = False
+
+    def __enter__(self):
+
+        self.begin()
+
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+
+        # A failed rollback must not hide the export error
+        try:
+
+            self.rollback()
+
+        except Exception:
+
+            if excType is None:
+
+                raise
+
+        return False
+
+    # Starts recording, joins the running transaction if there is one
+    def begin(self):
+
+        global ACTIVE
+
+        if not self.enabled:
+
+            return
+
+        if ACTIVE is not None:
+
+            ACTIVE.assets.extend(self.assets)
+
+            self.nested = True
+
+            return
+
+        self.sceneState = getSceneState()
+        self.startCurves = set(maya.cmds.ls(type = "animCurve"))
+
+        # The undo queue has to be on to record the commands
+        self.undoState = pymel.core.undoInfo(q = True, state = True)
+
+        pymel.core.undoInfo(state = True)
+        pymel.core.undoInfo(openChunk = True, chunkName = self.name)
+
+        ACTIVE = self
+
+    # Journals the keys of a curve before they are written through the API
+    # Only curves that were in the scene before need it, the rest are deleted with the undo
+    def recordCurve(self, curveName, curveType):
+
+        if curveName not in self.startCurves or curveName in self.journaledCurves:
+
+            return
+
+        self.journaledCurves.add(curveName)
+
+        self.curveKeys.append((curveName,
+                                curveType,
+                                maya.cmds.keyframe(curveName, q = True, timeChange = True) or [],
+                                maya.cmds.keyframe(curveName, q = True, valueChange = True) or []))
+
+        self.record("keys of " + curveName)
+
+    # Records a description of a scene change
+    def record(self, description):
+
+        self.journal.append(description)
+
+    # Rolls every recorded change back and verifies the scene is what it was before
+    def rollback(self):
+
+        global ACTIVE
+
+        if not self.enabled or self.nested:
+
+            return
+
+        ACTIVE = None
+
+        pymel.core.undoInfo(closeChunk = True)
+
+        # Put back journaled keys first, the undo then takes the scene back past the commands before them
+        # Nothing here goes on the undo queue
+        if self.curveKeys:
+
+            # Imported here, the curves module imports this one
+            import UnrealExporter.curves
+
+            pymel.core.undoInfo(stateWithoutFlush = False)
+
+            try:
+
+                UnrealExporter.curves.writeCurveKeys(collections.OrderedDict((curveName, (curveType, times, values))
+                                                    for curveName, curveType, times, values in reversed(self.curveKeys)))
+
+            finally:
+
+                pymel.core.undoInfo(stateWithoutFlush = True)
+
+        pymel.core.undo()
+
+        pymel.core.undoInfo(state = self.undoState)
+
+        # Cached asset elements may point at nodes that are gone
+        for asset in self.assets:
+
+            asset.invalidate()
+
+        # Imported here, sceneIndex imports the utils module, which imports this one
+        import UnrealExporter.sceneIndex
+
+        UnrealExporter.sceneIndex.invalidate()
+
+        self.verify()
+
+    # Checks the scene is back to what it was before the transaction
+    def verify(self):
+
+        sceneState = getSceneState()
+
+        if sceneState == self.sceneState:
+
+            return
+
+        before = set(self.sceneState)
+        after = set(sceneState)
+
+        added = sorted(name for name, nodeType in after - before)
+        removed = sorted(name for name, nodeType in before - after)
+
+        pymel.core.error("Scene did not roll back after export, added: %s, removed: %s" % (", ".join(added[:10]) or "none",
+                                                                                            ", ".join(removed[:10]) or "none"))
+
+# Gets the running transaction, or None
+def getActive():
+
+    return ACTIVE
+
+# Gets every node in the scene, as sorted (long name, type) pairs, long names carry the hierarchy
+def getSceneState():
+
+    names, nodeTypes = UnrealExporter.backend.getBackend().listNodeTypes(long = True)
+
+    return sorted(zip(names, nodeTypes))
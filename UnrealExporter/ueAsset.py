@@ -6,140 +6,275 @@ The ueAsset module of the UnrealExporter package
 import pymel.core
 import os
 
-# Import utils module from UnrealExporter package
+# Import bakeContext, cameras, skeleton, tracer, transaction, utils and sceneIndex modules from UnrealExporter package
+import UnrealExporter.bakeContext
+import UnrealExporter.cameras
+import UnrealExporter.skeleton
+import UnrealExporter.tracer
+import UnrealExporter.transaction
 import UnrealExporter.utils
+import UnrealExporter.sceneIndex
 
 # Standard Unreal Asset class
+# Asset elements are computed on first use and cached,
+# invalidate() clears them after the scene changes
 class UnrealAsset:
 
+    # Elements read off of the asset node, attribute name: node method
+    NODE_ATTRIBUTES = {"namespace" : "namespace",
+                        "objType" : "type",
+                        "objShape" : "getShape",
+                        "name" : "name",
+                        "refFile" : "referenceFile"}
+
+    # Elements found by the asset, attribute name: asset method
+    # The frame range is found before anything is baked, baking keys every channel over it
+    LAZY_ATTRIBUTES = {"frameRange" : "getFrameRange"}
+
     def __init__(self, node):
 
-        # Get the initial namespace, nodeType, shape, name, and referenceFile
-        self.namespace = node.namespace()
-        self.objType = node.type()
-        self.objShape = node.getShape()
-        self.name = node.name()
-        self.refFile = node.referenceFile()
+        # Keep the node, the namespace, nodeType, shape, name, and referenceFile are read off of it on first use
+        self.node = node
+
+        # Key reduction report of the last export, None when key reduction is off
+        self.reductionReport = None
+
+    # Computes and caches an asset element the first time it is used
+    def __getattr__(self, name):
+
+        if name in self.NODE_ATTRIBUTES:
+
+            value = getattr(self.node, self.NODE_ATTRIBUTES[name])()
+
+        elif name in self.LAZY_ATTRIBUTES:
+
+            # Finding the asset's elements is the scene discovery stage
+            with UnrealExporter.tracer.getTracer().span("discover", element = name):
+
+                value = getattr(self, self.LAZY_ATTRIBUTES[name])()
+
+        else:
+
+            raise AttributeError(name)
+
+        self.__dict__[name] = value
+
+        return value
 
     # Exports the fbx
+    @UnrealExporter.tracer.traced("fbxWrite", UnrealExporter.tracer.describeAsset)
     def export(self):
 
         pymel.core.mel.FBXExport(s = True,f = self.exportFilePath)
 
+        # Record the size of the reduced fbx
+        if self.reductionReport is not None:
+
+            self.reductionReport["fbxBytes"] = os.path.getsize(self.exportFilePath)
+
+    # Gets the transaction an export of this asset runs in
+    # With transactional exports on, the scene is rolled back once the fbx is written
+    def exportTransaction(self):
+
+        return UnrealExporter.transaction.Transaction(assets = [self], enabled = UnrealExporter.utils.TRANSACTIONAL_EXPORT)
+
+    # Finishes the export prep once the bake is done
+    def finishBake(self):
+
+        pass
+
+    # Gets the nodes that need to be baked for export
+    def getBakeNodes(self):
+
+        return []
+
+    # Gets the frame range the asset is baked and exported over, see UnrealExporter.utils.getBakeRange
+    def getFrameRange(self):
+
+        # The nodes are only found when the auto range needs them, so a broken asset still gets a frame range to validate
+        return UnrealExporter.utils.getBakeRange(self.getRangeNodes)
+
+    # Gets the nodes whose animation sets the frame range
+    def getRangeNodes(self):
+
+        return self.getBakeNodes()
+
     # Imports the reference
+    # Importing brings in every node of the rig, with references kept the exported nodes are written straight from the namespace
+    @UnrealExporter.tracer.traced("importReference", UnrealExporter.tracer.describeAsset)
     def importReference(self):
 
         # As long as there is a reference file
         if self.refFile != None:
 
+            # Importing can't be undone, transactional exports work on the reference in place
+            transaction = UnrealExporter.transaction.getActive()
+
+            if transaction is not None:
+
+                transaction.record("kept reference " + str(self.refFile))
+
+                return
+
+            if not UnrealExporter.utils.IMPORT_REFERENCES:
+
+                return
+
             # Import the reference
             self.refFile.importContents()
 
+            # The node is no longer referenced
+            self.invalidate("refFile")
+            UnrealExporter.sceneIndex.invalidate()
+
+    # Clears cached asset elements so they are found again on next use
+    # If no names are given, every cached element is cleared
+    def invalidate(self, *names):
+
+        if not names:
+
+            names = list(self.NODE_ATTRIBUTES) + list(self.LAZY_ATTRIBUTES)
+
+        for name in names:
+
+            self.__dict__.pop(name, None)
+
+    # Prep the export
+    # Bakes this asset on its own, batches share one bake through BatchExporter
+    @UnrealExporter.tracer.traced("prepExport", UnrealExporter.tracer.describeAsset)
+    def prepExport(self):
+
+        # Get start and end times
+        startTime, endTime = self.frameRange
+
+        # Keep the fast bake configuration until the prep is done
+        with UnrealExporter.bakeContext.getBakeContext():
+
+            # Create any helper nodes needed for the bake
+            self.setupBake()
+
+            # Grab the nodes to bake
+            bakeNodes = self.getBakeNodes()
+
+            # If there is anything to bake...
+            if bakeNodes:
+
+                # Bake it
+                UnrealExporter.utils.bakeRange(bakeNodes, startTime, endTime)
+
+            # Clean up after the bake
+            self.finishBake()
+
+    # Reduces the baked keys on the given nodes when key reduction is on
+    @UnrealExporter.tracer.traced("keyReduction", UnrealExporter.tracer.describeAssetNodes)
+    def reduceKeys(self, nodes):
+
+        self.reductionReport = UnrealExporter.utils.reduceKeys(nodes)
+
+        # Constant channels lost their curves
+        if self.reductionReport is not None and self.reductionReport["constantCurves"]:
+
+            UnrealExporter.sceneIndex.invalidate()
+
     # Set the filename for the export
     # NOTE: needs a ".fbx" at the end
     def setFileName(self, fileName):
 
         self.exportFilePath = fileName
 
+    # Creates any helper nodes needed before baking
+    def setupBake(self):
+
+        pass
+
 # Skeletal Mesh class, inherents from UnrealAsset
 class SkeletalMesh(UnrealAsset):
 
+    # Gets skinClusters, skin influences, geometry, bone map, skeleton, root joint,
+    # blendshapes, blendshape targets, constraints and the frame range on first use
+    LAZY_ATTRIBUTES = {"frameRange" : "getFrameRange",
+                        "skins" : "getSkins",
+                        "influences" : "getInfluences",
+                        "boneMap" : "getBoneMap",
+                        "geometry" : "getMeshes",
+                        "skinnedGeometry" : "getSkinnedGeometry",
+                        "skeleton" : "getSkeleton",
+                        "root" : "getRoot",
+                        "blendShapes" : "getBlendshapes",
+                        "bsMeshes" : "getBlendshapeGeo",
+                        "constraints" : "getConstraints"}
+
     def __init__(self, node):
 
-        # Get initial elements
+        # Get inital elements
         UnrealAsset.__init__(self, node)
 
-        # Gets skinClusters, geometry, skeleton, root joint, 
-        # blendshapes, blendshape targets, constraints
-        self.skins = self.getSkins()
-        self.geometry = self.getMeshes()
-        self.skeleton = self.getSkeleton()
-        self.root = self.getRoot()
-        self.blendShapes = self.getBlendshapes()
-        self.bsMeshes = self.getBlendshapeGeo()
-        self.constraints = self.getConstraints()
-
-    # Bakes external constraints on the rig
-    # e.g. object interaction
-    def bakeConstraints(self):
-
-        # Gets start and end time
-        startTime = UnrealExporter.utils.getStartTime()
-        endTime = UnrealExporter.utils.getEndTime()
-
-        # If there are constraints...
-        if self.constraints:
-
-            # Bake only the translate and rotate attributes
-            attrs = ['tx',
-                'ty',
-                'tz',
-                'rx',
-                'ry',
-                'rz'
-                ]
-
-            # And bake it
-            UnrealExporter.utils.bakeThis(self.constraints,
-                                            simulation = True, 
-                                            time = (startTime, endTime), 
-                                            sampleBy  = True, 
-                                            disableImplicitControl = True, 
-                                            preserveOutsideKeys = False,
-                                            sparseAnimCurveBake = False,
-                                            removeBakedAnimFromLayer = False, 
-                                            bakeOnOverrideLayer = False,
-                                            minimizeRotation = True, 
-                                            controlPoints = False,
-                                            shape = True)
+        # Bone map file to strip joints by, None finds them from the skin weights
+        self.boneMapFilePath = None
 
     # Exports the animation for the skeletal mesh
     def exportAnimation(self):
 
-        # Prep the export
-        self.prepExport()
-
-        # Set the export options
-        UnrealExporter.utils.setGeneralExportOptions()
-        UnrealExporter.utils.setAnimExportOptions()
+        with self.exportTransaction():
 
-        # Clears the selection
-        pymel.core.select(clear = True)
-
-        # Then select the skeleton, blendshapes, root, blendshape targets, and geometry
-        pymel.core.select(self.skeleton, 
-                    self.blendShapes, 
-                    self.root, 
-                    self.bsMeshes, 
-                    self.geometry)
+            # Prep the export
+            self.prepExport()
 
-        # Then exports the file
-        self.export()
+            # Write the fbx
+            self.writeAnimation()
 
     # Exports the skeleton mesh
     def exportSkeletonMesh(self):
 
-        # Prep the export
-        self.prepExport()
+        with self.exportTransaction():
 
-        # Set the export options
-        UnrealExporter.utils.setGeneralExportOptions()
-        UnrealExporter.utils.setMeshExportOptions()
-        UnrealExporter.utils.setTextureExportOptions()
-        UnrealExporter.utils.setAnimExportOptions()
+            # Prep the export
+            self.prepExport()
 
-        # Clear the selection
-        pymel.core.select(clear = True)
+            # Write the fbx
+            self.writeSkeletonMesh()
 
-        # Then select the skeleton, blendshapes, root, blendshape targets, and geometry
-        pymel.core.select(self.skeleton, 
-                    self.blendShapes, 
-                    self.geometry, 
-                    self.root, 
-                    self.bsMeshes)
+    # Finishes the export prep once the bake is done
+    def finishBake(self):
 
-        # Then exports the file
-        self.export()
+        # Euler filter the baked skeleton
+        UnrealExporter.utils.eulerFilter(self.blendShapes + self.skeleton + [self.root])
+
+        # Drop the keys that are within tolerance of their neighbours
+        self.reduceKeys(self.blendShapes + self.skeleton + [self.root])
+
+        # Import the reference
+        self.importReference()
+
+        # Unparent the root
+        self.root.setParent(world = True)
+
+        UnrealExporter.utils.deleteChildrenNodeType(self.root, "joint")
+
+        # Strip the joints that don't influence the exported meshes
+        if self.boneMap is not None and self.boneMap["stripped"]:
+
+            UnrealExporter.skeleton.removeJoints(self.root, set(self.boneMap["stripped"]))
+
+        # The root has a new top node and lost its children
+        self.invalidate("constraints")
+        UnrealExporter.sceneIndex.invalidate()
+
+    # Gets the nodes that need to be baked for export
+    # External constraints are baked in the same pass as the skeleton
+    def getBakeNodes(self):
+
+        bakeNodes = []
+        seen = set()
+
+        for node in self.constraints + self.blendShapes + self.skeleton + [self.root]:
+
+            if node not in seen:
+
+                seen.add(node)
+                bakeNodes.append(node)
+
+        return bakeNodes
 
     # Gets the blendshapes from the skeletal mesh
     def getBlendshapes(self):
@@ -176,40 +311,60 @@ class SkeletalMesh(UnrealAsset):
 
         return tgtMeshes
 
+    # Gets the bone map of the stripped skeleton, None when joint stripping is off and no bone map file is set
+    # Joints that don't influence the exported meshes, and have no joint under them that does, are stripped
+    def getBoneMap(self):
+
+        # A bone map file strips the joints the export it was written for stripped, so animations match their skeletal mesh
+        if self.boneMapFilePath is not None:
+
+            return UnrealExporter.skeleton.readBoneMap(self.boneMapFilePath)
+
+        tolerance = UnrealExporter.utils.JOINT_STRIP_TOLERANCE
+
+        if tolerance is None:
+
+            return None
+
+        # Grab the hierarchy snapshot
+        hierarchy = UnrealExporter.sceneIndex.getHierarchy()
+
+        # Every joint in the namespace, by full path
+        joints = [path for path, nodeType, namespace in zip(hierarchy.paths, hierarchy.types, hierarchy.namespaces)
+                    if nodeType == "joint" and namespace == self.namespace]
+
+        maxWeights = UnrealExporter.skeleton.getMaxWeights(self.skins, self.geometry)
+
+        return UnrealExporter.skeleton.createBoneMap(joints, maxWeights, tolerance)
+
     # Gets all external constraints
     def getConstraints(self):
 
+        # Grab the hierarchy snapshot
+        hierarchy = UnrealExporter.sceneIndex.getHierarchy()
+
         # Gets the absolute top node of the entire rig
-        topNode = self.root.getParent(generations = -1)
+        topNode = hierarchy.getTopNode(hierarchy.getIndex(self.root))
 
-        # Gets the topNode namespace
-        topNodeNS = topNode.namespace()
+        # Grab every constraint under the top node that is not in the top node's namespace
+        constraints = hierarchy.getForeignConstraints(topNode)
 
-        # Grab all children on the top node
-        allChildren = topNode.listRelatives(ad = True)
+        return [hierarchy.getNode(constraint) for constraint in constraints]
 
-        # Create an empty array for the constraints
-        constraints = []
+    # Gets the names of every influence on the skins
+    # Uses one influence query per skinCluster instead of a connection query per joint
+    def getInfluences(self):
 
-        # Loop through all the children
-        for child in allChildren:
-            
-            # If the child has the same namespace as the top node....
-            # Skip it
-            if child.namespace() == topNodeNS:
-                
-                continue        
-            
-            # Also if the child is not a constraint
-            # Skip it
-            if "Constraint" not in child.type():
-                
-                continue
-            
-            # Add the constraint to the array
-            constraints.append(child)
-        
-        return constraints
+        # Create an empty set for the skin influences
+        influences = set()
+
+        # Loop through all skins
+        for skin in self.skins:
+
+            # Grab all the influences on the skin
+            influences.update(str(influence) for influence in pymel.core.skinCluster(skin, query = True, influence = True))
+
+        return influences
 
     # Get all meshes in the skeletal mesh
     def getMeshes(self):
@@ -217,75 +372,62 @@ class SkeletalMesh(UnrealAsset):
         # Create an empty array for the skinnedMeshes
         skinnedMeshes = []
 
-        # Grab skins
-        skins = self.skins
+        # Loop through all geo
+        for defMesh in self.skinnedGeometry:
 
-        # Loop through skins
-        for skin in skins:
-            
-            # Grab the geometry
-            defMeshes = skin.getGeometry()
+            # If the geo is not polygons
+            # Skip it
+            if defMesh.type() != "mesh":
 
-            # Loop through all geo
-            for defMesh in defMeshes:
+                continue
+
+            # If the geo is not visible
+            # Skip it
+            elif defMesh.isVisible() != True:
 
-                # If the geo is not polygons
-                # Skip it
-                if defMesh.type() != "mesh":
+                continue
 
-                    continue
+            # Add the mesh into skinMeshes
+            skinnedMeshes.append(defMesh)
 
-                # If the geo is not visible
-                # Skip it
-                elif defMesh.isVisible() != True:
+        return skinnedMeshes
 
-                    continue
+    # Get all geometry the skins deform, meshes or not, visible or not
+    def getSkinnedGeometry(self):
 
-                # Add the mesh into skinMeshes
-                skinnedMeshes.append(defMesh)
+        # Create an empty array for the geometry
+        skinnedGeometry = []
 
-        return skinnedMeshes
+        # Loop through skins
+        for skin in self.skins:
+
+            # Grab the geometry
+            skinnedGeometry.extend(skin.getGeometry())
+
+        return skinnedGeometry
 
-    # Get the root joint 
-    # Code from Jason Breneman - check readme for link
+    # Get the root joint
+    # Based off of code from Jason Breneman - check readme for link
     def getRoot(self):
-    
-        rootJoint = self.skeleton[0]
 
-        while (True):
-            parent = rootJoint.listRelatives(
-                                         parent=True,
-                                         type='joint' )
-            if not parent:
-                break;
+        # Grab the hierarchy snapshot
+        hierarchy = UnrealExporter.sceneIndex.getHierarchy()
 
-            rootJoint = parent[0]
+        # Climb from the first joint to the top of its joint chain
+        rootJoint = hierarchy.getRootJoint(hierarchy.getIndex(self.skeleton[0]))
+
+        return hierarchy.getNode(rootJoint)
 
-        return rootJoint 
-    
     # Get the skeleton for the skeletal mesh
     def getSkeleton(self):
 
-        # Create an empty array for skinned joints
-        skinnedJoints = []
+        # Grab all joints in skeletal mesh namespace, these are in hierarchy order
+        joints = UnrealExporter.sceneIndex.listNodes(self.namespace, "joint")
 
-        # Grab all joints in skeletal mesh namespace
-        joints = pymel.core.ls(self.namespace + "*", type = "joint")
+        # Keep the joints that influence a skin, and aren't stripped
+        stripped = set(self.boneMap["stripped"]) if self.boneMap is not None else set()
 
-        # Loop through all joints
-        for joint in joints:
-
-            # See if there are any connections to skinclusters
-            skins = joint.listConnections(type = "skinCluster")
-            
-            # If there are no skins...
-            # Skip it
-            if len(skins) <= 0:
-                
-                continue
-
-            # Add joints to array
-            skinnedJoints.append(joint)
+        skinnedJoints = [joint for joint in joints if str(joint) in self.influences and str(joint) not in stripped]
 
         # If there are no joints...
         if len(skinnedJoints) <= 0:
@@ -299,62 +441,74 @@ class SkeletalMesh(UnrealAsset):
     def getSkins(self):
 
         # Get all skin clusters based off of namespace
-        skins = pymel.core.ls(self.namespace + "*", type = "skinCluster")
+        skins = UnrealExporter.sceneIndex.listNodes(self.namespace, "skinCluster")
 
         return skins
 
-    # Prep the export
-    def prepExport(self):
+    # Sets the bone map file to strip joints by, e.g. the one written with the skeletal mesh an animation is for
+    def setBoneMapFile(self, fileName):
 
-        # Get start and end times
-        startTime = UnrealExporter.utils.getStartTime()
-        endTime = UnrealExporter.utils.getEndTime()
+        self.boneMapFilePath = fileName
 
-        # Bake constraints
-        self.bakeConstraints()
+        self.invalidate("boneMap", "skeleton", "root")
 
-        # Clear the selection
+    # Writes the animation fbx for the baked skeletal mesh
+    def writeAnimation(self):
+
+        # Set the export options
+        UnrealExporter.utils.setExportProfile("anim")
+        UnrealExporter.utils.setExportRange(self.frameRange)
+
+        # Clears the selection
         pymel.core.select(clear = True)
 
-        # Select blendshape, skeleton, and the root
-        pymel.core.select(self.blendShapes, self.skeleton, self.root)
-
-        # Bake the selection
-        UnrealExporter.utils.bakeThis(None,
-                                        simulation = True, 
-                                        time = (startTime, endTime), 
-                                        sampleBy  = True, 
-                                        disableImplicitControl = True, 
-                                        preserveOutsideKeys = False,
-                                        sparseAnimCurveBake = False,
-                                        removeBakedAnimFromLayer = False, 
-                                        bakeOnOverrideLayer = False,
-                                        minimizeRotation = True, 
-                                        controlPoints = False,
-                                        shape = True)
-
-        # Euler filter the selection
-        UnrealExporter.utils.eulerFilter()
+        # Then select the skeleton, blendshapes, root, blendshape targets, and geometry
+        pymel.core.select(self.skeleton, 
+                    self.blendShapes, 
+                    self.root, 
+                    self.bsMeshes, 
+                    self.geometry)
 
-        # Import the reference
-        self.importReference()
+        # Then exports the file
+        self.export()
 
-        # Unparent the root
-        self.root.setParent(world = True)
+        self.writeBoneMap()
 
-        UnrealExporter.utils.deleteChildrenNodeType(self.root, "joint")
+    # Writes the bone map of the stripped skeleton next to the fbx
+    def writeBoneMap(self):
 
-# Static Mesh class, inherents from UnrealAsset
-class StaticMesh(UnrealAsset):
+        if self.boneMap is not None:
 
-    def __init__(self, node):
+            UnrealExporter.skeleton.writeBoneMap(UnrealExporter.skeleton.getBoneMapPath(self.exportFilePath), self.boneMap)
 
-        # Get initial elements
-        UnrealAsset.__init__(self, node)
+    # Writes the skeletal mesh fbx for the baked skeletal mesh
+    def writeSkeletonMesh(self):
+
+        # Set the export options
+        UnrealExporter.utils.setExportProfile("skeletal")
+        UnrealExporter.utils.setExportRange(self.frameRange)
+
+        # Clear the selection
+        pymel.core.select(clear = True)
 
-        # Get the geometry and the transform root
-        self.geometry = self.getMeshes()
-        self.root = self.getRoot()
+        # Then select the skeleton, blendshapes, root, blendshape targets, and geometry
+        pymel.core.select(self.skeleton, 
+                    self.blendShapes, 
+                    self.geometry, 
+                    self.root, 
+                    self.bsMeshes)
+
+        # Then exports the file
+        self.export()
+
+        self.writeBoneMap()
+
+# Static Mesh class, inherents from UnrealAsset
+class StaticMesh(UnrealAsset):
+
+    # Get the geometry and the transform root on first use
+    LAZY_ATTRIBUTES = {"geometry" : "getMeshes",
+                        "root" : "getRoot"}
 
     # Create root
     def createRoot(self):
@@ -368,23 +522,25 @@ class StaticMesh(UnrealAsset):
         return root
 
     # Exports the mesh
+    @UnrealExporter.tracer.traced("exportMesh", UnrealExporter.tracer.describeAsset)
     def exportMesh(self):
 
-        # Clears the selection
-        pymel.core.select(clear = True)
+        with self.exportTransaction():
 
-        # Selects the root and the geometry
-        pymel.core.select(self.root, self.geometry)
+            # Clears the selection
+            pymel.core.select(clear = True)
 
-        # Imports the reference
-        self.importReference()
+            # Selects the root and the geometry
+            pymel.core.select(self.root, self.geometry)
 
-        # Set the export options
-        UnrealExporter.utils.setGeneralExportOptions()
-        UnrealExporter.utils.setMeshExportOptions()
+            # Imports the reference
+            self.importReference()
 
-        # Exports the mesh
-        self.export()
+            # Set the export options
+            UnrealExporter.utils.setExportProfile("static")
+
+            # Exports the mesh
+            self.export()
 
     # Get the meshes
     def getMeshes(self):
@@ -396,7 +552,7 @@ class StaticMesh(UnrealAsset):
             return [self.objShape]
 
         # Return all meshes in namespace
-        return pymel.core.ls(self.namespace + "*", type = "mesh")
+        return UnrealExporter.sceneIndex.listNodes(self.namespace, "mesh")
 
     # Gets the root
     def getRoot(self):
@@ -408,7 +564,7 @@ class StaticMesh(UnrealAsset):
             return self.setRoot()
 
         # Get all locators in namespace
-        locs = pymel.core.ls(self.namespace + "*", type = "locator")
+        locs = UnrealExporter.sceneIndex.listNodes(self.namespace, "locator")
 
         # If locators exist
         if locs:
@@ -436,6 +592,8 @@ class StaticMesh(UnrealAsset):
             # Set the parent of the root locator
             meshSRT.setParent(rootLoc)
 
+        UnrealExporter.sceneIndex.invalidate()
+
         return rootLoc
 
 # Camera class, inherents from UnrealAsset
@@ -452,110 +610,66 @@ class Camera(UnrealAsset):
     # Exports the animation for the camera
     def exportAnimation(self):
 
-        # Set the export
-        self.prepExport()
-
-        # Set the export options
-        UnrealExporter.utils.setGeneralExportOptions()
-        UnrealExporter.utils.setCamExportOptions()
+        with self.exportTransaction():
 
-        # Export
-        self.export()
+            # Set the export
+            self.prepExport()
 
-    # Move keyframes to zero
-    def moveKeysToFrameZero(self):
+            # Write the fbx
+            self.writeAnimation()
 
-        # Moves the keyframes of any object to frame 0
-        object = self.camExport
+    # Finishes the export prep
+    # The export camera's curves are written straight from the source camera, retimed to start on frame 0
+    def finishBake(self):
 
-        # Get keyframes from object
-        keyFrames = pymel.core.keyframe(object, q = True)
-
-        # Get the first key
-        firstKey = keyFrames[0]
+        # Get start and end times
+        startTime, endTime = self.frameRange
 
-        # Move first key (which will move everything else) to frame 0
-        pymel.core.keyframe(object, edit = True, relative = True, tc = (-1*firstKey))
+        # Convert the animation onto the export camera
+        UnrealExporter.cameras.convertCamera(self.camTransform, self.camExport, startTime, endTime)
 
-    # Process through for export
-    def prepExport(self):
+        # Drop the keys that are within tolerance of their neighbours, lens curves included
+        self.reduceKeys([self.camExport, self.camExport.getShape()])
 
-        dupCam = pymel.core.camera()[0]
+    # Gets the nodes whose animation sets the frame range, the camera and everything above it
+    def getRangeNodes(self):
 
-        dupCamPC = pymel.core.parentConstraint(self.camTransform, dupCam, weight = 1, mo = 0)
+        nodes = [self.camTransform, self.camTransform.getShape()]
 
-        # Get start and end times
-        startTime = UnrealExporter.utils.getStartTime()
-        endTime = UnrealExporter.utils.getEndTime()
-
-        dupCam.select(r = True)
-
-        # Bake the camera animation
-        UnrealExporter.utils.bakeThis(None,
-                                        simulation = True, 
-                                        time = (startTime, endTime), 
-                                        sampleBy  = True, 
-                                        disableImplicitControl = True, 
-                                        preserveOutsideKeys = False,
-                                        sparseAnimCurveBake = False,
-                                        removeBakedAnimFromLayer = False, 
-                                        bakeOnOverrideLayer = False,
-                                        minimizeRotation = True, 
-                                        controlPoints = False,
-                                        shape = True)
-
-        # Reset the baking
-        UnrealExporter.utils.resetBake()
-
-        # Duplicate the camera
-        ueCam = pymel.core.duplicate(dupCam, returnRootsOnly = True, inputConnections = True)[0]
+        parent = self.camTransform.getParent()
 
-        # Rename it
-        ueCam.rename("UE_" + self.name)
+        while parent is not None:
 
-        # Set camera for export to duplicated camera
-        self.camExport = ueCam
+            nodes.append(parent)
 
-        # Group camera
-        camGrp = pymel.core.group(empty = True)
+            parent = parent.getParent()
 
-        # Set the parent of camera to group
-        self.camTransform.setParent(camGrp)
+        return nodes
 
-        # Parent constrain camera to new camera
-        ueCamPC = pymel.core.parentConstraint(self.camTransform, ueCam, weight = 1)
+    # Creates the export camera before the bake
+    # Nothing is constrained or baked, finishBake converts the source camera's world matrices analytically
+    def setupBake(self):
 
-        # Offset the rotation for export
-        ueCamPC.setAttr("target[0].targetOffsetRotateY", 90)
+        # Create the export camera
+        ueCam = pymel.core.camera()[0]
 
-        # Select the camera for baking
-        ueCam.select()
+        # Rename it
+        ueCam.rename("UE_" + self.name)
 
-        # Bake the camera animation
-        UnrealExporter.utils.bakeThis(None,
-                                        simulation = True, 
-                                        time = (startTime, endTime), 
-                                        sampleBy  = True, 
-                                        disableImplicitControl = True, 
-                                        preserveOutsideKeys = False,
-                                        sparseAnimCurveBake = False,
-                                        removeBakedAnimFromLayer = False, 
-                                        bakeOnOverrideLayer = False,
-                                        minimizeRotation = True, 
-                                        controlPoints = False,
-                                        shape = True)
+        # Set camera for export to the new camera
+        self.camExport = ueCam
 
-        # Euler Filter the animation curves
-        UnrealExporter.utils.eulerFilter()
+        UnrealExporter.sceneIndex.invalidate()
 
-        # Reset the baking
-        UnrealExporter.utils.resetBake()
+    # Writes the camera fbx for the baked camera
+    def writeAnimation(self):
 
-        # Delete the group
-        pymel.core.delete(camGrp)
+        # Set the export options, the export camera's keys start on frame 0
+        UnrealExporter.utils.setExportProfile("camera")
+        UnrealExporter.utils.setExportRange((0, self.frameRange[1] - self.frameRange[0]))
 
-        # Delete the duplicate camera
-        pymel.core.delete(dupCam)
+        # Select the camera for export
+        pymel.core.select(self.camExport, r = True)
 
-        # Move the keyframes to frame 0 for export
-        self.moveKeysToFrameZero()
\ No newline at end of file
+        # Export
+        self.export()
@@ -6,8 +6,148 @@ The utils module of the UnrealExporter package
 import pymel.core
 import os
 
+# Import backend, bakeContext, curves, drivers, fbxOptions, keyRange, reduction, skeleton and tracer modules from UnrealExporter package
+import UnrealExporter.backend
+import UnrealExporter.bakeContext
+import UnrealExporter.curves
+import UnrealExporter.drivers
+import UnrealExporter.fbxOptions
+import UnrealExporter.keyRange
+import UnrealExporter.reduction
+import UnrealExporter.skeleton
+import UnrealExporter.tracer
+
+# Keyword arguments used for every export bake
+BAKE_OPTIONS = {"simulation" : True,
+                "sampleBy" : True,
+                "disableImplicitControl" : True,
+                "preserveOutsideKeys" : False,
+                "sparseAnimCurveBake" : False,
+                "removeBakedAnimFromLayer" : False,
+                "bakeOnOverrideLayer" : False,
+                "minimizeRotation" : True,
+                "controlPoints" : False,
+                "shape" : True}
+
+# Frames per shard for sharded bakes, None bakes every range in one pass
+# Set with setBakeSharding
+BAKE_SHARD_FRAMES = None
+
+# Worker processes for sharded bakes
+BAKE_SHARD_WORKERS = 4
+
+# Frames each shard evaluates before its own first frame, None runs every shard up from the start of the bake range
+BAKE_SHARD_PRE_ROLL = 0
+
+# Frame range every asset is baked and exported over as (startTime, endTime), None uses the playback range
+# Set with setBakeRange, it overrides the auto range
+BAKE_RANGE = None
+
+# Handles around each asset's keyed range, None bakes the playback range, see UnrealExporter.keyRange
+# Set with setAutoBakeRange
+AUTO_BAKE_RANGE_HANDLES = None
+
+# Only channels driven over time are baked over the frame range, the rest get a single key, see UnrealExporter.drivers
+# Set with setSelectiveBake
+SELECTIVE_BAKE = False
+
+# Exports roll their scene changes back in memory once the fbx is written, see UnrealExporter.transaction
+# Set with setTransactionalExport
+TRANSACTIONAL_EXPORT = False
+
+# Skeletal and static exports import the asset's reference, False exports the referenced nodes in place
+# Set with setImportReferences
+IMPORT_REFERENCES = True
+
+# Largest skin weight a joint can have and still be stripped from skeletal exports, None keeps every joint, see UnrealExporter.skeleton
+# Set with setJointStripping
+JOINT_STRIP_TOLERANCE = None
+
+# Key reduction tolerances by channel group, None leaves the baked keys alone
+# Set with setKeyReduction
+KEY_REDUCTION_TOLERANCES = None
+
+# FBX export option sets, as (mel command, value) pairs
+
+# Bake Complex and Shapes is needed for Blendshapes
+# Skins are needed for actual animation
+# Constraints have crashed, make sure they are false
+ANIM_EXPORT_OPTIONS = (("FBXExportBakeComplexAnimation", True),
+                        ("FBXExportShapes", True),
+                        ("FBXExportSkins", True),
+                        ("FBXExportConstraints", False))
+
+# Bake Complex and Camera is needed for Camera
+# Constraints have crashed, make sure they are false
+CAM_EXPORT_OPTIONS = (("FBXExportCameras", True),
+                        ("FBXExportBakeComplexAnimation", True),
+                        ("FBXExportConstraints", False))
+
+# Get general options for exporting to Unreal
+# For less data space, export in ascii is false
+# Up Axis Z
+# Make not not just animation
+GENERAL_EXPORT_OPTIONS = (("FBXExportInAscii", False),
+                            ("FBXExportUpAxis", "z"),
+                            ("FBXExportAnimationOnly", False))
+
+# Triangulate on Export speeds up Unreal import time
+# Smooth Mesh and Smoothing Groups for models
+MESH_EXPORT_OPTIONS = (("FBXExportSmoothMesh", True),
+                        ("FBXExportTriangulate", True),
+                        ("FBXExportTangents", True),
+                        ("FBXExportSmoothingGroups", True))
+
+# Embedded the textures into the fbx file on import
+TEXTURE_EXPORT_OPTIONS = (("FBXExportEmbeddedTextures", True),)
+
+# FBX export profiles, the options each kind of export is written with, by name
+# Options a profile leaves out keep whatever they were last set to
+DEFAULT_EXPORT_PROFILES = {"static" : GENERAL_EXPORT_OPTIONS + MESH_EXPORT_OPTIONS,
+                            "skeletal" : GENERAL_EXPORT_OPTIONS + MESH_EXPORT_OPTIONS + TEXTURE_EXPORT_OPTIONS + ANIM_EXPORT_OPTIONS,
+                            "anim" : GENERAL_EXPORT_OPTIONS + ANIM_EXPORT_OPTIONS,
+                            "camera" : GENERAL_EXPORT_OPTIONS + CAM_EXPORT_OPTIONS}
+
+# Export profiles in use, tuned with loadExportProfiles and put back with resetExportProfiles
+EXPORT_PROFILES = dict(DEFAULT_EXPORT_PROFILES)
+
+# Bakes nodes over a frame range with the export bake options
+# Ranges longer than a shard are baked across worker processes when sharding is on
+# With selective baking on, only the driven channels are baked over the range and the static ones are keyed once
+def bakeRange(nodes, startTime, endTime):
+
+    # Imported here, the sharding module imports this one
+    import UnrealExporter.sharding
+
+    staticChannels = []
+
+    if SELECTIVE_BAKE:
+
+        nodes, staticChannels = UnrealExporter.drivers.splitChannels(nodes)
+
+    if not nodes:
+
+        pass
+
+    elif BAKE_SHARD_FRAMES and endTime - startTime + 1 > BAKE_SHARD_FRAMES:
+
+        UnrealExporter.sharding.bakeSharded(nodes, startTime, endTime, BAKE_SHARD_FRAMES, workers = BAKE_SHARD_WORKERS,
+                                            preRoll = BAKE_SHARD_PRE_ROLL)
+
+    else:
+
+        bakeThis(nodes, time = (startTime, endTime), **BAKE_OPTIONS)
+
+    # Static channels are baked after the driven ones, baking replaces a channel's inputs
+    # A one frame bake evaluates the scene once and leaves a single key
+    if staticChannels:
+
+        bakeThis(staticChannels, time = (startTime, startTime), **BAKE_OPTIONS)
+
 # Properly will bake an object with properly keyword arguments
 # This will also do a process to make the baking faster, then resets it
+# Inside a running bake context, the fast configuration is already set
+@UnrealExporter.tracer.traced("bake", UnrealExporter.tracer.describeNodes)
 def bakeThis(obj, **kwargs):
 
     # Maya is particular about how baking is done
@@ -16,11 +156,9 @@ def bakeThis(obj, **kwargs):
 
         obj = pymel.core.selected()
 
-    prepBake()
+    with UnrealExporter.bakeContext.getBakeContext():
 
-    pymel.core.bakeResults(obj, **kwargs)
-
-    resetBake()
+        pymel.core.bakeResults(obj, **kwargs)
 
 # Create locator and give it a name
 def createLocator(name):
@@ -29,20 +167,97 @@ def createLocator(name):
 
     return loc
 
+# Deletes everything under a node that is not of the given node type
+# The nodes to remove are found with one bulk query and deleted with one delete, nodes under a deleted node go with it
+@UnrealExporter.tracer.traced("hierarchyCleanup")
 def deleteChildrenNodeType(srcNode, nodeType):
 
-    for node in pymel.core.listRelatives(srcNode, ad = True):
+    backend = UnrealExporter.backend.getBackend()
+
+    srcPath = srcNode.longName()
+
+    paths, nodeTypes, referenced = backend.listDescendants(srcPath)
+
+    # Node types by full path, the node's own for its children
+    parentTypes = dict(zip(paths, nodeTypes))
+    parentTypes[srcPath] = srcNode.type()
+
+    # Inherited types are looked up once per type
+    inheritedTypes = {}
+
+    removed = set()
+
+    deleted = []
+    unparented = []
+
+    # Sorted full paths put every node after its parent
+    for path, pathType in sorted(zip(paths, nodeTypes)):
+
+        parentPath = path.rpartition("|")[0]
+
+        # Already gone with its parent
+        if parentPath in removed:
+
+            removed.add(path)
+
+            continue
+
+        if pathType == nodeType:
+
+            continue
+
+        # Referenced nodes can't be deleted, transactional exports and exports with setImportReferences(False) keep the reference,
+        # so those are moved out from under the node instead
+        if path in referenced:
+
+            if pathType not in inheritedTypes:
+
+                inheritedTypes[pathType] = backend.getInheritedTypes(pathType)
+
+            if parentTypes.get(parentPath) == nodeType and "transform" in inheritedTypes[pathType]:
+
+                unparented.append(path)
+
+            continue
+
+        removed.add(path)
+        deleted.append(path)
+
+    # Delete before moving, the paths change once nodes are moved
+    if deleted:
+
+        pymel.core.delete(deleted)
+
+    if unparented:
 
-        if node.type() != nodeType:
+        pymel.core.parent(unparented, world = True)
 
-            pymel.core.delete(node)
+# Euler Filters anim curves on the given objects
+# If no objects are given, the selected objects are used
+# With NumPy every rotation curve is filtered in one vectorized pass, see UnrealExporter.curves
+@UnrealExporter.tracer.traced("eulerFilter", UnrealExporter.tracer.describeNodes)
+def eulerFilter(nodes = None):
 
-# Euler Filters anim curves on selected objects
-def eulerFilter():
+    if nodes is None:
 
-    selected = pymel.core.selected()
+        nodes = pymel.core.selected()
 
-    for item in selected:
+    try:
+
+        import numpy
+
+    except ImportError:
+
+        numpy = None
+
+    if numpy is not None:
+
+        UnrealExporter.curves.eulerFilter(nodes)
+
+        return
+
+    # Without NumPy, filter each object's curves in Maya
+    for item in nodes:
 
         animCrvs = item.listConnections(type = "animCurve")
 
@@ -53,6 +268,50 @@ def getEndTime():
 
     return pymel.core.playbackOptions(q = True, maxTime = True)
 
+# Gets the frame range to bake and export nodes over, as (startTime, endTime)
+# The set bake range if there is one, else the range the keys upstream of the nodes move over, with handles, when the auto range is on,
+# kept within the playback range, else the playback range
+# getNodes is only called for the nodes when the auto range needs them
+def getBakeRange(getNodes):
+
+    if BAKE_RANGE is not None:
+
+        return BAKE_RANGE
+
+    startTime = getStartTime()
+    endTime = getEndTime()
+
+    if AUTO_BAKE_RANGE_HANDLES is None:
+
+        return startTime, endTime
+
+    keyRange = UnrealExporter.keyRange.getKeyRange(getNodes(), startTime)
+
+    # Animation without keys to go by uses the playback range
+    if keyRange is None:
+
+        return startTime, endTime
+
+    return UnrealExporter.keyRange.clampRange(keyRange, AUTO_BAKE_RANGE_HANDLES, startTime, endTime)
+
+# Gets the options of an export profile
+def getExportProfile(name):
+
+    if name not in EXPORT_PROFILES:
+
+        pymel.core.error("Unknown export profile: %s" % name)
+
+    return EXPORT_PROFILES[name]
+
+# Gets the namespace of a node name, with the trailing ":" like PyNode.namespace()
+def getNamespace(name):
+
+    if ":" not in name:
+
+        return ""
+
+    return name.rpartition(":")[0] + ":"
+
 # Get the shape of the transform
 def getShape(item):
 
@@ -70,19 +329,75 @@ def getStartTime():
 
     return pymel.core.playbackOptions(q = True, minTime = True)
 
+# Forgets which fbx options the FBX plugin has, the next export sends all of them
+# Needed when something besides the exporter sets them, like the FBX export dialog
+def invalidateExportOptions():
+
+    UnrealExporter.fbxOptions.getOptionState().invalidate()
+
+# Loads export profiles from a json or yaml file, see UnrealExporter.fbxOptions.loadProfileFile for the layout
+# Options in the file override the ones of the profile with the same name, or of the profile it extends
+def loadExportProfiles(profileFilePath):
+
+    global EXPORT_PROFILES
+
+    # Build the profiles on the side, a bad file leaves the ones in use alone
+    profiles = dict(EXPORT_PROFILES)
+
+    for name, (extends, options) in UnrealExporter.fbxOptions.loadProfileFile(profileFilePath).items():
+
+        if extends is not None and extends not in profiles:
+
+            pymel.core.error("Export profile %s extends an unknown profile: %s" % (name, extends))
+
+        base = profiles[extends] if extends is not None else profiles.get(name, ())
+
+        # Overridden options keep their place, new ones go on the end
+        overrides = dict(options)
+
+        merged = [(command, overrides.pop(command, value)) for command, value in base]
+        merged.extend((command, value) for command, value in options if command in overrides)
+
+        profiles[name] = tuple(merged)
+
+    EXPORT_PROFILES = profiles
+
 # Loads the fbx plugin for maya
+# A plugin that was just loaded has its default options
 def loadFBXPlugin():
 
     pymel.core.loadPlugin('fbxmaya.mll', quiet = True)
 
+    invalidateExportOptions()
+
 # Make the baking faster
+# Enters the shared bake context, resetBake exits it
 def prepBake():
 
-    # Change evaluation mode to DG for faster baking
-    pymel.core.evaluationManager(mode = "off")
-    
-    # Change the visibility of the viewport
-    pymel.core.mel.eval("paneLayout -e -manage false $gMainPane")
+    UnrealExporter.bakeContext.getBakeContext().enter()
+
+# Reduces the baked keys on the given nodes when key reduction is on
+# Returns the reduction report, or None when key reduction is off
+def reduceKeys(nodes):
+
+    if KEY_REDUCTION_TOLERANCES is None:
+
+        return None
+
+    # Check NumPy is there before anything is read, the reduction module imports it where it is used
+    try:
+
+        import numpy
+
+    except ImportError:
+
+        numpy = None
+
+    if numpy is None:
+
+        pymel.core.error("Key reduction needs NumPy, turn it off with setKeyReduction(None)")
+
+    return UnrealExporter.reduction.reduceCurves(nodes, KEY_REDUCTION_TOLERANCES)
 
 # Reopen the scene post export
 def reopenScene():
@@ -91,61 +406,173 @@ def reopenScene():
 
     pymel.core.openFile(scene, f = True)
 
+# Gets the fbx options that are actually sent for an option set
+# With key reduction on the FBX plugin must not resample the reduced curves on every frame
+def resolveExportOptions(options):
+
+    if KEY_REDUCTION_TOLERANCES is None:
+
+        return tuple(options)
+
+    return tuple((command, False if command == "FBXExportBakeComplexAnimation" else value) for command, value in options)
+
+# Puts the default export profiles back
+def resetExportProfiles():
+
+    global EXPORT_PROFILES
+
+    EXPORT_PROFILES = dict(DEFAULT_EXPORT_PROFILES)
+
 # Resets back after bake
+# The evaluation mode and viewport go back to what they were before prepBake
 def resetBake():
 
-    # Change evaluation mode back to original
-    pymel.core.evaluationManager(mode = "parallel")
+    UnrealExporter.bakeContext.getBakeContext().exit()
 
-    # Change the visibility of the viewport back
-    pymel.core.mel.eval("paneLayout -e -manage true $gMainPane")
+# Turns sharded baking on, with this many frames per shard, or off when shardFrames is None
+# Simulations and expressions that keep state between frames need preRoll None, or no sharding at all
+def setBakeSharding(shardFrames, workers = 4, preRoll = 0):
+
+    global BAKE_SHARD_FRAMES, BAKE_SHARD_WORKERS, BAKE_SHARD_PRE_ROLL
+
+    BAKE_SHARD_FRAMES = shardFrames
+    BAKE_SHARD_WORKERS = workers
+    BAKE_SHARD_PRE_ROLL = preRoll
 
 # Set animation export options
 def setAnimExportOptions():
 
-    # Bake Complex and Shapes is needed for Blendshapes
-    # Skins are needed for actual animation
-    # Constraints have crashed, make sure they are false
-    pymel.core.mel.FBXExportBakeComplexAnimation(v = True)
-    pymel.core.mel.FBXExportShapes(v = True)
-    pymel.core.mel.FBXExportSkins(v = True)
-    pymel.core.mel.FBXExportConstraints(v = False)
+    setExportOptions(ANIM_EXPORT_OPTIONS)
 
 # Set camera export options
 def setCamExportOptions():
 
-    # Bake Complex and Camera is needed for Camera
-    # Constraints have crashed, make sure they are false
-    pymel.core.mel.FBXExportCameras(v = True)
-    pymel.core.mel.FBXExportBakeComplexAnimation(v = True)
-    pymel.core.mel.FBXExportConstraints(v = False)
+    setExportOptions(CAM_EXPORT_OPTIONS)
+
+# Sends a set of fbx options to the FBX plugin
+# Only options that differ from what the plugin already has are sent
+def setExportOptions(options):
+
+    UnrealExporter.fbxOptions.getOptionState().apply(resolveExportOptions(options))
+
+# Sends the options of an export profile to the FBX plugin
+def setExportProfile(name):
+
+    setExportOptions(getExportProfile(name))
 
 # Set general fbx options
 def setGeneralExportOptions():
 
-    # Get general options for exporting to Unreal
-    # For less data space, export in ascii is false
-    # Up Axis Z
-    # Make not not just animation
-    
-    pymel.core.mel.FBXExportInAscii(v = False)
-    pymel.core.mel.FBXExportUpAxis("z")
-    pymel.core.mel.FBXExportAnimationOnly(v = False)
+    setExportOptions(GENERAL_EXPORT_OPTIONS)
+
+# Turns importing references before skeletal and static exports on or off
+# Left referenced, only the exported nodes are touched, and the export's changes are held as reference edits until the scene is reopened
+def setImportReferences(enabled):
+
+    global IMPORT_REFERENCES
+
+    IMPORT_REFERENCES = enabled
+
+# Turns stripping joints that don't influence the exported meshes on with the given weight tolerance, or off when tolerance is None
+# True uses the default tolerance
+def setJointStripping(tolerance):
+
+    global JOINT_STRIP_TOLERANCE
+
+    if tolerance is None or tolerance is False:
+
+        JOINT_STRIP_TOLERANCE = None
+
+    elif tolerance is True:
+
+        JOINT_STRIP_TOLERANCE = UnrealExporter.skeleton.DEFAULT_WEIGHT_TOLERANCE
+
+    else:
+
+        JOINT_STRIP_TOLERANCE = tolerance
+
+# Turns key reduction after baking on with the given tolerances by channel group, or off when tolerances is None
+# True or an empty dict use the default tolerances, groups left out of a dict use theirs
+def setKeyReduction(tolerances):
+
+    global KEY_REDUCTION_TOLERANCES
+
+    if tolerances is None or tolerances is False:
+
+        KEY_REDUCTION_TOLERANCES = None
+
+        return
+
+    groupTolerances = dict(UnrealExporter.reduction.DEFAULT_TOLERANCES)
+
+    if isinstance(tolerances, dict):
+
+        unknown = [group for group in tolerances if group not in groupTolerances]
+
+        if unknown:
+
+            pymel.core.error("Unknown key reduction channel groups: %s" % ", ".join(sorted(unknown)))
+
+        groupTolerances.update(tolerances)
+
+    KEY_REDUCTION_TOLERANCES = groupTolerances
+
+# Turns the auto bake range on with the given handles in frames, or off when handles is None
+# True uses no handles
+def setAutoBakeRange(handles):
+
+    global AUTO_BAKE_RANGE_HANDLES
+
+    if handles is None or handles is False:
+
+        AUTO_BAKE_RANGE_HANDLES = None
+
+    elif handles is True:
+
+        AUTO_BAKE_RANGE_HANDLES = 0
+
+    else:
+
+        AUTO_BAKE_RANGE_HANDLES = handles
+
+# Sets the frame range every asset is baked and exported over, as (startTime, endTime), None goes back to the playback or auto range
+def setBakeRange(frameRange):
+
+    global BAKE_RANGE
+
+    if frameRange is not None and frameRange[1] < frameRange[0]:
+
+        pymel.core.error("Bake range ends before it starts: %s to %s" % tuple(frameRange))
+
+    BAKE_RANGE = tuple(frameRange) if frameRange is not None else None
+
+# Sets the frame range the FBX plugin resamples animation over
+def setExportRange(frameRange):
+
+    setExportOptions((("FBXExportBakeComplexStart", frameRange[0]), ("FBXExportBakeComplexEnd", frameRange[1])))
+
+# Turns selective baking on or off
+# Selective bakes only sample the channels that animation, expressions, constraints or simulations drive
+def setSelectiveBake(enabled):
+
+    global SELECTIVE_BAKE
+
+    SELECTIVE_BAKE = enabled
+
+# Turns transactional exports on or off
+# Transactional exports leave the scene as it was, without reopening the file
+def setTransactionalExport(enabled):
+
+    global TRANSACTIONAL_EXPORT
+
+    TRANSACTIONAL_EXPORT = enabled
 
 # Set mesh export options
 def setMeshExportOptions():
 
-    # Triangulate on Export speeds up Unreal import time
-    # Smooth Mesh and Smoothing Groups for models
-
-    pymel.core.mel.FBXExportSmoothMesh(v = True)
-    pymel.core.mel.FBXExportTriangulate(v = True)
-    pymel.core.mel.FBXExportTangents(v = True)
-    pymel.core.mel.FBXExportSmoothingGroups(v = True)
+    setExportOptions(MESH_EXPORT_OPTIONS)
 
 # Set texture export options
 def setTextureExportOptions():
 
-    # Embedded the textures into the fbx file on import
-
-    pymel.core.mel.FBXExportEmbeddedTextures(v = True)
\ No newline at end of file
+    setExportOptions(TEXTURE_EXPORT_OPTIONS)
@@ -0,0 +1,173 @@
+'''
+The validation module of the UnrealExporter package
+'''
+
+# Import statements
+import os
+
+# Import batch, sceneIndex, tracer, utils and ueAsset modules from UnrealExporter package
+import UnrealExporter.batch
+import UnrealExporter.sceneIndex
+import UnrealExporter.tracer
+import UnrealExporter.utils
+import UnrealExporter.ueAsset
+
+# Issue severities
+# An error means the export would fail or come out wrong, a warning means part of the asset is left out
+ERROR = "error"
+WARNING = "warning"
+
+# Creates an issue for the validation report
+def createIssue(asset, severity, message):
+
+    return {"asset" : str(asset.node),
+            "severity" : severity,
+            "message" : message}
+
+# Formats a validation report for printing, errors first
+def formatIssues(issues):
+
+    issues = sorted(issues, key = lambda issue: issue["severity"] != ERROR)
+
+    return "\n".join("%-8s %-30s %s" % (issue["severity"], issue["asset"], issue["message"]) for issue in issues)
+
+# Gets the errors in a validation report
+def getErrors(issues):
+
+    return [issue for issue in issues if issue["severity"] == ERROR]
+
+# Validates an asset before any of it is baked or exported, returns every issue found
+# The asset's elements are found through its cached attributes, so the export reuses them instead of looking them up again
+# Only geometry the export leaves out is queried again, to say why
+# If no export type is given, the default for the asset class is used
+@UnrealExporter.tracer.traced("validate", UnrealExporter.tracer.describeAsset)
+def validateAsset(asset, exportType = None):
+
+    if exportType is None:
+
+        exportType = UnrealExporter.batch.getDefaultExportType(asset)
+
+    issues = []
+
+    # The export file
+    exportFilePath = getattr(asset, "exportFilePath", None)
+
+    if not exportFilePath:
+
+        issues.append(createIssue(asset, ERROR, "No export file set"))
+
+    elif not exportFilePath.lower().endswith(".fbx"):
+
+        issues.append(createIssue(asset, WARNING, "Export file doesn't end in .fbx: " + exportFilePath))
+
+    # The asset's own elements
+    if isinstance(asset, UnrealExporter.ueAsset.SkeletalMesh):
+
+        issues.extend(validateSkeletalMesh(asset))
+
+    elif isinstance(asset, UnrealExporter.ueAsset.StaticMesh):
+
+        issues.extend(validateStaticMesh(asset))
+
+    elif isinstance(asset, UnrealExporter.ueAsset.Camera):
+
+        if asset.objShape is None or asset.objShape.type() != "camera":
+
+            issues.append(createIssue(asset, ERROR, "No camera shape found for Camera Asset"))
+
+    # The frame range baked exports are baked over, the auto range walks the asset's elements, so only once they check out
+    if exportType in UnrealExporter.batch.BAKED_TYPES and not getErrors(issues):
+
+        try:
+
+            startTime, endTime = asset.frameRange
+
+        except Exception as e:
+
+            issues.append(createIssue(asset, ERROR, "Frame range could not be found: %s" % e))
+
+        else:
+
+            if endTime < startTime:
+
+                issues.append(createIssue(asset, ERROR, "Frame range ends before it starts: %s to %s" % (startTime, endTime)))
+
+    return issues
+
+# Validates the skins, meshes and skeleton of a skeletal mesh
+def validateSkeletalMesh(asset):
+
+    issues = []
+
+    # Skins and joints are found by namespace
+    if not asset.namespace:
+
+        issues.append(createIssue(asset, WARNING, "No namespace, skins and joints are looked up in the whole scene"))
+
+    if not asset.skins:
+
+        issues.append(createIssue(asset, ERROR, "No skinClusters found for Skeletal Mesh Asset"))
+
+        return issues
+
+    # The export only takes visible meshes, the ones it finds are kept for it
+    meshes = set(asset.geometry)
+
+    # Say why any other skinned geometry is left out
+    for defMesh in asset.skinnedGeometry:
+
+        if defMesh in meshes:
+
+            continue
+
+        if defMesh.type() != "mesh":
+
+            issues.append(createIssue(asset, WARNING, "Skinned %s %s is not a mesh and is left out" % (defMesh.type(), defMesh)))
+
+        else:
+
+            issues.append(createIssue(asset, WARNING, "Skinned mesh %s is hidden and is left out" % defMesh))
+
+    if not meshes:
+
+        issues.append(createIssue(asset, ERROR, "No visible skinned meshes found for Skeletal Mesh Asset"))
+
+    # The skeleton is every joint in the namespace that influences a skin
+    joints = UnrealExporter.sceneIndex.listNodeNames(asset.namespace, "joint")
+
+    if not any(joint in asset.influences for joint in joints):
+
+        issues.append(createIssue(asset, ERROR, "No Skeleton/Bones found for Skeletal Mesh Asset"))
+
+    # Joints are stripped by the bone map file when one is set
+    if asset.boneMapFilePath is not None and not os.path.isfile(asset.boneMapFilePath):
+
+        issues.append(createIssue(asset, ERROR, "Bone map file not found: " + asset.boneMapFilePath))
+
+    return issues
+
+# Validates the meshes of a static mesh
+def validateStaticMesh(asset):
+
+    issues = []
+
+    # Without a namespace the asset's own shape is the mesh
+    if not asset.namespace:
+
+        if asset.objShape is None or asset.objShape.type() != "mesh":
+
+            issues.append(createIssue(asset, ERROR, "No mesh shape found for Static Mesh Asset"))
+
+        return issues
+
+    if not asset.geometry:
+
+        issues.append(createIssue(asset, ERROR, "No meshes found in namespace " + asset.namespace))
+
+    for mesh in asset.geometry:
+
+        if not mesh.isVisible():
+
+            issues.append(createIssue(asset, WARNING, "Mesh %s is hidden and is still exported" % mesh))
+
+    return issues
@@ -0,0 +1,93 @@
+'''
+Benchmarks the scene backend against PyMEL node queries on the stand-in scene
+
+Lists every node with its type once through PyNodes and once through the backend's bulk string query,
+times a scene index build and checkAnimation, with the calls each makes into the scene
+
+Usage: python benchmarks/benchBackend.py [characters] [joints] [controlDepth]
+'''
+
+# Import statements
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import pymel.core
+
+import ueExport
+import UnrealExporter.backend
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+# Builds the shot
+def buildScene(characters, joints, controlDepth):
+
+    standin.newScene(1, 100)
+
+    for i in range(characters):
+
+        standin.createCharacter("char%d" % i, joints = joints, meshes = 2, targets = 2, constraints = 1,
+                                controlDepth = controlDepth, controlWidth = 2)
+
+    standin.createCamera("shotCam")
+    standin.createStaticMesh("crate", namespace = "prop")
+
+    UnrealExporter.sceneIndex.invalidate()
+
+# Times a function and counts the calls it made into the scene
+def timeCalls(label, func):
+
+    standin.calls.clear()
+
+    start = time.time()
+
+    result = func()
+
+    elapsed = time.time() - start
+
+    print("%-16s %8.4fs calls=%d" % (label, elapsed, sum(standin.calls.values())))
+
+    return result
+
+# Lists every node with its type through PyNodes
+def listPyNodeTypes():
+
+    nodes = pymel.core.ls()
+
+    return [node.name() for node in nodes], [node.type() for node in nodes]
+
+def main(argv):
+
+    characters = int(argv[0]) if len(argv) > 0 else 10
+    joints = int(argv[1]) if len(argv) > 1 else 60
+    controlDepth = int(argv[2]) if len(argv) > 2 else 20
+
+    buildScene(characters, joints, controlDepth)
+
+    backend = UnrealExporter.backend.getBackend()
+
+    pyNodeTypes = timeCalls("pymel ls", listPyNodeTypes)
+    backendTypes = timeCalls("backend ls", backend.listNodeTypes)
+
+    print("same nodes=%s nodes=%d" % (pyNodeTypes == backendTypes, len(backendTypes[0])))
+
+    timeCalls("index build", lambda: UnrealExporter.sceneIndex.getSceneIndex().build())
+
+    asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("char0:main_ctrl"))
+
+    # Build the hierarchy snapshot first, it is shared by the whole export
+    UnrealExporter.sceneIndex.getHierarchy()
+
+    isAnimated = timeCalls("checkAnimation", lambda: ueExport.checkAnimation(asset))
+
+    print("animated=%s" % isAnimated)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
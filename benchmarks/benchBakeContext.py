@@ -0,0 +1,99 @@
+'''
+Benchmarks evaluation mode switching around bakes on the stand-in scene
+
+Exports a shot's characters one at a time and as one batch, starting from a serial evaluation mode,
+and reports the switches made, the ones the bake context saved, and if the user's mode and viewport came back
+
+Usage: python benchmarks/benchBakeContext.py [characters] [joints] [frames]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.bakeContext
+import UnrealExporter.batch
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+# Builds the shot with the user's evaluation mode set, returns the assets
+def buildScene(characters, joints, frames):
+
+    standin.newScene(1, frames)
+
+    for i in range(characters):
+
+        standin.createCharacter("hero%d" % i, joints = joints, meshes = 1, constraints = 1)
+
+    standin.createCamera("shotCam")
+
+    standin.evaluationManager(mode = "serial")
+    standin.scene.evaluationSwitches = 0
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    assets = [UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero%d:main_ctrl" % i)) for i in range(characters)]
+    assets.append(UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam")))
+
+    return assets
+
+# Exports the assets one at a time or as a batch and reports the switches
+def run(outDir, label, characters, joints, frames):
+
+
+    assets = buildScene(characters, joints, frames)
+
+    context = UnrealExporter.bakeContext.getBakeContext()
+    context.resetCounts()
+
+    for i, asset in enumerate(assets):
+
+        asset.setFileName(os.path.join(outDir, "%s%d.fbx" % (label, i)))
+
+    start = time.time()
+
+    if label == "batch":
+
+        UnrealExporter.batch.BatchExporter(assets).export()
+
+    else:
+
+        for asset in assets:
+
+            asset.exportAnimation()
+
+    elapsed = time.time() - start
+
+    print("%-10s assets=%-4d bakes=%-4d switches=%-4d saved=%-4d mode restored=%s viewport restored=%s %.3fs" % (
+            label, len(assets), standin.scene.bakeCalls, standin.scene.evaluationSwitches, context.savedSwitches,
+            standin.scene.evaluationMode == "serial", standin.scene.paneManaged, elapsed))
+
+def main(argv):
+
+    characters = int(argv[0]) if len(argv) > 0 else 10
+    joints = int(argv[1]) if len(argv) > 1 else 30
+    frames = int(argv[2]) if len(argv) > 2 else 100
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        run(outDir, "per-asset", characters, joints, frames)
+        run(outDir, "batch", characters, joints, frames)
+
+    finally:
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
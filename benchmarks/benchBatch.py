@@ -0,0 +1,110 @@
+'''
+Benchmarks per-asset exports against a BatchExporter on the stand-in scene
+
+Usage: python benchmarks/benchBatch.py [characters] [cameras] [frames]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.batch
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+# Builds the shot and returns the assets in it
+def buildShot(characters, cameras, frames):
+
+    standin.newScene(1, frames)
+
+    assets = []
+
+    # Build the whole shot first, the stand-in has no callbacks to invalidate the index
+    for i in range(characters):
+
+        standin.createCharacter("char%d" % i, joints = 60, meshes = 2, targets = 4, constraints = 1)
+
+    for i in range(cameras):
+
+        standin.createCamera("shotCam%d" % i)
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    for i in range(characters):
+
+        ctrl = standin.PyNode("char%d:main_ctrl" % i)
+
+        assets.append(UnrealExporter.ueAsset.SkeletalMesh(ctrl))
+
+    for i in range(cameras):
+
+        cam = standin.PyNode("shotCam%d" % i)
+
+        assets.append(UnrealExporter.ueAsset.Camera(cam))
+
+    return assets
+
+# Runs one export mode and reports bake calls, evaluated frames and time
+def run(label, characters, cameras, frames, exportFunc):
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        assets = buildShot(characters, cameras, frames)
+
+        for i, asset in enumerate(assets):
+
+            asset.setFileName(os.path.join(outDir, "asset%d.fbx" % i))
+
+        start = time.time()
+
+        exportFunc(assets)
+
+        elapsed = time.time() - start
+
+    finally:
+
+        shutil.rmtree(outDir)
+
+    scene = standin.scene
+
+    print("%-10s assets=%-4d bakes=%-4d frames evaluated=%-8d %.3fs" % (label,
+                                                                    len(assets),
+                                                                    scene.bakeCalls,
+                                                                    scene.evaluatedFrames,
+                                                                    elapsed))
+
+# Exports each asset on its own
+def exportSerial(assets):
+
+    for asset in assets:
+
+        asset.exportAnimation()
+
+# Exports every asset through one batch
+def exportBatch(assets):
+
+    UnrealExporter.batch.BatchExporter(assets).export()
+
+def main(argv):
+
+    characters = int(argv[0]) if len(argv) > 0 else 20
+    cameras = int(argv[1]) if len(argv) > 1 else 5
+    frames = int(argv[2]) if len(argv) > 2 else 100
+
+    run("serial", characters, cameras, frames, exportSerial)
+    run("batch", characters, cameras, frames, exportBatch)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,132 @@
+'''
+Counts the calls each kind of export makes into the stand-in scene, by function and by call site
+
+Prints the top offenders of every export, and fails when an export goes over the call budget,
+so a change that adds round trips is caught by the benchmark run
+
+Usage: python benchmarks/benchCalls.py [characters] [frames] [budget] [function=budget ...]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.batch
+import UnrealExporter.callCounter
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+# Builds the shot
+def buildScene(characters, frames):
+
+    standin.newScene(1, frames)
+
+    for i in range(characters):
+
+        standin.createCharacter("char%d" % i, joints = 30, meshes = 2, targets = 2, constraints = 1)
+
+    standin.createCamera("shotCam")
+    standin.createStaticMesh("crate", namespace = "prop")
+
+    UnrealExporter.sceneIndex.invalidate()
+
+# Gets every kind of export, as (label, asset, export type)
+def getExports():
+
+
+    exports = [("animation", UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("char0:main_ctrl")), UnrealExporter.batch.ANIMATION),
+                ("skeleton", UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("char0:main_ctrl")), UnrealExporter.batch.SKELETON),
+                ("camera", UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam")), UnrealExporter.batch.ANIMATION),
+                ("static", UnrealExporter.ueAsset.StaticMesh(standin.PyNode("prop:crate")), UnrealExporter.batch.MESH)]
+
+    return exports
+
+# Exports one asset through a batch of its own, counting its calls
+def runExport(outDir, counter, label, asset, exportType):
+
+    asset.setFileName(os.path.join(outDir, label + ".fbx"))
+
+    with counter.measure(label) as measure:
+
+        batch = UnrealExporter.batch.BatchExporter()
+        batch.addAsset(asset, exportType)
+        batch.export()
+
+    print(UnrealExporter.callCounter.formatReport(measure.report, top = 5))
+
+# Exports every character in one batch, counting its calls
+def runBatch(outDir, counter, characters):
+
+
+    batch = UnrealExporter.batch.BatchExporter()
+
+    for i in range(characters):
+
+        asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("char%d:main_ctrl" % i))
+        asset.setFileName(os.path.join(outDir, "batch%d.fbx" % i))
+
+        batch.addAsset(asset)
+
+    with counter.measure("batch of %d" % characters) as measure:
+
+        batch.export()
+
+    print(UnrealExporter.callCounter.formatReport(measure.report, top = 5))
+
+def main(argv):
+
+    characters = int(argv[0]) if len(argv) > 0 else 5
+    frames = int(argv[1]) if len(argv) > 1 else 100
+    budget = int(argv[2]) if len(argv) > 2 else None
+
+    # Budgets for single functions, like listConnections=200
+    functionBudgets = dict((entry.split("=")[0], int(entry.split("=")[1])) for entry in argv[3:])
+
+    counter = UnrealExporter.callCounter.CallCounter(budget = budget, functionBudgets = functionBudgets)
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        # Every export starts from a fresh scene, exports change it
+        for index in range(4):
+
+            buildScene(characters, frames)
+
+            label, asset, exportType = getExports()[index]
+
+            runExport(outDir, counter, label, asset, exportType)
+
+        buildScene(characters, frames)
+
+        runBatch(outDir, counter, characters)
+
+    finally:
+
+        shutil.rmtree(outDir)
+
+    try:
+
+        counter.checkBudgets()
+
+    except Exception as e:
+
+        print(str(e))
+
+        return 1
+
+    print("within budget=True")
+
+    return 0
+
+if __name__ == "__main__":
+
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,166 @@
+'''
+Benchmarks the analytic camera conversion
+
+Converts synthetic world matrices, gimbal locked frames and non-uniform scale included, and checks the Unreal ready
+rotations rebuild the same matrices, then exports a scaled camera with an off-center pivot flying under an animated parent
+in the stand-in scene and checks the export camera sits on the source's pivot, turned like it, on every frame
+
+Usage: python benchmarks/benchCamera.py [frames]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import numpy
+
+import UnrealExporter.cameras
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+# Builds world matrices that convert to known translations and rotations
+# Returns the matrices and the flat matrices the conversion should rebuild, without scale
+def buildMatrices(frames):
+
+
+    rng = numpy.random.RandomState(1)
+
+    translate = rng.uniform(-1000.0, 1000.0, (frames, 3))
+    rotate = rng.uniform(-180.0, 180.0, (frames, 3))
+    rotate[:, 1] *= 0.5
+    scale = rng.uniform(0.5, 2.0, (frames, 3))
+
+    # Every tenth frame looks straight up or down
+    rotate[::10, 1] = numpy.where(numpy.arange(0, frames, 10) % 20, 90.0, -90.0)
+
+    # Undo the offset the conversion puts back, scale is on the camera itself so it goes before
+    inverseOffset = standin.composeMatrix((0.0, 0.0, 0.0), (0.0, -UnrealExporter.cameras.OFFSET_ROTATE_Y, 0.0))
+
+    matrices = [standin.multiplyMatrices(standin.composeMatrix((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), s),
+                                            standin.multiplyMatrices(inverseOffset, standin.composeMatrix(t, r)))
+                    for t, r, s in zip(translate, rotate, scale)]
+
+    expected = [standin.composeMatrix(t, r) for t, r in zip(translate, rotate)]
+
+    return matrices, numpy.array(expected)
+
+# Converts synthetic matrices both ways and checks they rebuild the expected matrices
+def runArrays(frames):
+
+
+    matrices, expected = buildMatrices(frames)
+
+    start = time.time()
+
+    translate, rotate = UnrealExporter.cameras.convertMatrices(matrices)
+
+    vectorTime = time.time() - start
+
+    start = time.time()
+
+    converted = [UnrealExporter.cameras.convertMatrix(matrix) for matrix in matrices]
+
+    loopTime = time.time() - start
+
+    vectorMatrices = numpy.array([standin.composeMatrix(t, r) for t, r in zip(translate.T, rotate.T)])
+    loopMatrices = numpy.array([standin.composeMatrix(t, r) for t, r in converted])
+
+    # Filtered rotations stay within 180 degrees of the frame before
+    smooth = numpy.all(numpy.abs(numpy.diff(rotate, axis = 1)) <= 180.0)
+
+    print("arrays   frames=%-7d vectorized=%.4fs per-frame=%.4fs vectorized matches=%s per-frame matches=%s filtered=%s" % (
+            frames, vectorTime, loopTime,
+            numpy.allclose(vectorMatrices, expected, atol = 1e-6),
+            numpy.allclose(loopMatrices, expected, atol = 1e-6),
+            smooth))
+
+# Exports a camera under an animated parent and checks the export camera follows it
+def runScene(frames):
+
+    standin.newScene(1, frames)
+
+    rig = standin.group(name = "camRig")
+    rig.motion["ry"] = [30.0, 0.0, 20.0, 150.0]
+    rig.motion["tx"] = [0.0, 0.0, 100.0, 300.0]
+
+    camera = standin.createCamera("shotCam")
+    camera.setParent(rig)
+
+    # Non-uniform scale and a pivot away from the camera's origin
+    camera.attrs["sy"] = 2.0
+    camera.attrs["rotatePivot"] = [(5.0, -3.0, 12.0)]
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    asset = UnrealExporter.ueAsset.Camera(camera)
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        asset.setFileName(os.path.join(outDir, "shotCam.fbx"))
+
+        nodeCount = len(standin.scene.nodes)
+
+        standin.calls.clear()
+
+        start = time.time()
+
+        asset.exportAnimation()
+
+        elapsed = time.time() - start
+
+    finally:
+
+        shutil.rmtree(outDir)
+
+    calls = sum(standin.calls.values())
+
+    # Nodes added besides the export camera and its curves
+    helpers = len([node for node in list(standin.scene.nodes.values())[nodeCount:]
+                    if not standin.isType(node._type, "animCurve") and node not in (asset.camExport, asset.camExport.getShape())])
+
+    # The export camera on frame f - start matches the source camera turned by the offset on frame f, without scale,
+    # and sits on the source's pivot
+    offset = numpy.array(standin.composeMatrix((0.0, 0.0, 0.0), (0.0, UnrealExporter.cameras.OFFSET_ROTATE_Y, 0.0))).reshape(4, 4)
+    pivot = numpy.array(list(camera.attrs["rotatePivot"][0]) + [1.0])
+
+    worst = 0.0
+    lensWorst = 0.0
+
+    for frame in range(1, frames + 1):
+
+        world = numpy.array(camera._evaluate("worldMatrix", frame)).reshape(4, 4)
+
+        source = numpy.identity(4)
+        source[:3, :3] = numpy.matmul(offset[:3, :3], world[:3, :3] / numpy.linalg.norm(world[:3, :3], axis = 1)[:, numpy.newaxis])
+        source[3] = numpy.matmul(pivot, world)
+        exported = numpy.array(asset.camExport._evaluate("worldMatrix", frame - 1)).reshape(4, 4)
+
+        worst = max(worst, numpy.abs(source - exported).max())
+
+        lensWorst = max(lensWorst, abs(camera.getShape()._evaluate("focalLength", frame) -
+                                        asset.camExport.getShape()._evaluate("focalLength", frame - 1)))
+
+    print("scene    frames=%-7d bakes=%d evaluated frames=%d helper nodes=%d calls=%-6d %.4fs worst matrix error=%.2g lens error=%.2g" % (
+            frames, standin.scene.bakeCalls, standin.scene.evaluatedFrames, helpers, calls, elapsed, worst, lensWorst))
+
+def main(argv):
+
+    frames = int(argv[0]) if len(argv) > 0 else 2000
+
+    runArrays(frames * 10)
+    runScene(frames)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
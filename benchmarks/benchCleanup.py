@@ -0,0 +1,114 @@
+'''
+Benchmarks the hierarchy cleanup under an exported root on the stand-in scene,
+comparing the old per-node type query and delete against one bulk query and one delete
+
+Every joint carries constraints and locators, some nested and some from the reference,
+checks both cleanups leave the same scene
+
+Usage: python benchmarks/benchCleanup.py [joints] [helpers] [nested]
+'''
+
+# Import statements
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.transaction
+import UnrealExporter.utils
+
+# Builds a skeleton whose joints carry helper nodes, returns the root
+def buildRig(joints, helpers, nested):
+
+    standin.newScene()
+
+    standin.createCharacter("hero", joints = joints, branches = 10)
+
+    for i, joint in enumerate(standin.ls("hero:*", type = "joint")):
+
+        # A foreign constraint on every joint
+        standin.Node("prop:parentConstraint_j%d" % i, "parentConstraint", joint)
+
+        # Locators, each with more locators nested under it
+        for k in range(helpers):
+
+            parent = standin.createShape("hero:helper_j%d_%d" % (i, k), "locator", joint)
+
+            for n in range(nested):
+
+                parent = standin.createShape("%s_%d" % (parent.name(), n), "locator", parent)
+
+            # Half of them come from the reference and can't be deleted
+            if k % 2:
+
+                for node in [standin.PyNode("hero:helper_j%d_%d" % (i, k))] + standin.listRelatives(standin.PyNode("hero:helper_j%d_%d" % (i, k)), ad = True):
+
+                    node.refFile = standin.PyNode("hero:root").refFile
+
+    root = standin.PyNode("hero:root")
+    root.setParent(world = True)
+
+    return root
+
+# The old cleanup, a type query per node and a delete per node
+def deleteChildrenPerNode(srcNode, nodeType):
+
+    pymel = standin
+
+    for node in pymel.listRelatives(srcNode, ad = True):
+
+        if node.type() == nodeType:
+
+            continue
+
+        if node.isReferenced():
+
+            parent = node.getParent()
+
+            if parent is not None and parent.type() == nodeType and "transform" in pymel.nodeType(node, inherited = True):
+
+                node.setParent(world = True)
+
+            continue
+
+        pymel.delete(node)
+
+# Runs a cleanup and reports round-trips, deletes and time, returns the scene left behind
+def run(label, joints, helpers, nested, func):
+
+    root = buildRig(joints, helpers, nested)
+
+    nodes = len(standin.listRelatives(root, ad = True))
+
+    calls = standin.calls
+    calls.clear()
+
+    start = time.time()
+
+    func(root, "joint")
+
+    elapsed = time.time() - start
+
+    print("%-9s nodes=%-7d round-trips=%-7d deletes=%-6d %.4fs" % (label, nodes, sum(calls.values()), calls["delete"], elapsed))
+
+    return UnrealExporter.transaction.getSceneState()
+
+def main(argv):
+
+    joints = int(argv[0]) if len(argv) > 0 else 200
+    helpers = int(argv[1]) if len(argv) > 1 else 4
+    nested = int(argv[2]) if len(argv) > 2 else 2
+
+    perNode = run("per-node", joints, helpers, nested, deleteChildrenPerNode)
+    bulk = run("bulk", joints, helpers, nested, UnrealExporter.utils.deleteChildrenNodeType)
+
+    print("same scene=%s" % (perNode == bulk))
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
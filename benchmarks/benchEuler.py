@@ -0,0 +1,134 @@
+'''
+Benchmarks the vectorized Euler filter against per-curve filtering
+
+Runs on raw arrays, where gimbal flips and wrapped angles are put into smooth rotations
+and have to come back out, then on a baked skeleton in the stand-in scene
+
+Usage: python benchmarks/benchEuler.py [joints] [frames]
+'''
+
+# Import statements
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import numpy
+
+import UnrealExporter.curves
+import UnrealExporter.utils
+
+# Builds smooth rotations, their equivalents, the frames that get flipped,
+# and the smooth rotations with wrapped angles and those frames flipped
+def buildRotations(nodes, frames):
+
+    rng = numpy.random.RandomState(1)
+
+    steps = rng.uniform(-4.0, 4.0, (nodes, 3, frames))
+    steps[:, 1, :] *= 0.25
+
+    smooth = numpy.cumsum(steps, axis = 2)
+    smooth[:, 1, :] = numpy.clip(smooth[:, 1, :], -80.0, 80.0)
+
+    # Flip to the equivalent rotation on random frames, then wrap
+    flips = rng.rand(nodes, frames) < 0.1
+    flipped = numpy.where(numpy.arange(3)[numpy.newaxis, :, numpy.newaxis] == 1, 180.0 - smooth, smooth + 180.0)
+
+    noisy = numpy.where(flips[:, numpy.newaxis, :], flipped, smooth)
+    noisy = UnrealExporter.curves.wrapArrays(noisy)
+
+    return smooth, flipped, flips, noisy
+
+# Filters raw arrays both ways and checks the smooth rotations come back
+def runArrays(nodes, frames):
+
+    smooth, flipped, flips, noisy = buildRotations(nodes, frames)
+
+    start = time.time()
+
+    filtered = UnrealExporter.curves.eulerFilterArrays(noisy)
+
+    vectorTime = time.time() - start
+
+    # The first frame picks the branch, so compare against the smooth rotations on that branch,
+    # shifted by whole turns onto the first frame
+    branch = numpy.where(flips[:, numpy.newaxis, :1], flipped, smooth)
+    offset = filtered[:, :, :1] - branch[:, :, :1]
+    recovered = numpy.allclose(filtered - offset, branch) and numpy.allclose(UnrealExporter.curves.wrapArrays(offset), 0.0)
+
+    # Unwrapping alone, one curve at a time in python
+    curves = noisy.reshape(-1, frames).tolist()
+
+    start = time.time()
+
+    unwrapped = [UnrealExporter.curves.minimizeRotation(values) for values in curves]
+
+    loopTime = time.time() - start
+
+    matches = numpy.allclose(UnrealExporter.curves.unwrapArrays(noisy).reshape(-1, frames), unwrapped)
+
+    print("arrays   curves=%-6d frames=%-6d vectorized=%.4fs per-curve unwrap=%.4fs recovered=%s unwrap matches=%s" % (
+            nodes * 3, frames, vectorTime, loopTime, recovered, matches))
+
+# Bakes a skeleton and Euler filters it per curve and in one pass
+# With minimizeRotation off every wrapped curve has to be rewritten, with it on, like an export bake, none do
+def runScene(joints, frames, minimizeRotation):
+
+
+    results = []
+
+    for label in ("per-curve", "vectorized"):
+
+        standin.newScene(1, frames)
+        standin.createCharacter("hero", joints = joints)
+
+        nodes = [node for node in standin.ls("hero:*", type = "joint")]
+
+        standin.bakeResults(nodes, time = (1, frames), minimizeRotation = minimizeRotation)
+
+        standin.calls.clear()
+
+        start = time.time()
+
+        if label == "per-curve":
+
+            for item in nodes:
+
+                standin.filterCurve(item.listConnections(type = "animCurve"), filter = "euler")
+
+        else:
+
+            UnrealExporter.utils.eulerFilter(nodes)
+
+        elapsed = time.time() - start
+        calls = sum(standin.calls.values())
+
+        # Curves and key times, then every key value
+        curves = standin.getCurves(nodes)
+
+        results.append(([(str(curve), sorted(curve.keys)) for curve in curves],
+                        numpy.array([value for curve in curves for t, value in sorted(curve.keys.items())])))
+
+        print("scene    %-10s joints=%-5d frames=%-6d minimizeRotation=%-5s calls=%-6d %.4fs" % (
+                label, joints, frames, minimizeRotation, calls, elapsed))
+
+    # Keys written back go through radians, so values match to rounding
+    print("scene    keys match=%s" % (results[0][0] == results[1][0] and numpy.allclose(results[0][1], results[1][1])))
+
+def main(argv):
+
+    joints = int(argv[0]) if len(argv) > 0 else 200
+    frames = int(argv[1]) if len(argv) > 1 else 1000
+
+    runArrays(joints, frames)
+    runScene(joints, frames, False)
+    runScene(joints, frames, True)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
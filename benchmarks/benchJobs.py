@@ -0,0 +1,139 @@
+'''
+Benchmarks the headless job runner on generated stand-in scenes,
+then checks edits that don't touch any key on the asset itself still change its fingerprint
+
+Usage: python benchmarks/benchJobs.py [scenes] [characters] [cameras] [frames]
+'''
+
+# Import statements
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.batch
+import UnrealExporter.incremental
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+import ueBatch
+
+# Writes the stand-in scenes and a job file exporting everything in them
+def writeJobFile(rootDir, scenes, characters, cameras, frames):
+
+    jobs = []
+
+    for i in range(scenes):
+
+        sceneName = "shot%03d" % i
+        description = {"startTime" : 1,
+                        "endTime" : frames,
+                        "characters" : [{"namespace" : "char%d" % c, "joints" : 60, "meshes" : 2, "targets" : 4}
+                                        for c in range(characters)],
+                        "cameras" : ["shotCam%d" % c for c in range(cameras)]}
+
+        with open(os.path.join(rootDir, sceneName + ".json"), "w") as sceneFile:
+
+            json.dump(description, sceneFile)
+
+        assets = [{"node" : "char%d:main_ctrl" % c, "output" : "fbx/%s/char%d.fbx" % (sceneName, c)}
+                    for c in range(characters)]
+        assets += [{"node" : "shotCam%d" % c, "output" : "fbx/%s/cam%d.fbx" % (sceneName, c)}
+                    for c in range(cameras)]
+
+        jobs.append({"scene" : sceneName + ".json", "assets" : assets})
+
+    jobFilePath = os.path.join(rootDir, "jobs.json")
+
+    with open(jobFilePath, "w") as jobFile:
+
+        json.dump({"jobs" : jobs}, jobFile, indent = 2)
+
+    return jobFilePath
+
+# Makes each edit on a fresh character and checks the asset's fingerprint changes
+def runFingerprint():
+
+
+    # Each edit goes through an IK handle, an expression, a control without keys, or the rest pose
+    def setControl(handle, joint, expression):
+
+        handle.attrs["ty"] = 5.0
+
+    def setExpression(handle, joint, expression):
+
+        expression.attrs["expression"] = "ty = time * 2;"
+
+    def setRest(handle, joint, expression):
+
+        joint.attrs["tx"] = 2.0
+
+    def setParent(handle, joint, expression):
+
+        standin.parent(handle, joint)
+
+    changed = []
+
+    for edit in (setControl, setExpression, setRest, setParent):
+
+        standin.newScene(1, 50)
+        standin.createCharacter("hero", joints = 20, ikJoints = 3)
+
+        # A joint channel driven by an expression
+        joint = standin.PyNode("hero:joint0")
+        expression = standin.Node("hero:expression1", "expression")
+        expression.attrs["expression"] = "ty = time;"
+
+        standin.connectCurve(expression, joint, "ty")
+
+        UnrealExporter.sceneIndex.invalidate()
+
+        asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl"))
+
+        before = UnrealExporter.incremental.fingerprintAsset(asset, UnrealExporter.batch.ANIMATION)
+
+        edit(standin.PyNode("hero:ikHandle1"), standin.PyNode("hero:joint5"), expression)
+
+        changed.append("%s=%s" % (edit.__name__, before != UnrealExporter.incremental.fingerprintAsset(asset, UnrealExporter.batch.ANIMATION)))
+
+    print("fingerprint " + " ".join(changed))
+
+def main(argv):
+
+    scenes = int(argv[0]) if len(argv) > 0 else 10
+    characters = int(argv[1]) if len(argv) > 1 else 5
+    cameras = int(argv[2]) if len(argv) > 2 else 1
+    frames = int(argv[3]) if len(argv) > 3 else 100
+
+    rootDir = tempfile.mkdtemp()
+
+    try:
+
+        jobFilePath = writeJobFile(rootDir, scenes, characters, cameras, frames)
+
+        for incremental in (False, True, True):
+
+            summary = ueBatch.runJobFile(jobFilePath, incremental)
+            totals = summary["totals"]
+            assetCount = sum(totals.values())
+
+            print("incremental=%-5s scenes=%-4d assets=%-5d exported=%-5d skipped=%-5d failed=%-3d %.3fs (%.1f assets/s)" % (
+                    incremental, scenes, assetCount, totals["exported"], totals["skipped"], totals["failed"],
+                    summary["elapsed"], assetCount / max(summary["elapsed"], 1e-9)))
+
+    finally:
+
+        shutil.rmtree(rootDir)
+
+    runFingerprint()
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
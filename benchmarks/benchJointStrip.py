@@ -0,0 +1,131 @@
+'''
+Benchmarks stripping joints that don't influence the exported meshes on the stand-in scene
+
+Exports a character whose branches end in unweighted twist and helper joints with every joint and with the stripped skeleton,
+comparing bones, bake time and fbx size, checks the kept bones come out the same, and that an animation exported with the
+skeletal mesh's bone map has the same bones
+
+Usage: python benchmarks/benchJointStrip.py [joints] [branches] [unweightedJoints] [frames]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.sceneIndex
+import UnrealExporter.skeleton
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Reads the nodes an fbx holds, with their keys
+def readFbx(path):
+
+    nodes = {}
+
+    with open(path) as fbx:
+
+        for line in fbx:
+
+            if not line.startswith(" "):
+
+                name = line.strip()
+                nodes[name] = []
+
+            else:
+
+                nodes[name].append(line)
+
+    return nodes
+
+# Builds the scene and exports the character, returns the bones and nodes in the fbx, fbx size and bake time
+def runExport(outDir, label, joints, branches, unweightedJoints, frames, skeletal = True, boneMapFile = None):
+
+    standin.newScene(1, frames)
+
+    standin.createCharacter("hero", joints = joints, meshes = 2, targets = 2, constraints = 1, branches = branches,
+                            unweightedJoints = unweightedJoints)
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    jointNames = set(str(joint) for joint in standin.ls("hero:*", type = "joint"))
+
+    asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl"))
+    asset.setFileName(os.path.join(outDir, label + ".fbx"))
+
+    if boneMapFile is not None:
+
+        asset.setBoneMapFile(boneMapFile)
+
+    start = time.time()
+
+    asset.prepExport()
+
+    elapsed = time.time() - start
+
+    if skeletal:
+
+        asset.writeSkeletonMesh()
+
+    else:
+
+        asset.writeAnimation()
+
+    nodes = readFbx(asset.exportFilePath)
+
+    return set(nodes) & jointNames, nodes, os.path.getsize(asset.exportFilePath), elapsed
+
+def main(argv):
+
+    joints = int(argv[0]) if len(argv) > 0 else 150
+    branches = int(argv[1]) if len(argv) > 1 else 10
+    unweightedJoints = int(argv[2]) if len(argv) > 2 else 5
+    frames = int(argv[3]) if len(argv) > 3 else 200
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        results = []
+
+        for label, tolerance in (("full", None), ("stripped", True)):
+
+            UnrealExporter.utils.setJointStripping(tolerance)
+
+            bones, nodes, size, elapsed = runExport(outDir, label, joints, branches, unweightedJoints, frames)
+
+            print("%-9s bones=%-6d fbx=%-9d bake=%.3fs" % (label, len(bones), size, elapsed))
+
+            results.append((bones, nodes))
+
+        (fullBones, fullNodes), (strippedBones, strippedNodes) = results
+
+        print("kept bones match=%s" % all(fullNodes[bone] == strippedNodes[bone] for bone in strippedBones))
+
+        # The animation is stripped by the skeletal mesh's bone map, not by its own weights
+        UnrealExporter.utils.setJointStripping(None)
+
+        boneMapFile = UnrealExporter.skeleton.getBoneMapPath(os.path.join(outDir, "stripped.fbx"))
+
+        animBones, animNodes, size, elapsed = runExport(outDir, "anim", joints, branches, unweightedJoints, frames,
+                                                        skeletal = False, boneMapFile = boneMapFile)
+
+        print("anim      bones=%-6d fbx=%-9d bake=%.3fs same bones=%s" % (len(animBones), size, elapsed, animBones == strippedBones))
+
+    finally:
+
+        UnrealExporter.utils.setJointStripping(None)
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,233 @@
+'''
+Benchmarks the auto bake range on the stand-in scene
+
+Scans synthetic curves with held keys at both ends, vectorized and one key at a time, and checks both find the range they were built with,
+then exports a character animated over part of a long playback range with the playback range and with the auto range,
+comparing bake time and fbx size, and checks the baked values match over the auto range,
+then checks the range of joints an IK handle solves comes from the handle's keys, and that a cycling curve has no range,
+then bakes a short and a long character in one batch and checks each is baked over its own range
+
+Usage: python benchmarks/benchKeyRange.py [curves] [playbackFrames] [keyedFrames] [handles]
+'''
+
+# Import statements
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.batch
+import UnrealExporter.keyRange
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Builds flat key lists for synthetic curves, each holds its value before and after a moving part somewhere in 0 to 10000
+# Returns the key lists and the range the curves move over
+def buildCurves(curves, seed = 1):
+
+    generator = random.Random(seed)
+
+    indices, times, values, inAngles, outAngles = [], [], [], [], []
+
+    start = None
+    end = None
+
+    for i in range(curves):
+
+        # Some curves don't move at all
+        still = generator.random() < 0.2
+
+        moveStart = generator.randint(100, 5000)
+        moveEnd = moveStart + generator.randint(1, 4000)
+
+        curveTimes = sorted(set([0, moveStart, moveEnd, 10000] + [generator.randint(moveStart, moveEnd) for k in range(20)]))
+
+        hold = generator.uniform(-10.0, 10.0)
+
+        for index, t in enumerate(curveTimes):
+
+            moving = not still and moveStart < t < moveEnd
+
+            indices.append(index)
+            times.append(float(t))
+            values.append(hold + generator.uniform(1.0, 5.0) if moving else hold)
+
+            # Flat tangents where the curve holds
+            angle = generator.uniform(-30.0, 30.0) if moving else 0.0
+
+            inAngles.append(angle)
+            outAngles.append(angle)
+
+        if not still and len([t for t in curveTimes if moveStart < t < moveEnd]):
+
+            start = moveStart if start is None else min(start, moveStart)
+            end = moveEnd if end is None else max(end, moveEnd)
+
+    return (indices, times, values, inAngles, outAngles), (float(start), float(end)) if start is not None else None
+
+# Scans the synthetic curves both ways
+def runArrays(curves):
+
+    keys, expected = buildCurves(curves)
+
+    # Warm up NumPy, the keys come in as lists the way maya.cmds returns them
+    UnrealExporter.keyRange.getMovingRange(*[values[:10] for values in keys])
+
+    start = time.time()
+    vectorized = UnrealExporter.keyRange.getMovingRange(*keys)
+    vectorizedTime = time.time() - start
+
+    start = time.time()
+    loop = UnrealExporter.keyRange.getMovingRangeLoop(*keys)
+    loopTime = time.time() - start
+
+    print("arrays   curves=%-6d keys=%-8d vectorized=%.4fs loop=%.4fs vectorized matches=%s loop matches=%s" % (
+            curves, len(keys[0]), vectorizedTime, loopTime, vectorized == expected, loop == expected))
+
+# Builds the scene and exports the character, returns the frame range, the baked values, fbx size and bake time
+def runExport(outDir, label, playbackFrames, keyedFrames, handles):
+
+    standin.newScene(1, playbackFrames)
+
+    # The animation sits in the middle of the playback range
+    keyStart = playbackFrames // 2 - keyedFrames // 2
+
+    standin.createCharacter("hero", joints = 60, meshes = 2, targets = 2, constraints = 1,
+                            keyedFrames = (keyStart, keyStart + keyedFrames - 1))
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    UnrealExporter.utils.setAutoBakeRange(handles)
+
+    asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl"))
+    asset.setFileName(os.path.join(outDir, label + ".fbx"))
+
+    bakeNodes = asset.getBakeNodes()
+
+    start = time.time()
+
+    asset.prepExport()
+
+    elapsed = time.time() - start
+
+    values = dict(((str(node), attr), [node._evaluate(attr, frame) for frame in range(keyStart, keyStart + keyedFrames)])
+                    for node in bakeNodes for attr in standin.getChannels(node))
+
+    asset.writeAnimation()
+
+    return asset.frameRange, values, os.path.getsize(asset.exportFilePath), elapsed
+
+# Finds the key range of the joints an IK handle solves, before and after its curve cycles
+# The solver moves the joints without connections, only the handle's keys tell when
+def runSolver(playbackFrames, keyedFrames):
+
+    standin.newScene(1, playbackFrames)
+
+    keyStart = playbackFrames // 2 - keyedFrames // 2
+
+    standin.createCharacter("hero", joints = 20, ikJoints = 3)
+
+    # Only the handle is keyed, nothing else moves
+    for node in standin.scene.nodes.values():
+
+        node.motion = {}
+
+        for attr, curve in list(node._curves.items()):
+
+            curve.keys = {1 : 0.0}
+
+    handle = standin.PyNode("hero:ikHandle1")
+    curve = standin.createAnimCurve(handle, "translateX", (keyStart, keyStart + keyedFrames - 1))
+
+    joints = [standin.PyNode(name) for name in handle.attrs["ikChain"]]
+
+    solved = UnrealExporter.keyRange.getKeyRange(joints, 1)
+
+    standin.setInfinity(curve, postInfinite = "cycle")
+
+    cycling = UnrealExporter.keyRange.getKeyRange(joints, 1)
+
+    print("solver   range=%s cycling=%s matches=%s" % (solved, cycling,
+            solved == (float(keyStart), float(keyStart + keyedFrames - 1)) and cycling is None))
+
+# Exports a short and a long character through one batch with the auto range, each group of nodes is baked over its own range
+# The union of the two ranges would bake the short character over the long one's frames
+def runBatch(outDir, playbackFrames, keyedFrames, handles):
+
+    standin.newScene(1, playbackFrames)
+
+    standin.createCharacter("short", joints = 30, keyedFrames = (1, keyedFrames))
+    standin.createCharacter("long", joints = 30, keyedFrames = (1, playbackFrames))
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    UnrealExporter.utils.setAutoBakeRange(handles)
+
+    assets = []
+
+    for name in ("short", "long"):
+
+        asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode(name + ":main_ctrl"))
+        asset.setFileName(os.path.join(outDir, "batch_" + name + ".fbx"))
+
+        assets.append(asset)
+
+    nodes = [len(asset.getBakeNodes()) for asset in assets]
+    ranges = [asset.frameRange[1] - asset.frameRange[0] + 1 for asset in assets]
+
+    batch = UnrealExporter.batch.BatchExporter(assets)
+    batch.export()
+
+    # One bake per asset, each over its own range, the nodes aren't shared
+    print("batch    ranges=%s bakes=%-3d frames evaluated=%-6d node frames=%-8d union node frames=%-8d matches=%s" % (
+            ranges, batch.bakeCount, standin.scene.evaluatedFrames,
+            sum(count * frames for count, frames in zip(nodes, ranges)), sum(nodes) * max(ranges),
+            batch.bakeCount == 2 and standin.scene.evaluatedFrames == sum(ranges)))
+
+def main(argv):
+
+    curves = int(argv[0]) if len(argv) > 0 else 20000
+    playbackFrames = int(argv[1]) if len(argv) > 1 else 2000
+    keyedFrames = int(argv[2]) if len(argv) > 2 else 100
+    handles = int(argv[3]) if len(argv) > 3 else 5
+
+    runArrays(curves)
+
+    runSolver(playbackFrames, keyedFrames)
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        results = []
+
+        for label, rangeHandles in (("playback", None), ("auto", handles)):
+
+            frameRange, values, size, elapsed = runExport(outDir, label, playbackFrames, keyedFrames, rangeHandles)
+
+            print("%-8s range=%s-%-6s fbx=%-9d bake=%.3fs" % (label, frameRange[0], frameRange[1], size, elapsed))
+
+            results.append(values)
+
+        runBatch(outDir, playbackFrames, keyedFrames, handles)
+
+    finally:
+
+        UnrealExporter.utils.setAutoBakeRange(None)
+
+        shutil.rmtree(outDir)
+
+    print("same values=%s" % (results[0] == results[1]))
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,180 @@
+'''
+Benchmarks sending only the fbx options that changed between exports on the stand-in scene
+
+Exports a mix of animations, skeletal meshes, cameras and static meshes through one batch, once sending every
+option of the export profile before each export like before, and once sending only the ones that changed.
+Checks the FBX plugin had the same options for every export, then loads a profile file and checks it is used
+
+Usage: python benchmarks/benchProfiles.py [characters] [cameras] [props]
+'''
+
+# Import statements
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.batch
+import UnrealExporter.fbxOptions
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Sends every option, every time, the way options were sent before they were tracked
+class ResendState(UnrealExporter.fbxOptions.FBXOptionState):
+
+    def apply(self, options):
+
+        self.invalidate()
+
+        return UnrealExporter.fbxOptions.FBXOptionState.apply(self, options)
+
+# Builds the shot and returns a batch that cycles through every kind of export
+def buildBatch(outDir, label, characters, cameras, props):
+
+    standin.newScene(1, 50)
+
+    for i in range(characters):
+
+        standin.createCharacter("char%d" % i, joints = 10, meshes = 1)
+
+    for i in range(cameras):
+
+        standin.createCamera("shotCam%d" % i)
+
+    for i in range(props):
+
+        standin.createStaticMesh("crate%d" % i, namespace = "prop%d" % i)
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    entries = []
+
+    for i in range(characters):
+
+        ctrl = standin.PyNode("char%d:main_ctrl" % i)
+
+        entries.append((UnrealExporter.ueAsset.SkeletalMesh(ctrl), UnrealExporter.batch.ANIMATION))
+        entries.append((UnrealExporter.ueAsset.SkeletalMesh(ctrl), UnrealExporter.batch.SKELETON))
+
+    for i in range(cameras):
+
+        entries.append((UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam%d" % i)), UnrealExporter.batch.ANIMATION))
+
+    for i in range(props):
+
+        entries.append((UnrealExporter.ueAsset.StaticMesh(standin.PyNode("prop%d:crate%d" % (i, i))), UnrealExporter.batch.MESH))
+
+    batch = UnrealExporter.batch.BatchExporter()
+
+    for index, (asset, exportType) in enumerate(entries):
+
+        asset.setFileName(os.path.join(outDir, "%s%d.fbx" % (label, index)))
+
+        batch.addAsset(asset, exportType)
+
+    return batch
+
+# Exports the batch, returns the options the plugin had for every export
+def run(outDir, label, state, characters, cameras, props):
+
+
+    UnrealExporter.fbxOptions._optionState = state
+
+    batch = buildBatch(outDir, label, characters, cameras, props)
+
+    # Start both runs from a freshly loaded plugin
+    standin.scene.fbxOptions = {}
+
+    # Record the plugin's options as each fbx is written
+    exportOptions = []
+
+    FBXExport = standin.Mel.FBXExport
+
+    def recordExport(mel, s = True, f = None):
+
+        exportOptions.append(dict(standin.scene.fbxOptions))
+
+        return FBXExport(mel, s = s, f = f)
+
+    standin.Mel.FBXExport = recordExport
+
+    start = time.time()
+
+    try:
+
+        batch.export()
+
+    finally:
+
+        standin.Mel.FBXExport = FBXExport
+
+    elapsed = time.time() - start
+
+    print("%-8s exports=%-4d options sent=%-5d skipped=%-5d %.3fs" % (
+            label, len(exportOptions), state.sent, state.skipped, elapsed))
+
+    return exportOptions
+
+# Loads a profile file and checks the exports pick it up
+def runProfileFile(outDir):
+
+
+    profileFilePath = os.path.join(outDir, "profiles.json")
+
+    with open(profileFilePath, "w") as profileFile:
+
+        json.dump({"skeletal" : {"FBXExportTangents" : False},
+                    "skeletalAscii" : {"extends" : "skeletal", "FBXExportInAscii" : True}}, profileFile)
+
+    UnrealExporter.utils.loadExportProfiles(profileFilePath)
+
+    try:
+
+        UnrealExporter.utils.setExportProfile("skeletal")
+
+        tangents = standin.scene.fbxOptions["FBXExportTangents"]
+
+        UnrealExporter.utils.setExportProfile("skeletalAscii")
+
+        ascii = standin.scene.fbxOptions["FBXExportInAscii"]
+
+    finally:
+
+        UnrealExporter.utils.resetExportProfiles()
+
+    print("profile file tangents=%s ascii=%s profiles reset=%s" % (
+            tangents, ascii, UnrealExporter.utils.EXPORT_PROFILES == UnrealExporter.utils.DEFAULT_EXPORT_PROFILES))
+
+def main(argv):
+
+    characters = int(argv[0]) if len(argv) > 0 else 10
+    cameras = int(argv[1]) if len(argv) > 1 else 5
+    props = int(argv[2]) if len(argv) > 2 else 10
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        resent = run(outDir, "resend", ResendState(), characters, cameras, props)
+        tracked = run(outDir, "tracked", UnrealExporter.fbxOptions.FBXOptionState(), characters, cameras, props)
+
+        print("same options for every export=%s" % (resent == tracked))
+
+        runProfileFile(outDir)
+
+    finally:
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
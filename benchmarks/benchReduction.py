@@ -0,0 +1,137 @@
+'''
+Benchmarks key reduction after the bake on the stand-in scene
+
+Exports a character and a camera with and without key reduction, compares key counts and fbx sizes,
+and checks every reduced channel stays within its tolerance of the baked keys on every frame
+
+Usage: python benchmarks/benchReduction.py [frames] [joints]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.curves
+import UnrealExporter.reduction
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Builds the scene and exports the character and the camera, returns the assets, fbx sizes and time
+def runExport(outDir, label, frames, joints):
+
+    standin.newScene(1, frames)
+
+    standin.createCharacter("hero", joints = joints, meshes = 1, targets = 2, constraints = 1)
+    standin.createCamera("shotCam")
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    assets = [UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl")),
+                UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam"))]
+
+    start = time.time()
+
+    for i, asset in enumerate(assets):
+
+        asset.setFileName(os.path.join(outDir, "%s%d.fbx" % (label, i)))
+        asset.exportAnimation()
+
+    elapsed = time.time() - start
+
+    sizes = [os.path.getsize(asset.exportFilePath) for asset in assets]
+
+    return assets, sizes, elapsed, dict(standin.scene.fbxOptions)
+
+# Bakes a skeleton, reduces it and checks every channel against the bake on every frame
+def runCheck(frames, joints):
+
+    standin.newScene(1, frames)
+    standin.createCharacter("hero", joints = joints)
+
+    nodes = standin.ls("hero:*", type = "joint")
+
+    standin.bakeResults(nodes, time = (1, frames), minimizeRotation = True)
+
+    baked = UnrealExporter.curves.getCurveKeys(nodes)
+
+    start = time.time()
+
+    report = UnrealExporter.reduction.reduceCurves(nodes)
+
+    elapsed = time.time() - start
+
+    # Largest distance from the bake, over its tolerance, per channel group
+    worst = {}
+
+    for plugName, (curveType, times, values) in baked.items():
+
+        group = UnrealExporter.reduction.getChannelGroup(plugName, curveType)
+        tolerance = UnrealExporter.reduction.DEFAULT_TOLERANCES[group]
+
+        plug = standin.PyNode(plugName)
+
+        for t, value in zip(times, values):
+
+            ratio = abs(plug.get(time = t) - value) / tolerance
+
+            worst[group] = max(worst.get(group, 0.0), ratio)
+
+    print(UnrealExporter.reduction.formatReport(report))
+    print("check    joints=%-5d frames=%-6d %.4fs worst error / tolerance %s within=%s" % (
+            joints, frames, elapsed,
+            " ".join("%s=%.3f" % (group, worst[group]) for group in sorted(worst)),
+            all(ratio <= 1.0 + 1e-9 for ratio in worst.values())))
+
+def main(argv):
+
+    frames = int(argv[0]) if len(argv) > 0 else 1000
+    joints = int(argv[1]) if len(argv) > 1 else 30
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        UnrealExporter.utils.setKeyReduction(None)
+
+        assets, fullSizes, fullTime, fullOptions = runExport(outDir, "full", frames, joints)
+
+        print("full     frames=%-6d joints=%-4d fbx bytes=%-10d %.3fs resample=%s" % (
+                frames, joints, sum(fullSizes), fullTime, fullOptions.get("FBXExportBakeComplexAnimation")))
+
+        UnrealExporter.utils.setKeyReduction(True)
+
+        assets, reducedSizes, reducedTime, reducedOptions = runExport(outDir, "reduced", frames, joints)
+
+        for asset in assets:
+
+            report = asset.reductionReport
+
+            print("reduced  %-10s keys=%d->%d constant curves=%d/%d fbx bytes=%d" % (
+                    asset.name, report["keysBefore"], report["keysAfter"],
+                    report["constantCurves"], report["curves"], report["fbxBytes"]))
+
+        print("reduced  frames=%-6d joints=%-4d fbx bytes=%-10d %.3fs resample=%s size=%.1f%%" % (
+                frames, joints, sum(reducedSizes), reducedTime, reducedOptions.get("FBXExportBakeComplexAnimation"),
+                100.0 * sum(reducedSizes) / sum(fullSizes)))
+
+    finally:
+
+        UnrealExporter.utils.setKeyReduction(None)
+
+        shutil.rmtree(outDir)
+
+    runCheck(frames, joints)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,94 @@
+'''
+Benchmarks skeletal mesh exports of a referenced rig on the stand-in scene,
+importing the whole reference against exporting straight from the referenced namespace
+
+Rigs get heavier control hierarchies while the exported skeleton and meshes stay the same,
+compares export time and the nodes imported, and checks the fbx files match
+
+Usage: python benchmarks/benchReference.py [joints] [frames] [controlWidth] [levels]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Builds the scene and exports the character, returns the fbx contents, nodes imported and export time
+def runExport(outDir, label, joints, frames, controlDepth, controlWidth, importReferences):
+
+    standin.newScene(1, frames)
+
+    standin.createCharacter("hero", joints = joints, meshes = 2, targets = 2, constraints = 1,
+                            controlDepth = controlDepth, controlWidth = controlWidth)
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    UnrealExporter.utils.setImportReferences(importReferences)
+
+    asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl"))
+    asset.setFileName(os.path.join(outDir, label + ".fbx"))
+
+    start = time.time()
+
+    asset.exportAnimation()
+
+    elapsed = time.time() - start
+
+    with open(asset.exportFilePath) as fbx:
+
+        contents = fbx.read()
+
+    return contents, standin.scene.importedNodes, elapsed
+
+def main(argv):
+
+    joints = int(argv[0]) if len(argv) > 0 else 60
+    frames = int(argv[1]) if len(argv) > 1 else 100
+    controlWidth = int(argv[2]) if len(argv) > 2 else 20
+    levels = int(argv[3]) if len(argv) > 3 else 4
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        # Warm up
+        runExport(outDir, "warmUp", joints, frames, 1, 1, True)
+
+        for level in range(levels):
+
+            # Every level doubles the rig's controls
+            controlDepth = 25 * 2 ** level
+
+            results = []
+
+            for label, importReferences in (("import", True), ("inPlace", False)):
+
+                contents, importedNodes, elapsed = runExport(outDir, label, joints, frames, controlDepth, controlWidth, importReferences)
+
+                print("%-8s controls=%-7d imported nodes=%-7d %.3fs" % (label, controlDepth * controlWidth, importedNodes, elapsed))
+
+                results.append(contents)
+
+            print("fbx match=%s" % (results[0] == results[1]))
+
+    finally:
+
+        UnrealExporter.utils.setImportReferences(True)
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
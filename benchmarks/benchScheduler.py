@@ -0,0 +1,55 @@
+'''
+Benchmarks export throughput across worker counts with stand-in workers
+
+Usage: python benchmarks/benchScheduler.py [scenes] [characters] [frames] [maxWorkers]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchJobs
+import ueBatch
+
+def main(argv):
+
+    scenes = int(argv[0]) if len(argv) > 0 else 16
+    characters = int(argv[1]) if len(argv) > 1 else 5
+    frames = int(argv[2]) if len(argv) > 2 else 200
+    maxWorkers = int(argv[3]) if len(argv) > 3 else 8
+
+    rootDir = tempfile.mkdtemp()
+
+    try:
+
+        jobFilePath = benchJobs.writeJobFile(rootDir, scenes, characters, 1, frames)
+
+        workers = 1
+        baseline = None
+
+        while workers <= maxWorkers:
+
+            summary = ueBatch.runJobFileParallel(jobFilePath, workers, standin = True)
+            totals = summary["totals"]
+
+            if baseline is None:
+
+                baseline = summary["elapsed"]
+
+            print("workers=%-3d scenes=%-4d exported=%-5d failed=%-3d %.3fs speedup=%.2fx" % (
+                    workers, scenes, totals["exported"], totals["failed"], summary["elapsed"],
+                    baseline / max(summary["elapsed"], 1e-9)))
+
+            workers *= 2
+
+    finally:
+
+        shutil.rmtree(rootDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
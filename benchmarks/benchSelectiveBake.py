@@ -0,0 +1,101 @@
+'''
+Benchmarks selective baking against a full bake on the stand-in scene
+
+Exports a character where only some joints move, like a facial rig, and some joints are turned by an IK solver,
+with every channel baked and with only the driven ones,
+compares bake time, keys and fbx sizes, and checks every baked channel has the same value on every frame both ways
+
+Usage: python benchmarks/benchSelectiveBake.py [frames] [joints] [animatedJoints] [targets] [ikJoints]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Builds the scene and exports the character, returns the baked values, keys, fbx size and bake time
+def runExport(outDir, label, frames, joints, animatedJoints, targets, ikJoints, selective):
+
+    standin.newScene(1, frames)
+
+    standin.createCharacter("hero", joints = joints, meshes = 2, targets = targets, constraints = 1,
+                            animatedJoints = animatedJoints, ikJoints = ikJoints)
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    UnrealExporter.utils.setSelectiveBake(selective)
+
+    asset = UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl"))
+    asset.setFileName(os.path.join(outDir, label + ".fbx"))
+
+    bakeNodes = asset.getBakeNodes()
+
+    start = time.time()
+
+    asset.prepExport()
+
+    elapsed = time.time() - start
+
+    # Sample every baked channel on every frame, and count the keys
+    values = {}
+    keys = 0
+
+    for node in bakeNodes:
+
+        for attr in standin.getChannels(node):
+
+            values[(str(node), attr)] = [node._evaluate(attr, frame) for frame in range(1, frames + 1)]
+
+            curve = node._curves.get(attr)
+
+            keys += len(curve.keys) if curve is not None else 0
+
+    asset.writeAnimation()
+
+    return values, keys, os.path.getsize(asset.exportFilePath), elapsed
+
+def main(argv):
+
+    frames = int(argv[0]) if len(argv) > 0 else 200
+    joints = int(argv[1]) if len(argv) > 1 else 150
+    animatedJoints = int(argv[2]) if len(argv) > 2 else 10
+    targets = int(argv[3]) if len(argv) > 3 else 20
+    ikJoints = int(argv[4]) if len(argv) > 4 else 3
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        results = []
+
+        for label, selective in (("full", False), ("selective", True)):
+
+            values, keys, size, elapsed = runExport(outDir, label, frames, joints, animatedJoints, targets, ikJoints, selective)
+
+            print("%-10s keys=%-8d fbx=%-9d bake=%.3fs" % (label, keys, size, elapsed))
+
+            results.append(values)
+
+    finally:
+
+        UnrealExporter.utils.setSelectiveBake(False)
+
+        shutil.rmtree(outDir)
+
+    print("same values=%s" % (results[0] == results[1]))
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,115 @@
+'''
+Benchmarks a serial bake against sharded bakes of a long take on the stand-in scene, with and without pre-roll,
+and checks the sharded fbx files match the serial one, then checks stitched keys leave driven keys alone
+
+Usage: python benchmarks/benchSharding.py [frames] [joints] [shardFrames] [workers]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.curves
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Builds the take and exports the character and the camera, returns the fbx contents and time
+def run(outDir, label, frames, joints):
+
+    standin.newScene(1, frames)
+
+    standin.createCharacter("hero", joints = joints, meshes = 1, targets = 2, constraints = 1)
+    standin.createCamera("shotCam")
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    assets = [UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl")),
+                UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam"))]
+
+    contents = []
+
+    start = time.time()
+
+    for i, asset in enumerate(assets):
+
+        asset.setFileName(os.path.join(outDir, "%s%d.fbx" % (label, i)))
+        asset.exportAnimation()
+
+    elapsed = time.time() - start
+
+    for asset in assets:
+
+        with open(asset.exportFilePath) as fbx:
+
+            contents.append(fbx.read())
+
+    return contents, elapsed
+
+# Writes stitched keys onto a channel that has a driven key, the driven key must be left alone and a time curve put in its place
+def runDrivenKey():
+
+    standin.newScene(1, 10)
+
+    joint = standin.Node("joint1", "joint")
+    drivenKey = standin.createAnimCurve(joint, "rotateX", (0, 1), "animCurveUA")
+
+    UnrealExporter.curves.setCurveKeys({"joint1.rx" : ("animCurveTA", [1.0, 10.0], [0.0, 90.0])})
+
+    curve = joint._curves["rx"]
+
+    print("drivenKey kept=%s replaced=%s" % (drivenKey.keys == {0 : 0.0, 1 : 1.0},
+                                              curve is not drivenKey and curve.type() == "animCurveTA"))
+
+def main(argv):
+
+    frames = int(argv[0]) if len(argv) > 0 else 2000
+    joints = int(argv[1]) if len(argv) > 1 else 30
+    shardFrames = int(argv[2]) if len(argv) > 2 else 500
+    workers = int(argv[3]) if len(argv) > 3 else 4
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        UnrealExporter.utils.setBakeSharding(None)
+
+        serial, serialTime = run(outDir, "serial", frames, joints)
+
+        print("serial   frames=%-6d joints=%-4d %.3fs" % (frames, joints, serialTime))
+
+        UnrealExporter.utils.setBakeSharding(shardFrames, workers)
+
+        sharded, shardedTime = run(outDir, "sharded", frames, joints)
+
+        print("sharded  frames=%-6d joints=%-4d shards=%-3d workers=%-3d %.3fs identical=%s" % (
+                frames, joints, -(-frames // shardFrames), workers, shardedTime, sharded == serial))
+
+        # Every shard run up from the first frame, like a rig with a simulation needs
+        UnrealExporter.utils.setBakeSharding(shardFrames, workers, preRoll = None)
+
+        prerolled, prerolledTime = run(outDir, "prerolled", frames, joints)
+
+        print("preroll  frames=%-6d joints=%-4d shards=%-3d workers=%-3d %.3fs identical=%s" % (
+                frames, joints, -(-frames // shardFrames), workers, prerolledTime, prerolled == serial))
+
+        runDrivenKey()
+
+    finally:
+
+        UnrealExporter.utils.setBakeSharding(None)
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
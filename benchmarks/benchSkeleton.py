@@ -0,0 +1,86 @@
+'''
+Benchmarks skeleton discovery on a synthetic rig on the stand-in scene,
+comparing the old per-joint connection query against skinCluster influences
+
+Usage: python benchmarks/benchSkeleton.py [joints] [helperJoints] [meshes]
+'''
+
+# Import statements
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.sceneIndex
+import UnrealExporter.ueAsset
+
+# Builds a rig with skinned joints plus unskinned helper joints
+def buildRig(joints, helperJoints, meshes):
+
+    standin.newScene()
+
+    standin.createCharacter("hero", joints = joints, meshes = meshes, branches = 10)
+
+    # Helper joints are in the namespace but not skinned
+    parent = standin.PyNode("hero:root")
+
+    for i in range(helperJoints):
+
+        standin.Node("hero:helper%d" % i, "joint", parent)
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    return UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero:main_ctrl"))
+
+# The old discovery, one connection query per joint
+def getSkeletonPerJoint(asset):
+
+    skinnedJoints = []
+
+    for joint in UnrealExporter.sceneIndex.listNodes(asset.namespace, "joint"):
+
+        if joint.listConnections(type = "skinCluster"):
+
+            skinnedJoints.append(joint)
+
+    return skinnedJoints
+
+# Runs a discovery function and reports round-trips and time
+def run(label, asset, func):
+
+    calls = standin.calls
+    calls.clear()
+
+    start = time.time()
+
+    skeleton = func()
+
+    elapsed = time.time() - start
+
+    print("%-10s joints=%-5d round-trips=%-6d %.4fs" % (label, len(skeleton), sum(calls.values()), elapsed))
+
+    return skeleton
+
+def main(argv):
+
+    joints = int(argv[0]) if len(argv) > 0 else 1000
+    helperJoints = int(argv[1]) if len(argv) > 1 else 200
+    meshes = int(argv[2]) if len(argv) > 2 else 4
+
+    asset = buildRig(joints, helperJoints, meshes)
+
+    perJoint = run("per-joint", asset, lambda: getSkeletonPerJoint(asset))
+    influences = run("influence", asset, asset.getSkeleton)
+
+    if perJoint != influences:
+
+        print("MISMATCH: skeletons differ")
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,277 @@
+'''
+Benchmark suite sweeping synthetic stand-in scenes, no Maya needed
+
+Every sweep grows one scene parameter while the others stay at the base scene's: joints, skinned meshes,
+blendshape targets, foreign constraints, frames, and deep and wide control hierarchies.
+For each scene it times the stages an export goes through, setUnrealAssetObject, asset discovery,
+checkAnimation and the export prep, with the calls each stage makes into the scene,
+then fits a scaling exponent per stage, time ~ size ** exponent, so an O(n^2) stage stands out
+
+With --history the results are added to a json lines file, and compared against the last run in it,
+so the curves can be tracked from change to change
+
+Usage: python benchmarks/benchSuite.py [--quick] [--repeat N] [--sweep NAME ...] [--history suite.jsonl]
+'''
+
+# Import statements
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT_DIR)
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import ueExport
+import UnrealExporter.sceneIndex
+import UnrealExporter.utils
+
+# The scene every sweep starts from
+BASE_SCENE = {"joints" : 30,
+                "meshes" : 2,
+                "targets" : 2,
+                "constraints" : 1,
+                "frames" : 100,
+                "controlDepth" : 0,
+                "controlWidth" : 1}
+
+# Values each sweep runs the scene parameter through, full and quick
+SWEEPS = {"joints" : ([25, 50, 100, 200, 400], [25, 50, 100]),
+            "meshes" : ([1, 2, 4, 8, 16], [1, 2, 4]),
+            "targets" : ([5, 10, 20, 40, 80], [5, 10, 20]),
+            "constraints" : ([5, 10, 20, 40, 80], [5, 10, 20]),
+            "frames" : ([100, 200, 400, 800, 1600], [100, 200, 400]),
+            "controlDepth" : ([25, 50, 100, 200, 400], [25, 50, 100]),
+            "controlWidth" : ([25, 50, 100, 200, 400], [25, 50, 100])}
+
+# Extra settings a sweep needs, deep and wide hierarchies need the other dimension set
+SWEEP_SETTINGS = {"controlDepth" : {"controlWidth" : 2},
+                    "controlWidth" : {"controlDepth" : 2}}
+
+# Stages timed for every scene, in export order
+STAGES = ("setUnrealAssetObject", "discovery", "checkAnimation", "prepExport")
+
+# Elements every skeletal mesh export finds
+DISCOVERED_ELEMENTS = ("skins", "geometry", "skeleton", "root", "blendShapes", "bsMeshes", "constraints")
+
+# Builds a scene with a character, a camera and a static mesh
+def buildScene(params):
+
+    standin.newScene(1, params["frames"])
+
+    standin.createCharacter("hero",
+                            joints = params["joints"],
+                            meshes = params["meshes"],
+                            targets = params["targets"],
+                            constraints = params["constraints"],
+                            branches = 4,
+                            controlDepth = params["controlDepth"],
+                            controlWidth = params["controlWidth"])
+
+    standin.createCamera("shotCam")
+    standin.createStaticMesh("crate", namespace = "prop")
+
+    UnrealExporter.sceneIndex.invalidate()
+
+# Fits time ~ size ** exponent through the points with a size and a time
+def fitExponent(sizes, times):
+
+    points = [(math.log(size), math.log(elapsed)) for size, elapsed in zip(sizes, times) if size > 0 and elapsed > 0]
+
+    if len(points) < 2:
+
+        return None
+
+    meanX = sum(x for x, y in points) / len(points)
+    meanY = sum(y for x, y in points) / len(points)
+
+    spread = sum((x - meanX) ** 2 for x, y in points)
+
+    if not spread:
+
+        return None
+
+    return sum((x - meanX) * (y - meanY) for x, y in points) / spread
+
+# Gets the commit the tree is at, None outside of git
+def getCommit():
+
+    try:
+
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd = ROOT_DIR,
+                                        stderr = subprocess.STDOUT).decode("utf-8").strip()
+
+    except (OSError, subprocess.CalledProcessError):
+
+        return None
+
+# Gets the last run in a history file, None if there is none
+def loadLastRun(historyPath):
+
+    if not historyPath or not os.path.exists(historyPath):
+
+        return None
+
+    lastRun = None
+
+    with open(historyPath) as historyFile:
+
+        for line in historyFile:
+
+            if line.strip():
+
+                lastRun = json.loads(line)
+
+    return lastRun
+
+# Runs every stage on a scene, returns the time and calls of each stage
+def runScene(params):
+
+
+    buildScene(params)
+
+    stages = {}
+
+    # Times a stage and counts the calls it made into the scene
+    def timeStage(name, func):
+
+        standin.calls.clear()
+
+        start = time.time()
+
+        result = func()
+
+        stages[name] = {"time" : time.time() - start, "calls" : sum(standin.calls.values())}
+
+        return result
+
+    # Create the asset for every exported node, the way the UI and ueBatch do
+    def createAssets():
+
+        nodes = [standin.PyNode("hero:main_ctrl"), standin.PyNode("shotCam"), standin.PyNode("prop:crate")]
+
+        return [ueExport.setUnrealAssetObject(UnrealExporter.utils.getShape(node), node) for node in nodes]
+
+    skeletalMesh, camera, staticMesh = timeStage("setUnrealAssetObject", createAssets)
+
+    # Find every element the exports use
+    def discover():
+
+        for name in DISCOVERED_ELEMENTS:
+
+            getattr(skeletalMesh, name)
+
+        staticMesh.geometry
+        staticMesh.root
+
+    timeStage("discovery", discover)
+
+    timeStage("checkAnimation", lambda: ueExport.checkAnimation(skeletalMesh))
+
+    # Bake and clean up the character and the camera
+    def prepExport():
+
+        skeletalMesh.prepExport()
+        camera.prepExport()
+
+    timeStage("prepExport", prepExport)
+
+    return stages
+
+# Runs a sweep, returns its points and the scaling exponent of every stage
+# Every scene is built and run repeat times, keeping each stage's fastest time
+def runSweep(name, values, repeat):
+
+    points = []
+
+    for value in values:
+
+        params = dict(BASE_SCENE)
+        params.update(SWEEP_SETTINGS.get(name, {}))
+        params[name] = value
+
+        runs = [runScene(params) for i in range(repeat)]
+
+        stages = dict((stage, min((run[stage] for run in runs), key = lambda result: result["time"])) for stage in STAGES)
+
+        points.append({"value" : value, "stages" : stages})
+
+    exponents = {}
+
+    for stage in STAGES:
+
+        exponents[stage] = fitExponent([point["value"] for point in points],
+                                        [point["stages"][stage]["time"] for point in points])
+
+    return {"points" : points, "exponents" : exponents}
+
+# Prints a sweep, the largest scene's times and calls and the scaling exponents, with the change from the last run
+def printSweep(name, sweep, lastSweep):
+
+    largest = sweep["points"][-1]
+
+    lines = ["%s up to %d" % (name, largest["value"])]
+
+    for stage in STAGES:
+
+        exponent = sweep["exponents"][stage]
+        result = largest["stages"][stage]
+
+        line = "  %-22s %8.4fs calls=%-7d exponent=%s" % (stage, result["time"], result["calls"],
+                                                            "%.2f" % exponent if exponent is not None else "n/a")
+
+        # Compare against the same point in the last run
+        if lastSweep and lastSweep["points"][-1]["value"] == largest["value"]:
+
+            lastResult = lastSweep["points"][-1]["stages"][stage]
+
+            if lastResult["time"] > 0:
+
+                line += " time x%.2f" % (result["time"] / lastResult["time"])
+
+            line += " calls %+d" % (result["calls"] - lastResult["calls"])
+
+        lines.append(line)
+
+    print("\n".join(lines))
+
+def main(argv = None):
+
+    parser = argparse.ArgumentParser(description = "Sweep synthetic stand-in scenes and track how the export stages scale")
+    parser.add_argument("--quick", action = "store_true", help = "run the short sweeps")
+    parser.add_argument("--repeat", type = int, default = 3, help = "runs per scene, the fastest is kept")
+    parser.add_argument("--sweep", action = "append", choices = sorted(SWEEPS),
+                        help = "only run this sweep, can be given more than once")
+    parser.add_argument("--history", help = "json lines file the results are added to and compared against")
+
+    args = parser.parse_args(argv)
+
+    lastRun = loadLastRun(args.history)
+
+    run = {"time" : time.time(), "commit" : getCommit(), "quick" : args.quick, "repeat" : args.repeat, "sweeps" : {}}
+
+    for name in sorted(args.sweep or SWEEPS):
+
+        sweep = runSweep(name, SWEEPS[name][1 if args.quick else 0], args.repeat)
+
+        run["sweeps"][name] = sweep
+
+        printSweep(name, sweep, lastRun["sweeps"].get(name) if lastRun else None)
+
+    if args.history:
+
+        with open(args.history, "a") as historyFile:
+
+            historyFile.write(json.dumps(run, sort_keys = True) + "\n")
+
+if __name__ == "__main__":
+
+    main()
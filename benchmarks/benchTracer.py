@@ -0,0 +1,172 @@
+'''
+Benchmarks the export stage tracer on the stand-in scene
+
+Times a traced call against a plain one while the tracer is off, exports a shot with the tracer off and on,
+prints the time spent per stage and checks both trace formats read back
+
+Usage: python benchmarks/benchTracer.py [characters] [cameras] [frames]
+'''
+
+# Import statements
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.batch
+import UnrealExporter.sceneIndex
+import UnrealExporter.tracer
+import UnrealExporter.ueAsset
+
+# Does nothing, timed plain and traced
+def noop(nodes = None):
+
+    return nodes
+
+tracedNoop = UnrealExporter.tracer.traced("noop", UnrealExporter.tracer.describeNodes)(noop)
+
+# Times calls to a traced function with the tracer off against calls to the plain function
+def runOverhead(calls):
+
+    start = time.time()
+
+    for i in range(calls):
+
+        noop()
+
+    plainTime = time.time() - start
+
+    start = time.time()
+
+    for i in range(calls):
+
+        tracedNoop()
+
+    tracedTime = time.time() - start
+
+    print("off      calls=%-8d plain=%.3fs traced=%.3fs overhead per call=%.0fns" % (
+            calls, plainTime, tracedTime, (tracedTime - plainTime) / calls * 1e9))
+
+# Builds the shot and returns a batch with every asset in it
+def buildBatch(outDir, characters, cameras, frames):
+
+    standin.newScene(1, frames)
+
+    for i in range(characters):
+
+        standin.createCharacter("char%d" % i, joints = 60, meshes = 2, targets = 4, constraints = 1)
+
+    for i in range(cameras):
+
+        standin.createCamera("shotCam%d" % i)
+
+    standin.createStaticMesh("crate", namespace = "prop")
+
+    UnrealExporter.sceneIndex.invalidate()
+
+    batch = UnrealExporter.batch.BatchExporter()
+
+    for i in range(characters):
+
+        batch.addAsset(UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("char%d:main_ctrl" % i)))
+
+    for i in range(cameras):
+
+        batch.addAsset(UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam%d" % i)))
+
+    batch.addAsset(UnrealExporter.ueAsset.StaticMesh(standin.PyNode("prop:crate")))
+
+    for index, (asset, exportType) in enumerate(batch.entries):
+
+        asset.setFileName(os.path.join(outDir, "asset%d.fbx" % index))
+
+    return batch
+
+# Exports the shot with the tracer off or on
+def runExport(outDir, label, characters, cameras, frames, tracing):
+
+    tracer = UnrealExporter.tracer.getTracer()
+
+    batch = buildBatch(outDir, characters, cameras, frames)
+
+    if tracing:
+
+        tracer.start(countSceneNodes = True)
+
+    start = time.time()
+
+    try:
+
+        batch.export()
+
+    finally:
+
+        tracer.stop()
+
+    elapsed = time.time() - start
+
+    print("%-8s assets=%-4d spans=%-6d %.3fs" % (label, len(batch.entries), len(tracer.events) if tracing else 0, elapsed))
+
+# Writes the trace in both formats and checks they read back
+def runFormats(outDir):
+
+    tracer = UnrealExporter.tracer.getTracer()
+
+    chromePath = os.path.join(outDir, "trace.json")
+    linesPath = os.path.join(outDir, "trace.jsonl")
+
+    tracer.write(chromePath)
+    tracer.write(linesPath)
+
+    with open(chromePath) as traceFile:
+
+        chromeEvents = json.load(traceFile)["traceEvents"]
+
+    with open(linesPath) as traceFile:
+
+        lineEvents = [json.loads(line) for line in traceFile]
+
+    # Every nested span lies inside a span one level up
+    def isNested(child):
+
+        return any(parent["depth"] == child["depth"] - 1 and parent["start"] <= child["start"] and
+                    child["start"] + child["wall"] <= parent["start"] + parent["wall"] for parent in lineEvents)
+
+    nested = all(isNested(event) for event in lineEvents if event["depth"])
+
+    print("formats  chrome events=%d json lines=%d nested=%s" % (len(chromeEvents), len(lineEvents), nested))
+
+def main(argv):
+
+    characters = int(argv[0]) if len(argv) > 0 else 10
+    cameras = int(argv[1]) if len(argv) > 1 else 2
+    frames = int(argv[2]) if len(argv) > 2 else 100
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        runOverhead(1000000)
+
+        runExport(outDir, "off", characters, cameras, frames, False)
+        runExport(outDir, "on", characters, cameras, frames, True)
+
+        print(UnrealExporter.tracer.formatSummary(UnrealExporter.tracer.getTracer().summarize()))
+
+        runFormats(outDir)
+
+    finally:
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
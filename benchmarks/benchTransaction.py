@@ -0,0 +1,144 @@
+'''
+Benchmarks back-to-back exports from one session on the stand-in scene,
+reopening the scene file after each export against rolling the export back in memory
+
+Checks the scene is the same after every rolled back export and the fbx files match
+
+Usage: python benchmarks/benchTransaction.py [exports] [characters] [joints] [frames]
+'''
+
+# Import statements
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Install the stand-in before importing the exporter
+import standin
+standin.install()
+
+import UnrealExporter.sceneIndex
+import UnrealExporter.transaction
+import UnrealExporter.ueAsset
+import UnrealExporter.utils
+
+# Builds a shot and saves it, so it can be reopened
+def buildScene(outDir, characters, joints, frames):
+
+    standin.newScene(1, frames)
+
+    for i in range(characters):
+
+        standin.createCharacter("hero%d" % i, joints = joints, meshes = 2, targets = 2, constraints = 1)
+
+    standin.createCamera("shotCam")
+    standin.createStaticMesh("crate", namespace = "prop")
+
+    scenePath = os.path.join(outDir, "shot.mb")
+
+    standin.exportAll(scenePath, force = True)
+    standin.scene.path = scenePath
+
+    UnrealExporter.sceneIndex.invalidate()
+
+# Creates the asset for an export, cycling through the shot's characters, camera and static mesh
+def createAsset(index, characters):
+
+
+    kinds = characters + 2
+    kind = index % kinds
+
+    if kind < characters:
+
+        return UnrealExporter.ueAsset.SkeletalMesh(standin.PyNode("hero%d:main_ctrl" % kind))
+
+    if kind == characters:
+
+        return UnrealExporter.ueAsset.Camera(standin.PyNode("shotCam"))
+
+    return UnrealExporter.ueAsset.StaticMesh(standin.PyNode("prop:crate"))
+
+# Exports assets back to back, restoring the scene after each one, returns the fbx contents and times
+def run(outDir, label, exports, characters, transactional):
+
+    UnrealExporter.utils.setTransactionalExport(transactional)
+
+    contents = []
+    restoreTime = 0.0
+    reopens = 0
+    sameScene = True
+
+    sceneState = UnrealExporter.transaction.getSceneState()
+
+    start = time.time()
+
+    for i in range(exports):
+
+        asset = createAsset(i, characters)
+        asset.setFileName(os.path.join(outDir, "%s%d.fbx" % (label, i)))
+
+        # The rollback is timed as part of the export, reopening on its own
+        if isinstance(asset, UnrealExporter.ueAsset.StaticMesh):
+
+            asset.exportMesh()
+
+        else:
+
+            asset.exportAnimation()
+
+        if not transactional:
+
+            restoreStart = time.time()
+
+            UnrealExporter.utils.reopenScene()
+            UnrealExporter.sceneIndex.invalidate()
+
+            restoreTime += time.time() - restoreStart
+            reopens += 1
+
+        sameScene = sameScene and UnrealExporter.transaction.getSceneState() == sceneState
+
+        with open(asset.exportFilePath) as fbx:
+
+            contents.append(fbx.read())
+
+    elapsed = time.time() - start
+
+    print("%-13s exports=%-4d %.3fs reopen=%.3fs reopens=%-4d same scene=%s" % (
+            label, exports, elapsed, restoreTime, reopens, sameScene))
+
+    return contents
+
+def main(argv):
+
+    exports = int(argv[0]) if len(argv) > 0 else 12
+    characters = int(argv[1]) if len(argv) > 1 else 4
+    joints = int(argv[2]) if len(argv) > 2 else 60
+    frames = int(argv[3]) if len(argv) > 3 else 200
+
+    outDir = tempfile.mkdtemp()
+
+    try:
+
+        buildScene(outDir, characters, joints, frames)
+
+        reopened = run(outDir, "reopen", exports, characters, False)
+
+        buildScene(outDir, characters, joints, frames)
+
+        rolledBack = run(outDir, "transactional", exports, characters, True)
+
+        print("fbx match=%s" % (reopened == rolledBack))
+
+    finally:
+
+        UnrealExporter.utils.setTransactionalExport(False)
+
+        shutil.rmtree(outDir)
+
+if __name__ == "__main__":
+
+    main(sys.argv[1:])
@@ -0,0 +1,2101 @@
+'''
+The stand-in scene the benchmarks and tests run the exporter against
+
+A lightweight in-memory stand-in for the subset of pymel.core used by the
+exporter, so the package can be run and benchmarked without Maya.
+Call install() before importing the UnrealExporter modules.
+'''
+
+# Import statements
+import bisect
+import collections
+import fnmatch
+import json
+import math
+import os
+import struct
+import sys
+import types
+
+# Import backend module from UnrealExporter package
+import UnrealExporter.backend
+
+# Marks the stand-in once it is installed as pymel.core, so the exporter can tell without importing it
+STANDIN = True
+
+# Node type inheritance, mirrors the parts of Maya's type tree the exporter uses
+TYPE_PARENTS = {"joint" : "transform",
+                "constraint" : "transform",
+                "ikHandle" : "transform",
+                "ikEffector" : "transform",
+                "parentConstraint" : "constraint",
+                "pointConstraint" : "constraint",
+                "orientConstraint" : "constraint",
+                "aimConstraint" : "constraint",
+                "scaleConstraint" : "constraint",
+                "mesh" : "shape",
+                "nurbsCurve" : "shape",
+                "camera" : "shape",
+                "locator" : "shape",
+                "skinCluster" : "geometryFilter",
+                "blendShape" : "geometryFilter",
+                "animCurveTL" : "animCurve",
+                "animCurveTA" : "animCurve",
+                "animCurveTU" : "animCurve",
+                "animCurveUA" : "animCurve",
+                "animCurveUL" : "animCurve",
+                "animCurveUU" : "animCurve"}
+
+# Channels keyed by a bake, per node type
+TRANSFORM_CHANNELS = ("tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz")
+BLENDSHAPE_CHANNELS = ("weight",)
+
+# Rotation and scale channels, rotations are evaluated in -180 to 180 like decomposed matrices
+ROTATE_CHANNELS = ("rx", "ry", "rz")
+SCALE_CHANNELS = ("sx", "sy", "sz")
+
+# Long attribute names per channel, and the channel per long name
+LONG_NAMES = {"tx" : "translateX",
+                "ty" : "translateY",
+                "tz" : "translateZ",
+                "rx" : "rotateX",
+                "ry" : "rotateY",
+                "rz" : "rotateZ",
+                "sx" : "scaleX",
+                "sy" : "scaleY",
+                "sz" : "scaleZ"}
+SHORT_NAMES = dict((longName, shortName) for shortName, longName in LONG_NAMES.items())
+
+# Lens attribute defaults of a new camera shape
+CAMERA_ATTRS = {"focalLength" : 35.0,
+                "horizontalFilmAperture" : 1.417,
+                "verticalFilmAperture" : 0.945,
+                "nearClipPlane" : 0.1,
+                "farClipPlane" : 10000.0}
+
+# Values of attributes that aren't plain numbers, as getAttr returns them
+ATTRIBUTE_DEFAULTS = {"rotatePivot" : [(0.0, 0.0, 0.0)]}
+
+# Anim curve type per channel, anything else is unitless
+CURVE_TYPES = {"tx" : "animCurveTL",
+                "ty" : "animCurveTL",
+                "tz" : "animCurveTL",
+                "rx" : "animCurveTA",
+                "ry" : "animCurveTA",
+                "rz" : "animCurveTA"}
+
+# Raised for nodes that do not exist, like pymel.core.MayaNodeError
+class MayaNodeError(ValueError):
+
+    pass
+
+# Number of calls made into the stand-in, per function
+# Only calls from outside the stand-in are counted, like commands run in Maya
+calls = collections.Counter()
+
+# How many counted calls deep the stand-in is
+_callDepth = [0]
+
+# Counts every call to the wrapped function
+def counted(func):
+
+    return countedAs(func.__name__)(func)
+
+# Counts every call to the wrapped function under the given name
+def countedAs(name):
+
+    def decorator(func):
+
+        def wrapper(*args, **kwargs):
+
+            if not _callDepth[0]:
+
+                calls[name] += 1
+
+            _callDepth[0] += 1
+
+            try:
+
+                return func(*args, **kwargs)
+
+            finally:
+
+                _callDepth[0] -= 1
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+
+        return wrapper
+
+    return decorator
+
+# Builds a flat 4x4 matrix from translate, rotate in degrees with the xyz rotate order, and scale
+# Maya matrices are row major and multiply row vectors, so scale applies first, then x, y and z rotation, then translation
+def composeMatrix(translate, rotate, scale = (1.0, 1.0, 1.0)):
+
+    cx, cy, cz = [math.cos(math.radians(angle)) for angle in rotate]
+    sx, sy, sz = [math.sin(math.radians(angle)) for angle in rotate]
+
+    rows = [[cy * cz, cy * sz, -sy],
+            [sx * sy * cz - cx * sz, sx * sy * sz + cx * cz, sx * cy],
+            [cx * sy * cz + sx * sz, cx * sy * sz - sx * cz, cx * cy]]
+
+    matrix = []
+
+    for row, factor in zip(rows, scale):
+
+        matrix.extend([value * factor for value in row] + [0.0])
+
+    return matrix + list(translate) + [1.0]
+
+# Gets the anim curves of the given nodes, anim curves are their own curve
+def getCurves(nodes):
+
+    curves = []
+
+    for node in flatten(nodes):
+
+        node = PyNode(node)
+
+        if isType(node._type, "animCurve"):
+
+            curves.append(node)
+
+        else:
+
+            curves.extend(node._curves.values())
+
+    return curves
+
+# Gets the channels a bake keys on a node
+def getChannels(node):
+
+    return BLENDSHAPE_CHANNELS if node._type == "blendShape" else TRANSFORM_CHANNELS
+
+# Checks if a node type is, or inherits from, another node type
+def isType(nodeType, queryType):
+
+    while nodeType is not None:
+
+        if nodeType == queryType:
+
+            return True
+
+        nodeType = TYPE_PARENTS.get(nodeType)
+
+    return False
+
+# Matches a node name against an ls pattern
+# Like Maya, wildcards only match inside the pattern's own namespace
+def matchName(name, pattern):
+
+    nodeNS, sep, nodeName = name.rpartition(":")
+    patternNS, sep, patternName = pattern.rpartition(":")
+
+    return nodeNS == patternNS and fnmatch.fnmatchcase(nodeName, patternName)
+
+# Multiplies two flat 4x4 matrices
+def multiplyMatrices(a, b):
+
+    return [sum(a[row * 4 + k] * b[k * 4 + column] for k in range(4)) for row in range(4) for column in range(4)]
+
+# Keeps every angle within 180 degrees of the one before it, like bakeResults' minimizeRotation
+def minimizeRotation(values):
+
+    minimized = []
+
+    for value in values:
+
+        if minimized:
+
+            value += 360.0 * math.floor((minimized[-1] - value) / 360.0 + 0.5)
+
+        minimized.append(value)
+
+    return minimized
+
+# Rounds a value to a 32 bit float
+def toFloat32(value):
+
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+# Wraps an angle into -180 to 180
+def wrapAngle(value):
+
+    return (value + 180.0) % 360.0 - 180.0
+
+# Flattens nested lists/tuples of nodes into a flat list of nodes
+def flatten(items):
+
+    flat = []
+
+    for item in items:
+
+        if isinstance(item, (list, tuple)):
+
+            flat.extend(flatten(item))
+
+        elif item is not None:
+
+            flat.append(item)
+
+    return flat
+
+# The in-memory scene state
+class Scene:
+
+    def __init__(self, startTime = 1, endTime = 100):
+
+        # Nodes by name, in creation order
+        self.nodes = collections.OrderedDict()
+
+        # Current selection
+        self.selection = []
+
+        # Playback range, and the current frame
+        self.startTime = startTime
+        self.endTime = endTime
+        self.currentTime = startTime
+
+        # Evaluation manager mode, the number of times it was switched, and if the viewport is managed
+        self.evaluationMode = "parallel"
+        self.evaluationSwitches = 0
+        self.paneManaged = True
+
+        # Last value set for every FBX option
+        self.fbxOptions = {}
+
+        # Scene path
+        self.path = "standin.ma"
+
+        # Number of bakeResults calls and number of frames evaluated
+        self.bakeCalls = 0
+        self.evaluatedFrames = 0
+
+        # Number of fbx files written
+        self.exports = 0
+
+        # Number of nodes made local by importing references
+        self.importedNodes = 0
+
+        # Undo queue, a snapshot per closed chunk, the snapshot of the chunk being recorded and the queue state
+        self.undoChunks = []
+        self.openChunk = None
+        self.undoEnabled = True
+
+    # Takes a snapshot of every node's state and the selection, undo puts it back
+    # File references are left out, importing them can't be undone
+    def snapshot(self):
+
+        nodes = []
+
+        for node in self.nodes.values():
+
+            nodes.append((node, {"_name" : node._name,
+                                    "_parent" : node._parent,
+                                    "_children" : list(node._children),
+                                    "_inputs" : list(node._inputs),
+                                    "_outputs" : list(node._outputs),
+                                    "_curves" : collections.OrderedDict(node._curves),
+                                    "_channel" : node._channel,
+                                    "attrs" : dict(node.attrs),
+                                    "keys" : dict(node.keys),
+                                    "motion" : dict(node.motion),
+                                    "visible" : node.visible}))
+
+        return nodes, list(self.selection)
+
+    # Puts back a snapshot, nodes made since are dropped and deleted nodes come back as the same objects
+    def restore(self, snapshot):
+
+        nodes, selection = snapshot
+
+        self.nodes = collections.OrderedDict()
+
+        for node, state in nodes:
+
+            node.__dict__.update(state)
+
+            self.nodes[node._name] = node
+
+        self.selection = selection
+
+    # Gets a unique node name based off of the given name
+    def uniqueName(self, name):
+
+        if name not in self.nodes:
+
+            return name
+
+        base = name.rstrip("0123456789")
+        index = 1
+
+        while base + str(index) in self.nodes:
+
+            index += 1
+
+        return base + str(index)
+
+# The current scene
+scene = Scene()
+
+# A referenced file
+class FileReference:
+
+    def __init__(self, path, namespace):
+
+        self.path = path
+        self.namespace = namespace
+        self.imported = False
+
+    @counted
+    def importContents(self):
+
+        self.imported = True
+
+        for node in scene.nodes.values():
+
+            if node.refFile is self:
+
+                node.refFile = None
+
+                scene.importedNodes += 1
+
+# A scene node, stands in for PyNode
+class Node(object):
+
+    def __init__(self, name, nodeType, parent = None):
+
+        self._name = scene.uniqueName(name)
+        self._type = nodeType
+        self._parent = None
+        self._children = []
+        self._inputs = []
+        self._outputs = []
+
+        # Attribute values, and the keys of anim curves as {time: value}
+        self.attrs = {}
+        self.keys = {}
+
+        # Procedural animation per channel, as [offset, speed, amplitude, period]
+        self.motion = {}
+
+        # Anim curves driving each channel, and the channel an anim curve drives
+        self._curves = collections.OrderedDict()
+        self._channel = None
+
+        self.refFile = None
+        self.visible = True
+
+        scene.nodes[self._name] = self
+
+        if parent is not None:
+
+            self._setParent(parent)
+
+    def __repr__(self):
+
+        return "%s(%r)" % (self.__class__.__name__, self._name)
+
+    def __str__(self):
+
+        return self._name
+
+    def _setParent(self, parent):
+
+        if self._parent is not None:
+
+            self._parent._children.remove(self)
+
+        self._parent = parent
+
+        if parent is not None:
+
+            parent._children.append(self)
+
+    def _descendants(self):
+
+        nodes = []
+
+        for child in self._children:
+
+            nodes.append(child)
+            nodes.extend(child._descendants())
+
+        return nodes
+
+    def _evaluate(self, attr, frame):
+
+        # World matrices are built up from the channels of the node and its parents
+        if attr.startswith("worldMatrix"):
+
+            return self._evaluateWorldMatrix(frame)
+
+        if attr == "matrix":
+
+            return self._evaluateMatrix(frame)
+
+        # Keyed channels follow their curve
+        if attr in self._curves:
+
+            return self._curves[attr]._evaluateCurve(frame)
+
+        if attr not in self.motion:
+
+            return self.attrs.get(attr, ATTRIBUTE_DEFAULTS.get(attr, 1.0 if attr in SCALE_CHANNELS else 0.0))
+
+        offset, speed, amplitude, period = self.motion[attr]
+
+        value = offset + speed * frame
+
+        if period:
+
+            value += amplitude * math.sin(2.0 * math.pi * frame / period)
+
+        if attr in ROTATE_CHANNELS:
+
+            value = wrapAngle(value)
+
+        return value
+
+    def _evaluateCurve(self, frame):
+
+        times = sorted(self.keys)
+
+        if not times:
+
+            return 0.0
+
+        # Cycling curves repeat their keys outside of them
+        cycle = self.attrs.get("preInfinity", "constant") if frame < times[0] else self.attrs.get("postInfinity", "constant")
+
+        if cycle == "cycle" and times[-1] > times[0]:
+
+            frame = times[0] + (frame - times[0]) % (times[-1] - times[0])
+
+        # Hold the first and last values outside of the keys
+        if frame <= times[0]:
+
+            return self.keys[times[0]]
+
+        if frame >= times[-1]:
+
+            return self.keys[times[-1]]
+
+        # Linear in between keys
+        index = bisect.bisect_right(times, frame)
+        start, end = times[index - 1], times[index]
+
+        if frame == start:
+
+            return self.keys[start]
+
+        return self.keys[start] + (self.keys[end] - self.keys[start]) * (frame - start) / float(end - start)
+
+    def _evaluateMatrix(self, frame):
+
+        # Shapes sit on their transform
+        if not isType(self._type, "transform"):
+
+            return composeMatrix((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+
+        matrix = composeMatrix([self._evaluate(attr, frame) for attr in ("tx", "ty", "tz")],
+                                [self._evaluate(attr, frame) for attr in ROTATE_CHANNELS],
+                                [self._evaluate(attr, frame) for attr in SCALE_CHANNELS])
+
+        # Scale and rotation turn about the rotate pivot, like Maya's without a separate scale pivot
+        if "rotatePivot" in self.attrs:
+
+            pivot = self.attrs["rotatePivot"][0]
+
+            for column in range(3):
+
+                matrix[12 + column] += pivot[column] - sum(pivot[k] * matrix[k * 4 + column] for k in range(3))
+
+        return matrix
+
+    def _evaluateWorldMatrix(self, frame):
+
+        matrix = self._evaluateMatrix(frame)
+
+        if self._parent is None:
+
+            return matrix
+
+        return multiplyMatrices(matrix, self._parent._evaluateWorldMatrix(frame))
+
+    def _history(self, seen):
+
+        nodes = []
+
+        for node in self._inputs:
+
+            if node in seen:
+
+                continue
+
+            seen.add(node)
+            nodes.append(node)
+            nodes.extend(node._history(seen))
+
+        return nodes
+
+    @counted
+    def addKeys(self, times, values, tangentInType = "linear", tangentOutType = "linear", unit = None):
+
+        # Like the API, angles come in as radians and are kept as degrees
+        if self._type == "animCurveTA":
+
+            values = [math.degrees(value) for value in values]
+
+        self.keys.update(zip(times, values))
+
+    @counted
+    def longName(self):
+
+        if self._parent is None:
+
+            return "|" + self._name
+
+        return self._parent.longName() + "|" + self._name
+
+    @counted
+    def getAttr(self, attr):
+
+        return self.attrs.get(attr, 0.0)
+
+    @counted
+    def getGeometry(self):
+
+        return [node for node in self._outputs if isType(node._type, "shape")]
+
+    @counted
+    def getInfluence(self):
+
+        return [node for node in self._inputs if isType(node._type, "transform")]
+
+    @counted
+    def getParent(self, generations = 1):
+
+        parent = self._parent
+
+        if generations == -1:
+
+            node = self
+
+            while node._parent is not None:
+
+                node = node._parent
+
+            return node if node is not self else None
+
+        for i in range(generations - 1):
+
+            if parent is None:
+
+                break
+
+            parent = parent._parent
+
+        return parent
+
+    @counted
+    def getShape(self):
+
+        for child in self._children:
+
+            if isType(child._type, "shape"):
+
+                return child
+
+        return None
+
+    @counted
+    def getTarget(self):
+
+        return [node for node in self._inputs if isType(node._type, "transform")]
+
+    @counted
+    def getVertices(self):
+
+        return (self.attrs.get("faceCounts", []), self.attrs.get("faceVertices", []))
+
+    @counted
+    def getWeights(self, geometry):
+
+        for weights in self.attrs.get("weights", []):
+
+            yield weights
+
+    @counted
+    def isReferenced(self):
+
+        return self.refFile is not None
+
+    @counted
+    def isVisible(self):
+
+        node = self
+
+        while node is not None:
+
+            if not node.visible:
+
+                return False
+
+            node = node._parent
+
+        return True
+
+    @counted
+    def listConnections(self, type = None):
+
+        nodes = []
+
+        for node in self._inputs + self._outputs:
+
+            if node in nodes:
+
+                continue
+
+            if type is None or isType(node._type, type):
+
+                nodes.append(node)
+
+        return nodes
+
+    @counted
+    def listHistory(self, type = None):
+
+        return [node for node in self._history(set())
+                if type is None or isType(node._type, type)]
+
+    @counted
+    def listRelatives(self, parent = False, ad = False, type = None, children = False):
+
+        return listRelatives(self, parent = parent, ad = ad, type = type, children = children)
+
+    @counted
+    def name(self):
+
+        return self._name
+
+    @counted
+    def namespace(self):
+
+        if ":" not in self._name:
+
+            return ""
+
+        return self._name.rpartition(":")[0] + ":"
+
+    @counted
+    def referenceFile(self):
+
+        return self.refFile
+
+    @counted
+    def rename(self, name):
+
+        del scene.nodes[self._name]
+
+        self._name = scene.uniqueName(name)
+
+        scene.nodes[self._name] = self
+
+        return self
+
+    @counted
+    def select(self, r = True, add = False):
+
+        select(self, add = add)
+
+    @counted
+    def setAttr(self, attr, value):
+
+        self.attrs[attr] = value
+
+    @counted
+    def setParent(self, *args, **kwargs):
+
+        if kwargs.get("world"):
+
+            self._setParent(None)
+
+        else:
+
+            self._setParent(args[0])
+
+    @counted
+    def type(self):
+
+        return self._type
+
+# A node attribute, stands in for pymel's Attribute
+class Attribute(object):
+
+    def __init__(self, node, attr):
+
+        self._node = node
+        self._attr = SHORT_NAMES.get(attr, attr)
+
+    def __repr__(self):
+
+        return "Attribute(%r)" % str(self)
+
+    def __str__(self):
+
+        return self._node._name + "." + LONG_NAMES.get(self._attr, self._attr)
+
+    def __eq__(self, other):
+
+        return isinstance(other, Attribute) and (self._node, self._attr) == (other._node, other._attr)
+
+    def __ne__(self, other):
+
+        return not self == other
+
+    def __hash__(self):
+
+        return hash((self._node._name, self._attr))
+
+    @counted
+    def attrName(self, longName = False):
+
+        return LONG_NAMES.get(self._attr, self._attr) if longName else self._attr
+
+    @counted
+    def get(self, time = None):
+
+        if time is None:
+
+            return self._node.attrs.get(self._attr, ATTRIBUTE_DEFAULTS.get(self._attr, 0.0))
+
+        return self._node._evaluate(self._attr, time)
+
+    @counted
+    def listConnections(self, type = None, source = True, destination = True):
+
+        curve = self._node._curves.get(self._attr)
+
+        if source and curve is not None and (type is None or isType(curve._type, type)):
+
+            return [curve]
+
+        return []
+
+    @counted
+    def name(self):
+
+        return str(self)
+
+    @counted
+    def node(self):
+
+        return self._node
+
+    @counted
+    def set(self, value):
+
+        # A static value takes over from any procedural animation
+        self._node.motion.pop(self._attr, None)
+        self._node.attrs[self._attr] = value
+
+# Connects the source node into the destination node
+def connect(src, dst):
+
+    src._outputs.append(dst)
+    dst._inputs.append(src)
+
+# Connects an anim curve into a node channel, replacing any curve already there
+def connectCurve(curve, node, attr):
+
+    attr = SHORT_NAMES.get(attr, attr)
+
+    old = node._curves.get(attr)
+
+    if old is not None:
+
+        old._outputs.remove(node)
+        node._inputs.remove(old)
+        old._channel = None
+
+    node._curves[attr] = curve
+    curve._channel = attr
+
+    connect(curve, node)
+
+# Mel stand-in, records FBX options and writes fbx files
+class Mel:
+
+    @counted
+    def eval(self, command):
+
+        # The main viewport pane can be queried and managed
+        if command.startswith("paneLayout") and "$gMainPane" in command:
+
+            if " -q " in command:
+
+                return int(scene.paneManaged)
+
+            scene.paneManaged = command.split("-manage ")[1].split()[0] == "true"
+
+    @counted
+    def FBXExport(self, s = True, f = None):
+
+        scene.exports += 1
+
+        # Write the selected nodes and their keys
+        with open(f, "w") as fbx:
+
+            for node in scene.selection:
+
+                fbx.write(node.name() + "\n")
+
+                for attr in sorted(node._curves):
+
+                    keys = node._curves[attr].keys
+
+                    # Like FBX, key values are stored as 32 bit floats
+                    fbx.write("  %s %s\n" % (attr, " ".join("%s:%r" % (t, toFloat32(keys[t])) for t in sorted(keys))))
+
+                # Channels without a curve are written as their static value
+                for attr in sorted(node.attrs):
+
+                    if attr in TRANSFORM_CHANNELS + BLENDSHAPE_CHANNELS and attr not in node._curves:
+
+                        fbx.write("  %s =%r\n" % (attr, node.attrs[attr]))
+
+    def __getattr__(self, name):
+
+        # Any other FBX command sets an option
+        if not name.startswith("FBX"):
+
+            raise AttributeError(name)
+
+        def setOption(*args, **kwargs):
+
+            # Imported here, the stand-in is installed as pymel.core before the exporter is imported
+            import UnrealExporter.fbxOptions
+
+            calls[name] += 1
+
+            # Like the plugin, options take -v unless they are documented to take their value straight
+            if name in UnrealExporter.fbxOptions.POSITIONAL_OPTIONS:
+
+                if "v" in kwargs:
+
+                    raise RuntimeError("%s takes its value without -v" % name)
+
+                scene.fbxOptions[name] = args[0] if args else None
+
+            else:
+
+                if args:
+
+                    raise RuntimeError("%s needs its value set with -v" % name)
+
+                scene.fbxOptions[name] = kwargs.get("v")
+
+        return setOption
+
+mel = Mel()
+
+'''
+pymel.core stand-in functions
+'''
+
+@counted
+def about(batch = False):
+
+    # Runs like the UI, so the viewport gets managed
+    return False
+
+@counted
+def bakeResults(nodes, time = None, **kwargs):
+
+    nodes = flatten([nodes])
+
+    startTime, endTime = time
+
+    frames = range(int(startTime), int(endTime) + 1)
+
+    scene.bakeCalls += 1
+    scene.evaluatedFrames += len(frames)
+
+    # Sampled values per node channel
+    samples = []
+
+    for node in nodes:
+
+        node = PyNode(node)
+
+        # Plugs only bake their own channel
+        if isinstance(node, Attribute):
+
+            samples.append((node._node, collections.OrderedDict([(node._attr, [])])))
+
+            continue
+
+        samples.append((node, collections.OrderedDict((attr, []) for attr in getChannels(node))))
+
+    # Evaluate the scene on every frame and sample every channel
+    for frame in frames:
+
+        for node in scene.nodes.values():
+
+            node.attrs.get("tx")
+
+        for node, channels in samples:
+
+            for attr, values in channels.items():
+
+                values.append(node._evaluate(attr, frame))
+
+    # Key the samples onto a curve per channel
+    for node, channels in samples:
+
+        for attr, values in channels.items():
+
+            if kwargs.get("minimizeRotation") and attr in ROTATE_CHANNELS:
+
+                values = minimizeRotation(values)
+
+            curve = node._curves.get(attr)
+
+            if curve is None:
+
+                curve = createAnimCurve(node, attr, (), CURVE_TYPES.get(attr, "animCurveTU"))
+
+            if not kwargs.get("preserveOutsideKeys"):
+
+                curve.keys = {}
+
+            curve.keys.update(zip(frames, values))
+
+@counted
+def camera():
+
+    transform = Node("camera1", "transform")
+    shape = Node(transform.name() + "Shape", "camera", transform)
+    shape.attrs.update(CAMERA_ATTRS)
+
+    return [transform, shape]
+
+@counted
+def connectAttr(src, dst, force = False):
+
+    curve = PyNode(str(src).split(".")[0])
+    plug = PyNode(dst) if not isinstance(dst, Attribute) else dst
+
+    connectCurve(curve, plug._node, plug._attr)
+
+@counted
+def createNode(nodeType, name = None):
+
+    return Node(name or nodeType + "1", nodeType)
+
+# Nothing in the stand-in keeps state between frames, going to a frame only sets it
+@counted
+def currentTime(frame = None, update = True, q = False):
+
+    if frame is not None and not q:
+
+        scene.currentTime = frame
+
+    return scene.currentTime
+
+@counted
+def cutKey(*nodes, **kwargs):
+
+    for curve in getCurves(nodes):
+
+        curve.keys = {}
+
+@counted
+def delete(*nodes):
+
+    for node in [PyNode(node) for node in flatten(nodes)]:
+
+        for child in [node] + node._descendants():
+
+            if child._name in scene.nodes:
+
+                del scene.nodes[child._name]
+
+            if child in scene.selection:
+
+                scene.selection.remove(child)
+
+            # Break its connections
+            for input in child._inputs:
+
+                input._outputs.remove(child)
+
+            for output in child._outputs:
+
+                output._inputs.remove(child)
+
+                for attr, curve in list(output._curves.items()):
+
+                    if curve is child:
+
+                        del output._curves[attr]
+
+            child._inputs = []
+            child._outputs = []
+
+        node._setParent(None)
+
+@counted
+def error(message):
+
+    raise RuntimeError(message)
+
+@counted
+def evaluationManager(mode = None, q = False):
+
+    if q:
+
+        return [scene.evaluationMode]
+
+    # Every switch rebuilds the evaluation graph
+    if mode != scene.evaluationMode:
+
+        scene.evaluationSwitches += 1
+
+    scene.evaluationMode = mode
+
+@counted
+def exportAll(path, force = False, preserveReferences = False, type = None):
+
+    with open(path, "w") as sceneFile:
+
+        json.dump(saveScene(), sceneFile)
+
+    return path
+
+@counted
+def filterCurve(*curves, **kwargs):
+
+    # Unwrap rotation curves so no key jumps more than 180 degrees
+    for curve in flatten(curves):
+
+        if curve._type != "animCurveTA":
+
+            continue
+
+        times = sorted(curve.keys)
+
+        curve.keys = dict(zip(times, minimizeRotation([curve.keys[t] for t in times])))
+
+@counted
+def getAttr(plug, time = None):
+
+    return PyNode(plug).get(time = time)
+
+@counted
+def group(empty = True, name = "group1"):
+
+    return Node(name, "transform")
+
+@counted
+def keyframe(*nodes, **kwargs):
+
+    curves = getCurves(nodes)
+
+    query = kwargs.get("q") or kwargs.get("query")
+
+    # Query the times, values or indices of every key, as (time, value) pairs when both are asked for
+    if query and (kwargs.get("timeChange") or kwargs.get("valueChange") or kwargs.get("indexValue")):
+
+        result = []
+
+        for curve in curves:
+
+            for index, t in enumerate(sorted(curve.keys)):
+
+                if kwargs.get("indexValue"):
+
+                    result.append(index)
+
+                elif kwargs.get("timeChange") and kwargs.get("valueChange"):
+
+                    result.append((t, curve.keys[t]))
+
+                elif kwargs.get("timeChange"):
+
+                    result.append(t)
+
+                else:
+
+                    result.append(curve.keys[t])
+
+        return result
+
+    # Query all key times
+    if query:
+
+        times = set()
+
+        for curve in curves:
+
+            times.update(curve.keys)
+
+        return sorted(times)
+
+    # Shift all keys
+    if kwargs.get("edit") and kwargs.get("relative"):
+
+        offset = kwargs.get("tc", 0)
+
+        for curve in curves:
+
+            curve.keys = dict((t + offset, v) for t, v in curve.keys.items())
+
+# Infinity types are stored on the curves, only constant and cycle are evaluated, see Node._evaluateCurve
+@counted
+def setInfinity(*nodes, **kwargs):
+
+    curves = getCurves(nodes)
+
+    for flag, attr in (("preInfinite", "preInfinity"), ("postInfinite", "postInfinity")):
+
+        if kwargs.get("q") or kwargs.get("query"):
+
+            if kwargs.get(flag):
+
+                return [curve.attrs.get(attr, "constant") for curve in curves]
+
+        elif kwargs.get(flag):
+
+            for curve in curves:
+
+                curve.attrs[attr] = kwargs[flag]
+
+@counted
+def keyTangent(*nodes, **kwargs):
+
+    # Tangents aren't modelled, keys are linear, so every angle comes back flat
+    if kwargs.get("q") or kwargs.get("query"):
+
+        return [0.0] * len(keyframe(nodes, q = True, timeChange = True))
+
+@counted
+def listConnections(*nodes, **kwargs):
+
+    connections = []
+
+    for node in flatten(nodes):
+
+        # A plug only lists the curve driving it
+        if isinstance(node, Attribute):
+
+            for connection in node.listConnections(type = kwargs.get("type"),
+                                                    source = kwargs.get("source", True),
+                                                    destination = kwargs.get("destination", True)):
+
+                # Pairs of the plug and the curve
+                if kwargs.get("connections"):
+
+                    connections.append((node, connection))
+
+                elif connection not in connections:
+
+                    connections.append(connection)
+
+            continue
+
+        found = []
+
+        if kwargs.get("source", True):
+
+            found.extend(node._inputs)
+
+        if kwargs.get("destination", True):
+
+            found.extend(node._outputs)
+
+        for connection in found:
+
+            if kwargs.get("type") is not None and not isType(connection._type, kwargs["type"]):
+
+                continue
+
+            # Pairs of the node's own plug and the connected node
+            if kwargs.get("connections"):
+
+                attr = connection._channel if connection._channel is not None and connection in node._inputs else "message"
+
+                connections.append((Attribute(node, attr), connection))
+
+            elif connection not in connections:
+
+                connections.append(connection)
+
+    return connections
+
+@counted
+def listRelatives(node, parent = False, ad = False, type = None, children = False):
+
+    if parent:
+
+        nodes = [node._parent] if node._parent is not None else []
+
+    elif ad:
+
+        nodes = node._descendants()
+
+    else:
+
+        nodes = list(node._children)
+
+    return [n for n in nodes if type is None or isType(n._type, type)]
+
+@counted
+def loadPlugin(name, quiet = False):
+
+    pass
+
+@counted
+def ls(*patterns, **kwargs):
+
+    nodeType = kwargs.get("type")
+    patterns = flatten(patterns)
+
+    # Start from the given nodes, or the whole scene
+    if patterns and all(isinstance(p, Node) for p in patterns):
+
+        nodes = patterns
+
+    # Names without wildcards are looked up straight away
+    elif patterns and not any(isinstance(p, Node) or "*" in p or "?" in p for p in patterns):
+
+        nodes = [scene.nodes[p] for p in patterns if p in scene.nodes]
+
+    else:
+
+        nodes = [node for node in scene.nodes.values()
+                    if not patterns or any(matchName(node._name, str(p)) for p in patterns)]
+
+    if kwargs.get("dag"):
+
+        nodes = [node for node in nodes if isType(node._type, "transform") or isType(node._type, "shape")]
+
+    if nodeType is not None:
+
+        nodeTypes = nodeType if isinstance(nodeType, (list, tuple)) else [nodeType]
+
+        nodes = [node for node in nodes if any(isType(node._type, t) for t in nodeTypes)]
+
+    if kwargs.get("showType"):
+
+        result = []
+
+        for node in nodes:
+
+            result.extend([node, node._type])
+
+        return result
+
+    if kwargs.get("long"):
+
+        return [node.longName() for node in nodes]
+
+    return nodes
+
+@counted
+def nodeType(node, inherited = False, isTypeName = False):
+
+    typeName = node if isTypeName else PyNode(node)._type
+
+    if not inherited:
+
+        return typeName
+
+    types = []
+
+    while typeName is not None:
+
+        types.insert(0, typeName)
+
+        typeName = TYPE_PARENTS.get(typeName)
+
+    return types
+
+@counted
+def openFile(path, f = False, force = False):
+
+    # Stand-in scene files are json, scene descriptions (see createScene) or scenes saved by exportAll
+    if os.path.exists(path):
+
+        with open(path) as sceneFile:
+
+            data = json.load(sceneFile)
+
+        if "nodes" in data:
+
+            loadScene(data)
+
+        else:
+
+            createScene(data)
+
+    scene.path = path
+
+@counted
+def parent(*nodes, **kwargs):
+
+    nodes = [PyNode(node) for node in flatten(nodes)]
+
+    # Without world the last node is the new parent
+    if kwargs.get("world"):
+
+        newParent = None
+
+    else:
+
+        newParent = nodes.pop()
+
+    for node in nodes:
+
+        node._setParent(newParent)
+
+@counted
+def parentConstraint(target, obj, weight = 1, mo = False):
+
+    constraint = Node(obj.name() + "_parentConstraint1", "parentConstraint", obj)
+
+    connect(target, constraint)
+    connect(constraint, obj)
+
+    return constraint
+
+@counted
+def playbackOptions(q = True, minTime = False, maxTime = False):
+
+    if minTime:
+
+        return scene.startTime
+
+    return scene.endTime
+
+@counted
+def PyNode(name):
+
+    if isinstance(name, (Node, Attribute)):
+
+        return name
+
+    leafName, sep, attr = name.split("|")[-1].partition(".")
+
+    if leafName not in scene.nodes:
+
+        raise MayaNodeError("Maya Node does not exist: %r" % name)
+
+    if attr:
+
+        return Attribute(scene.nodes[leafName], attr)
+
+    return scene.nodes[leafName]
+
+@counted
+def sceneName():
+
+    return scene.path
+
+@counted
+def select(*nodes, **kwargs):
+
+    if kwargs.get("clear"):
+
+        scene.selection = []
+
+        return
+
+    nodes = flatten(nodes)
+
+    if not kwargs.get("add"):
+
+        scene.selection = []
+
+    for node in nodes:
+
+        if node not in scene.selection:
+
+            scene.selection.append(node)
+
+@counted
+def selected():
+
+    return list(scene.selection)
+
+@counted
+def setAttr(plug, value):
+
+    PyNode(plug).set(value)
+
+@counted
+def skinCluster(skin, q = False, query = False, influence = False):
+
+    if (q or query) and influence:
+
+        return [node for node in skin._inputs if isType(node._type, "transform")]
+
+# Undoes the last closed undo chunk
+# Only chunks are undoable in the stand-in, they put back the whole scene as it was when they were opened
+@counted
+def undo():
+
+    if scene.undoChunks:
+
+        scene.restore(scene.undoChunks.pop())
+
+@counted
+def undoInfo(q = False, query = False, state = None, stateWithoutFlush = None, openChunk = False, closeChunk = False,
+                chunkName = None):
+
+    if q or query:
+
+        return scene.undoEnabled
+
+    # Turning the queue off flushes it
+    if state is not None:
+
+        scene.undoEnabled = state
+
+        if not state:
+
+            scene.undoChunks = []
+            scene.openChunk = None
+
+    if stateWithoutFlush is not None:
+
+        scene.undoEnabled = stateWithoutFlush
+
+    if openChunk and scene.undoEnabled and scene.openChunk is None:
+
+        scene.openChunk = scene.snapshot()
+
+    if closeChunk and scene.openChunk is not None:
+
+        scene.undoChunks.append(scene.openChunk)
+        scene.openChunk = None
+
+# Prints a warning the way Maya does
+@counted
+def warning(message):
+
+    sys.stderr.write("# Warning: %s\n" % message)
+
+@counted
+def xform(target, q = True, objectSpace = False, worldSpace = False, translation = False, matrix = False):
+
+    # Vertex positions of a mesh, flattened
+    if ".vtx[" in str(target):
+
+        node = PyNode(str(target).split(".")[0])
+
+        return [value for point in node.attrs.get("points", []) for value in point]
+
+    node = PyNode(target)
+
+    if matrix:
+
+        return node.attrs.get("matrix", [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+
+    return [node.attrs.get("tx", 0.0), node.attrs.get("ty", 0.0), node.attrs.get("tz", 0.0)]
+
+@counted
+def spaceLocator(n = "locator1", p = (0, 0, 0)):
+
+    transform = Node(n, "transform")
+
+    Node(transform.name() + "Shape", "locator", transform)
+
+    return transform
+
+# maya.cmds stand-in, returns plain strings instead of nodes
+class Cmds:
+
+    @countedAs("cmds.connectionInfo")
+    def connectionInfo(self, plug, isDestination = False):
+
+        # Procedural animation stands in for an incoming connection
+        attr = PyNode(plug)
+
+        return attr._attr in attr._node._curves or attr._attr in attr._node.motion
+
+    # Expression nodes keep their text as the expression attribute
+    @countedAs("cmds.expression")
+    def expression(self, node, q = True, string = True):
+
+        return PyNode(node).attrs.get("expression", "")
+
+    @countedAs("cmds.getAttr")
+    def getAttr(self, plug, time = None):
+
+        return getAttr(plug, time = time)
+
+    @countedAs("cmds.keyframe")
+    def keyframe(self, *nodes, **kwargs):
+
+        result = keyframe(*nodes, **kwargs)
+
+        # Pairs come back flat
+        if isinstance(result, list) and result and isinstance(result[0], tuple):
+
+            result = [value for pair in result for value in pair]
+
+        return result
+
+    @countedAs("cmds.setInfinity")
+    def setInfinity(self, *nodes, **kwargs):
+
+        return setInfinity(*nodes, **kwargs)
+
+    @countedAs("cmds.keyTangent")
+    def keyTangent(self, *nodes, **kwargs):
+
+        return keyTangent(*nodes, **kwargs)
+
+    @countedAs("cmds.listConnections")
+    def listConnections(self, *nodes, **kwargs):
+
+        result = listConnections(*[PyNode(node) for node in flatten(nodes)], **kwargs)
+
+        return [str(item) for item in flatten(result)]
+
+    @countedAs("cmds.ls")
+    def ls(self, *patterns, **kwargs):
+
+        longNames = kwargs.pop("long", False)
+
+        result = ls(*patterns, **kwargs)
+
+        return [item.longName() if longNames and isinstance(item, Node) else str(item) for item in result]
+
+    @countedAs("cmds.nodeType")
+    def nodeType(self, node, inherited = False, isTypeName = False):
+
+        return nodeType(node, inherited = inherited, isTypeName = isTypeName)
+
+cmds = Cmds()
+
+# Scene backend reading the stand-in scene straight from memory, installed with the stand-in
+class StandinBackend(UnrealExporter.backend.SceneBackend):
+
+    @countedAs("backend.getInheritedTypes")
+    def getInheritedTypes(self, nodeType):
+
+        types = []
+
+        while nodeType is not None:
+
+            types.insert(0, nodeType)
+
+            nodeType = TYPE_PARENTS.get(nodeType)
+
+        return types
+
+    @countedAs("backend.getAttributes")
+    def getAttributes(self, plugs):
+
+        return [float(PyNode(plug).get()) for plug in plugs]
+
+    @countedAs("backend.listChannels")
+    def listChannels(self, nodes):
+
+        channels = []
+
+        for name in nodes:
+
+            node = PyNode(name)
+
+            channels.extend(str(Attribute(node, attr)) for attr in getChannels(node))
+
+        return channels
+
+    @countedAs("backend.listConnections")
+    def listConnections(self, nodes, nodeType = None):
+
+        return [str(node) for node in listConnections(*[PyNode(name) for name in nodes], type = nodeType)]
+
+    # Full paths are built on the way down, instead of climbing up from every node
+    @countedAs("backend.listDescendants")
+    def listDescendants(self, node):
+
+        node = PyNode(node)
+
+        paths, nodeTypes, referenced = [], [], set()
+
+        stack = [(child, node.longName()) for child in reversed(node._children)]
+
+        while stack:
+
+            child, parentPath = stack.pop()
+
+            path = parentPath + "|" + child._name
+
+            paths.append(path)
+            nodeTypes.append(child._type)
+
+            if child.refFile is not None:
+
+                referenced.add(path)
+
+            stack.extend((grandChild, path) for grandChild in reversed(child._children))
+
+        return paths, nodeTypes, referenced
+
+    # The joints a handle solves are stored on it by name, see createIkHandle
+    @countedAs("backend.listIkHandles")
+    def listIkHandles(self):
+
+        return [(node.longName(), [scene.nodes[name].longName() for name in node.attrs["ikChain"]])
+                    for node in scene.nodes.values() if node._type == "ikHandle"]
+
+    # Procedural animation stands in for a connection from the time node
+    # Joints an IK handle solves move without any connection, like Maya's solvers
+    @countedAs("backend.listSourceConnections")
+    def listSourceConnections(self, nodes):
+
+        connections = []
+
+        solved = set()
+
+        for node in scene.nodes.values():
+
+            if node._type == "ikHandle":
+
+                solved.update(node.attrs["ikChain"])
+
+        for name in nodes:
+
+            # The time node is not in the stand-in scene
+            if name.partition(".")[0].split("|")[-1] not in scene.nodes:
+
+                continue
+
+            item = PyNode(name)
+
+            node = item._node if isinstance(item, Attribute) else item
+            attrs = [item._attr] if isinstance(item, Attribute) else None
+
+            for attr, curve in node._curves.items():
+
+                if attrs is None or attr in attrs:
+
+                    connections.append((str(Attribute(node, attr)), curve._name + ".output", curve._type))
+
+            for attr in node.motion:
+
+                if node._name not in solved and (attrs is None or attr in attrs):
+
+                    connections.append((str(Attribute(node, attr)), "time1.outTime", "time"))
+
+            # Whole nodes list their other inputs too
+            if attrs is None:
+
+                for source in node._inputs:
+
+                    if source._channel is None:
+
+                        connections.append((node._name + ".message", source._name + ".message", source._type))
+
+        return connections
+
+    @countedAs("backend.listNodeTypes")
+    def listNodeTypes(self, dag = False, long = False):
+
+        nodes = list(scene.nodes.values())
+
+        if dag:
+
+            nodes = [node for node in nodes if isType(node._type, "transform") or isType(node._type, "shape")]
+
+        return [node.longName() if long else node._name for node in nodes], [node._type for node in nodes]
+
+'''
+Scene generators
+'''
+
+# Creates an anim curve on a node channel with a key on every given frame
+def createAnimCurve(node, attr, frames, curveType = "animCurveTL"):
+
+    attr = SHORT_NAMES.get(attr, attr)
+
+    curve = Node(node.name() + "_" + LONG_NAMES.get(attr, attr), curveType)
+    curve.keys = dict((frame, float(frame)) for frame in frames)
+
+    connectCurve(curve, node, attr)
+
+    return curve
+
+# Creates a mesh shape with a grid of points
+def createMesh(name, parent = None, points = 8):
+
+    mesh = Node(name, "mesh", parent)
+    mesh.attrs["points"] = [(float(i), float(i % 2), 0.0) for i in range(points)]
+    mesh.attrs["faceCounts"] = [4] * (points // 4)
+    mesh.attrs["faceVertices"] = list(range(points - points % 4))
+
+    return mesh
+
+# Creates a transform with a shape underneath it
+def createShape(name, shapeType, parent = None):
+
+    transform = Node(name, "transform", parent)
+
+    if shapeType == "mesh":
+
+        createMesh(name + "Shape", transform)
+
+    else:
+
+        Node(name + "Shape", shapeType, transform)
+
+    return transform
+
+# Creates a referenced game rig
+# joints: number of joints in the skeleton, chained in branches of depth joints // branches
+# meshes: number of skinned meshes
+# targets: number of blendshape targets on the first mesh
+# constraints: number of constraints from a foreign namespace on the skeleton
+# controlDepth, controlWidth: nests controlDepth levels of controlWidth extra controls under the controls group
+# animated: keys the main control across the playback range and moves the joints,
+#           the joints spin at different speeds so their rotations wrap past 180 degrees
+# animatedJoints: how many joints move, from the root down, every joint if None, like a facial rig where most joints hold still
+# keyedFrames: (start, end) keys the moving joints on every frame of the range instead of moving them procedurally,
+#              like an animation that is shorter than the playback range
+# unweightedJoints: how many joints at the end of each branch carry no weight, like twist and helper joints left in the skin
+def createCharacter(namespace, joints = 10, meshes = 1, targets = 0, constraints = 0, branches = 1,
+                    controlDepth = 0, controlWidth = 1, animated = True, animatedJoints = None, keyedFrames = None,
+                    unweightedJoints = 0, ikJoints = 0):
+
+    ns = namespace + ":"
+    refFile = FileReference(namespace + ".ma", ns)
+
+    top = Node(ns + "rig", "transform")
+    controls = Node(ns + "controls", "transform", top)
+    mainCtrl = createShape(ns + "main_ctrl", "nurbsCurve", controls)
+    skeleton = Node(ns + "skeleton", "transform", top)
+    geo = Node(ns + "geo", "transform", top)
+
+    # Build the skeleton as branches off of the root joint
+    root = Node(ns + "root", "joint", skeleton)
+    jointList = [root]
+    depth = max(1, (joints - 1) // max(1, branches))
+
+    for i in range(joints - 1):
+
+        parent = root if i % depth == 0 else jointList[-1]
+
+        jointList.append(Node(ns + "joint%d" % i, "joint", parent))
+
+    # Skin every mesh to every joint, the last joints of every branch get no weight
+    weighted = [float(i == 0 or (i - 1) % depth < depth - unweightedJoints) for i in range(len(jointList))]
+    weights = [weight / sum(weighted) for weight in weighted]
+
+    meshList = []
+
+    for i in range(meshes):
+
+        mesh = createShape(ns + "body%d" % i, "mesh", geo)
+        skin = Node(ns + "skinCluster%d" % i, "skinCluster")
+
+        for joint in jointList:
+
+            connect(joint, skin)
+
+        connect(skin, mesh.getShape())
+
+        # Every vertex weighted evenly to every weighted joint
+        vertexCount = len(mesh.getShape().attrs["points"])
+        skin.attrs["weights"] = [weights] * vertexCount
+
+        meshList.append(mesh)
+
+    # Blendshape targets on the first mesh
+    if targets and meshList:
+
+        blendShape = Node(ns + "blendShape1", "blendShape")
+
+        for i in range(targets):
+
+            target = createShape(ns + "target%d" % i, "mesh", geo)
+            target.visible = False
+
+            connect(target, blendShape)
+
+        connect(blendShape, meshList[0].getShape())
+
+    # Extra controls, like the fk chains and offset groups of a production rig
+    if controlDepth:
+
+        createHierarchy(ns + "ctrl", controlDepth, controlWidth, parent = controls, shapeType = "nurbsCurve")
+
+    # Foreign constraints, e.g. a prop driving a hand joint
+    for i in range(constraints):
+
+        joint = jointList[(i + 1) % len(jointList)]
+
+        Node("prop:parentConstraint%d" % i, "parentConstraint", joint)
+
+    # Animation on the main control
+    if animated:
+
+        for attr in ("translateX", "translateY", "translateZ"):
+
+            createAnimCurve(mainCtrl, attr, (scene.startTime, scene.endTime))
+
+        root.motion["tx"] = [0.0, 0.5, 0.0, 0.0]
+
+        for i, joint in enumerate(jointList[:animatedJoints]):
+
+            joint.motion["rx"] = [(i * 10.0) % 90.0, 0.0, 45.0, 60.0 + i]
+            joint.motion["rz"] = [0.0, (i % 5) * 2.5, 30.0, 48.0]
+
+        # An IK handle on the control rig solving the last joints of the first branch
+        if ikJoints:
+
+            chain = jointList[max(1, depth - ikJoints):depth + 1]
+
+            createIkHandle(ns + "ikHandle1", chain[0], chain[-1], controls)
+
+        # Bake the motion down to keys
+        if keyedFrames:
+
+            for joint in jointList:
+
+                for attr in list(joint.motion):
+
+                    keys = dict((frame, joint._evaluate(attr, frame)) for frame in range(keyedFrames[0], keyedFrames[1] + 1))
+
+                    createAnimCurve(joint, attr, (), CURVE_TYPES.get(attr, "animCurveTU")).keys = keys
+
+                joint.motion = {}
+
+    # Everything in the namespace comes from the reference
+    for node in scene.nodes.values():
+
+        if node._name.startswith(ns):
+
+            node.refFile = refFile
+
+    return top
+
+# Creates an IK handle solving the joints from a start joint down to an end joint's parent, the end effector goes there too
+# The handle moves over time, and the solver turns the joints it solves
+def createIkHandle(name, startJoint, endJoint, parent = None):
+
+    handle = Node(name, "ikHandle", parent)
+    Node(name.rpartition(":")[0] + ":effector1" if ":" in name else "effector1", "ikEffector", endJoint._parent)
+
+    chain = []
+    joint = endJoint._parent
+
+    while joint is not None and joint is not startJoint._parent:
+
+        chain.insert(0, joint)
+
+        joint = joint._parent
+
+    handle.attrs["ikChain"] = [joint._name for joint in chain]
+    handle.motion["tx"] = [0.0, 0.2, 10.0, 50.0]
+
+    for i, joint in enumerate(chain):
+
+        joint.motion["ry"] = [5.0 * i, 0.0, 20.0, 50.0]
+
+    return handle
+
+# Creates a camera
+# animated: flies the camera along a path, turning it all the way around, and zooms the lens
+def createCamera(name, animated = True):
+
+    transform = createShape(name, "camera")
+
+    shape = transform.getShape()
+    shape.attrs.update(CAMERA_ATTRS)
+
+    if animated:
+
+        transform.motion["tx"] = [0.0, 0.8, 0.0, 0.0]
+        transform.motion["ty"] = [150.0, 0.0, 20.0, 90.0]
+        transform.motion["tz"] = [-300.0, 0.0, 50.0, 120.0]
+        transform.motion["rx"] = [-10.0, 0.0, 15.0, 70.0]
+        transform.motion["ry"] = [0.0, 0.9, 0.0, 0.0]
+        transform.motion["rz"] = [0.0, 0.0, 5.0, 40.0]
+
+        shape.motion["focalLength"] = [35.0, 0.0, 15.0, 200.0]
+
+    return transform
+
+# Creates a hierarchy depth levels deep with width nodes on every level, each level hangs off of the last node of the one above
+# Deep hierarchies have a small width, wide ones a small depth, the nodes get a shape of shapeType if one is given
+# Returns the top node
+def createHierarchy(name, depth, width, parent = None, shapeType = None):
+
+    top = Node(name, "transform", parent)
+    levelParent = top
+
+    for level in range(depth):
+
+        for i in range(width):
+
+            nodeName = "%s_%d_%d" % (name, level, i)
+
+            node = createShape(nodeName, shapeType, levelParent) if shapeType else Node(nodeName, "transform", levelParent)
+
+        levelParent = node
+
+    return top
+
+# Creates a new scene from a description
+# e.g. {"startTime": 1, "endTime": 100,
+#       "characters": [{"namespace": "hero", "joints": 60}],
+#       "cameras": ["shotCam"],
+#       "staticMeshes": [{"name": "crate", "namespace": "prop"}],
+#       "hierarchies": [{"name": "set", "depth": 20, "width": 50}]}
+# Character entries take the createCharacter keyword arguments
+def createScene(description):
+
+    newScene(description.get("startTime", 1), description.get("endTime", 100))
+
+    for character in description.get("characters", []):
+
+        character = dict(character)
+
+        createCharacter(character.pop("namespace"), **character)
+
+    for cameraName in description.get("cameras", []):
+
+        createCamera(cameraName)
+
+    for staticMesh in description.get("staticMeshes", []):
+
+        createStaticMesh(staticMesh["name"], staticMesh.get("namespace"))
+
+    for hierarchy in description.get("hierarchies", []):
+
+        createHierarchy(hierarchy["name"], hierarchy["depth"], hierarchy["width"])
+
+    return scene
+
+# Creates a static mesh, in a namespace with a root locator if one is given
+def createStaticMesh(name, namespace = None):
+
+    if namespace is None:
+
+        return createShape(name, "mesh")
+
+    ns = namespace + ":"
+    root = createShape(ns + "root", "locator")
+
+    return createShape(ns + name, "mesh", root)
+
+# Rebuilds a scene saved by saveScene
+def loadScene(data):
+
+    newScene(data["startTime"], data["endTime"])
+
+    refFiles = {}
+
+    # Create every node, then link them up
+    for entry in data["nodes"]:
+
+        node = Node(entry["name"], entry["type"])
+        node.attrs = entry["attrs"]
+        node.motion = entry["motion"]
+        node.keys = dict((t, v) for t, v in entry["keys"])
+        node.visible = entry["visible"]
+
+        if entry["refFile"] is not None:
+
+            path, namespace, imported = entry["refFile"]
+
+            if path not in refFiles:
+
+                refFiles[path] = FileReference(path, namespace)
+                refFiles[path].imported = imported
+
+            node.refFile = refFiles[path]
+
+    for entry in data["nodes"]:
+
+        node = scene.nodes[entry["name"]]
+
+        node._parent = scene.nodes[entry["parent"]] if entry["parent"] is not None else None
+        node._children = [scene.nodes[name] for name in entry["children"]]
+        node._inputs = [scene.nodes[name] for name in entry["inputs"]]
+        node._outputs = [scene.nodes[name] for name in entry["outputs"]]
+
+        for attr, name in entry["curves"]:
+
+            node._curves[attr] = scene.nodes[name]
+            scene.nodes[name]._channel = attr
+
+    return scene
+
+# Saves the scene as json data, loadScene rebuilds it
+def saveScene():
+
+    nodes = []
+
+    for node in scene.nodes.values():
+
+        refFile = node.refFile
+
+        nodes.append({"name" : node._name,
+                        "type" : node._type,
+                        "parent" : node._parent._name if node._parent is not None else None,
+                        "children" : [child._name for child in node._children],
+                        "inputs" : [input._name for input in node._inputs],
+                        "outputs" : [output._name for output in node._outputs],
+                        "curves" : [[attr, curve._name] for attr, curve in node._curves.items()],
+                        "attrs" : node.attrs,
+                        "motion" : node.motion,
+                        "keys" : [[t, node.keys[t]] for t in sorted(node.keys)],
+                        "visible" : node.visible,
+                        "refFile" : [refFile.path, refFile.namespace, refFile.imported] if refFile else None})
+
+    return {"startTime" : scene.startTime, "endTime" : scene.endTime, "nodes" : nodes}
+
+# Installs the stand-in as pymel.core and maya.cmds
+def install():
+
+    module = sys.modules[__name__]
+
+    pymel = types.ModuleType("pymel")
+    pymel.core = module
+
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+
+    sys.modules["pymel"] = pymel
+    sys.modules["pymel.core"] = module
+    sys.modules["maya"] = maya
+    sys.modules["maya.cmds"] = cmds
+
+    UnrealExporter.backend.setBackend(StandinBackend())
+
+# Checks if the stand-in is installed as pymel.core
+def isInstalled():
+
+    return sys.modules.get("pymel.core") is sys.modules[__name__]
+
+# Resets the stand-in to an empty scene
+def newScene(startTime = 1, endTime = 100):
+
+    global scene
+
+    # FBX options belong to the plugin, they outlive the scene
+    fbxOptions = scene.fbxOptions
+
+    scene = Scene(startTime, endTime)
+    scene.fbxOptions = fbxOptions
+
+    calls.clear()
+
+    return scene
@@ -0,0 +1,16 @@
+'''
+Test setup, the exporter modules are imported against the stand-in scene in benchmarks/standin.py
+'''
+
+# Import statements
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+# Install the stand-in before any test imports the exporter
+import standin
+standin.install()
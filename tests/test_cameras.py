@@ -0,0 +1,91 @@
+'''
+Tests for the analytic camera conversion in UnrealExporter.cameras
+'''
+
+# Import statements
+import numpy
+import pytest
+
+import standin
+
+# Import cameras module from UnrealExporter package
+import UnrealExporter.cameras
+
+# Builds a flat world matrix from translate, rotate and scale, in the xyz rotate order
+def buildMatrix(translate, rotate, scale = (1.0, 1.0, 1.0)):
+
+    return standin.composeMatrix(translate, rotate, scale)
+
+# Builds the matrix a converted translate and rotate give the export camera
+def buildConverted(translate, rotate):
+
+    return numpy.array(buildMatrix(translate, rotate)).reshape(4, 4)
+
+# Builds the matrix the export camera should have, the source turned by the offset in its own space, without scale
+def buildExpected(matrix, offsetRotateY, pivot = (0.0, 0.0, 0.0)):
+
+    matrix = numpy.array(matrix).reshape(4, 4)
+
+    offset = numpy.array(buildMatrix((0.0, 0.0, 0.0), (0.0, offsetRotateY, 0.0))).reshape(4, 4)
+
+    expected = numpy.identity(4)
+    expected[:3, :3] = numpy.matmul(offset[:3, :3], matrix[:3, :3] / numpy.linalg.norm(matrix[:3, :3], axis = 1)[:, numpy.newaxis])
+    expected[3] = numpy.matmul(list(pivot) + [1.0], matrix)
+
+    return expected
+
+# Source cameras, gimbal locked ones included, with non-uniform scale
+MATRICES = [buildMatrix((10.0, -20.0, 30.0), (10.0, 20.0, 30.0)),
+            buildMatrix((0.0, 5.0, 0.0), (-120.0, 60.0, 170.0), (1.0, 2.0, 0.5)),
+            buildMatrix((1.0, 2.0, 3.0), (45.0, 90.0, 0.0)),
+            buildMatrix((1.0, 2.0, 3.0), (0.0, -90.0, 30.0), (3.0, 1.0, 1.0))]
+
+# The converted rotations rebuild the source turned by the offset, with the default and with other offsets
+@pytest.mark.parametrize("offsetRotateY", (UnrealExporter.cameras.OFFSET_ROTATE_Y, 30.0, -135.0))
+def testConvertMatrices(offsetRotateY):
+
+    translate, rotate = UnrealExporter.cameras.convertMatrices(MATRICES, offsetRotateY)
+
+    for matrix, frameTranslate, frameRotate in zip(MATRICES, translate.T, rotate.T):
+
+        assert numpy.allclose(buildConverted(frameTranslate, frameRotate), buildExpected(matrix, offsetRotateY), atol = 1e-6)
+
+# The export camera sits on the pivot, one for every frame or one per frame
+def testConvertMatricesPivot():
+
+    pivot = (5.0, -3.0, 12.0)
+
+    translate, rotate = UnrealExporter.cameras.convertMatrices(MATRICES, pivots = pivot)
+
+    for matrix, frameTranslate, frameRotate in zip(MATRICES, translate.T, rotate.T):
+
+        assert numpy.allclose(buildConverted(frameTranslate, frameRotate),
+                                buildExpected(matrix, UnrealExporter.cameras.OFFSET_ROTATE_Y, pivot), atol = 1e-6)
+
+    pivots = [(float(i), 0.0, -float(i)) for i in range(len(MATRICES))]
+
+    translate, rotate = UnrealExporter.cameras.convertMatrices(MATRICES, pivots = pivots)
+
+    for matrix, framePivot, frameTranslate in zip(MATRICES, pivots, translate.T):
+
+        assert numpy.allclose(frameTranslate, numpy.matmul(list(framePivot) + [1.0], numpy.array(matrix).reshape(4, 4))[:3])
+
+# One frame at a time gives the same values, before the Euler filter
+def testConvertMatrix():
+
+    pivot = (1.0, 2.0, 3.0)
+
+    for matrix in MATRICES:
+
+        translate, rotate = UnrealExporter.cameras.convertMatrix(matrix, 30.0, pivot)
+
+        assert numpy.allclose(buildConverted(translate, rotate), buildExpected(matrix, 30.0, pivot), atol = 1e-6)
+
+# Rotations are Euler filtered across frames
+def testConvertMatricesFiltered():
+
+    matrices = [buildMatrix((0.0, 0.0, 0.0), (0.0, 0.0, angle)) for angle in range(0, 720, 10)]
+
+    translate, rotate = UnrealExporter.cameras.convertMatrices(matrices)
+
+    assert numpy.all(numpy.abs(numpy.diff(rotate, axis = 1)) <= 180.0)
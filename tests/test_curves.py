@@ -0,0 +1,74 @@
+'''
+Tests for the Euler filter in UnrealExporter.curves
+'''
+
+# Import statements
+import numpy
+
+import standin
+
+# Import curves module from UnrealExporter package
+import UnrealExporter.curves
+
+# Builds the rotation matrices of rotations shaped (3, frames), in degrees with the xyz rotate order
+def getMatrices(rotations):
+
+    return numpy.array([standin.composeMatrix((0.0, 0.0, 0.0), rotation) for rotation in numpy.asarray(rotations).T])
+
+# A rotation spinning past 180 comes back unwrapped, without changing any frame's orientation
+def testEulerFilterUnwraps():
+
+    rotations = numpy.array([[0.0, 90.0, 170.0, -170.0, -90.0, 0.0],
+                                [10.0, 10.0, 10.0, 10.0, 10.0, 10.0],
+                                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]])
+
+    filtered = UnrealExporter.curves.eulerFilterArrays(rotations[numpy.newaxis])[0]
+
+    assert numpy.allclose(filtered[0], [0.0, 90.0, 170.0, 190.0, 270.0, 360.0])
+    assert numpy.allclose(getMatrices(filtered), getMatrices(rotations))
+
+# Frames on the equivalent solution are switched back to the one the curve is on
+def testEulerFilterPicksClosestSolution():
+
+    rotations = numpy.array([[10.0, 20.0, 30.0, 40.0],
+                                [30.0, 35.0, 40.0, 45.0],
+                                [5.0, 10.0, 15.0, 20.0]])
+
+    # Every other frame flipped to the equivalent rotation
+    flipped = rotations.copy()
+    flipped[:, 1::2] = [[180.0], [180.0], [180.0]] + flipped[:, 1::2] * [[1.0], [-1.0], [1.0]]
+    flipped = (flipped + 180.0) % 360.0 - 180.0
+
+    filtered = UnrealExporter.curves.eulerFilterArrays(flipped[numpy.newaxis])[0]
+
+    assert numpy.allclose(filtered, rotations)
+    assert numpy.allclose(getMatrices(filtered), getMatrices(flipped))
+
+# Every node is filtered on its own, with its own middle axis
+def testEulerFilterMiddleAxes():
+
+    rotations = numpy.array([[[0.0, 0.0], [0.0, 0.0], [0.0, 0.0]],
+                                [[0.0, 180.0], [0.0, 180.0], [0.0, 180.0]]])
+
+    filtered = UnrealExporter.curves.eulerFilterArrays(rotations, middleAxes = [1, 0])
+
+    assert numpy.allclose(filtered[0], rotations[0])
+
+    # 180 on every axis is the equivalent of no rotation for a rotate order with x in the middle
+    assert numpy.allclose(filtered[1], [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0]])
+
+# A single frame has nothing to filter against
+def testEulerFilterSingleFrame():
+
+    rotations = numpy.array([[[400.0], [0.0], [-400.0]]])
+
+    assert numpy.array_equal(UnrealExporter.curves.eulerFilterArrays(rotations), rotations)
+
+# Unwrapping arrays gives the same values as minimizeRotation one curve at a time
+def testUnwrapArraysMatchesMinimizeRotation():
+
+    values = numpy.random.RandomState(1).uniform(-180.0, 180.0, (4, 50))
+
+    unwrapped = UnrealExporter.curves.unwrapArrays(values)
+
+    assert numpy.allclose(unwrapped, [UnrealExporter.curves.minimizeRotation(list(row)) for row in values])
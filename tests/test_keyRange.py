@@ -0,0 +1,71 @@
+'''
+Tests for finding the range keys move over in UnrealExporter.keyRange
+'''
+
+# Import statements
+import pytest
+
+# Import keyRange module from UnrealExporter package
+import UnrealExporter.keyRange
+
+# Both ways of scanning the keys
+SCANS = (UnrealExporter.keyRange.getMovingRange, UnrealExporter.keyRange.getMovingRangeLoop)
+
+# Builds flat key lists, as maya.cmds returns them, from curves given as lists of (time, value, inAngle, outAngle)
+def buildKeys(curves):
+
+    indices, times, values, inAngles, outAngles = [], [], [], [], []
+
+    for curve in curves:
+
+        for index, (time, value, inAngle, outAngle) in enumerate(curve):
+
+            indices.append(index)
+            times.append(time)
+            values.append(value)
+            inAngles.append(inAngle)
+            outAngles.append(outAngle)
+
+    return indices, times, values, inAngles, outAngles
+
+# Holds at either end are trimmed, the range runs over the moving keys of every curve
+@pytest.mark.parametrize("scan", SCANS)
+def testMovingRange(scan):
+
+    keys = buildKeys([[(0.0, 1.0, 0.0, 0.0), (10.0, 1.0, 0.0, 0.0), (20.0, 5.0, 0.0, 0.0), (100.0, 5.0, 0.0, 0.0)],
+                        [(0.0, 0.0, 0.0, 0.0), (30.0, 0.0, 0.0, 0.0), (40.0, 2.0, 0.0, 0.0), (50.0, 2.0, 0.0, 0.0)]])
+
+    assert scan(*keys) == (10.0, 40.0)
+
+# Held keys with tangents that aren't flat still move in between
+@pytest.mark.parametrize("scan", SCANS)
+def testMovingRangeTangents(scan):
+
+    keys = buildKeys([[(0.0, 1.0, 0.0, 0.0), (10.0, 1.0, 0.0, 15.0), (20.0, 1.0, 0.0, 0.0), (30.0, 1.0, 0.0, 0.0)]])
+
+    assert scan(*keys) == (10.0, 20.0)
+
+# The last key of one curve and the first of the next are never a segment
+@pytest.mark.parametrize("scan", SCANS)
+def testMovingRangeCurveBorders(scan):
+
+    keys = buildKeys([[(0.0, 1.0, 0.0, 0.0), (10.0, 1.0, 0.0, 0.0)],
+                        [(20.0, 7.0, 0.0, 0.0), (30.0, 7.0, 0.0, 0.0)]])
+
+    assert scan(*keys) is None
+
+# Nothing moves, or there are no keys at all
+@pytest.mark.parametrize("scan", SCANS)
+def testMovingRangeStill(scan):
+
+    assert scan(*buildKeys([[(5.0, 2.0, 0.0, 0.0)], [(1.0, 3.0, 0.0, 0.0), (9.0, 3.0, 0.0, 0.0)]])) is None
+    assert scan(*buildKeys([])) is None
+
+# Handles grow the range, which stays within the playback range
+def testClampRange():
+
+    assert UnrealExporter.keyRange.clampRange((10.5, 40.2), 5, 1, 100) == (5, 46)
+    assert UnrealExporter.keyRange.clampRange((2.0, 98.0), 5, 1, 100) == (1, 100)
+
+    # Keys that are all past the end still get a frame
+    assert UnrealExporter.keyRange.clampRange((150.0, 160.0), 0, 1, 100) == (100, 100)
@@ -0,0 +1,70 @@
+'''
+Tests for the key reduction in UnrealExporter.reduction
+'''
+
+# Import statements
+import numpy
+
+# Import reduction module from UnrealExporter package
+import UnrealExporter.reduction
+
+# Gets the largest distance from every key to the line between the kept keys around it
+def getMaxError(times, values, keep):
+
+    keptTimes = numpy.asarray(times)[keep]
+    keptValues = numpy.asarray(values)[keep]
+
+    return numpy.abs(numpy.interp(times, keptTimes, keptValues) - values).max()
+
+# A straight line only needs its end keys, a held value too
+def testReduceStraightLines():
+
+    times = [numpy.arange(10.0), numpy.arange(5.0)]
+    values = [numpy.arange(10.0) * 2.0 + 1.0, numpy.full(5, 3.0)]
+
+    keep, errors = UnrealExporter.reduction.reduceArrays(times, values, [0.01, 0.01])
+
+    assert keep[0].tolist() == [True] + [False] * 8 + [True]
+    assert keep[1].tolist() == [True, False, False, False, True]
+    assert numpy.allclose(errors, 0.0)
+
+# A corner is kept, the keys on the lines to either side of it are not
+def testReduceKeepsCorners():
+
+    times = [numpy.arange(11.0)]
+    values = [numpy.concatenate([numpy.arange(6.0), numpy.arange(4.0, -1.0, -1.0)])]
+
+    keep, errors = UnrealExporter.reduction.reduceArrays(times, values, [0.01])
+
+    assert numpy.flatnonzero(keep[0]).tolist() == [0, 5, 10]
+    assert errors[0] == 0.0
+
+# Every curve stays within its own tolerance, and the reported error is the real one
+def testReduceWithinTolerance():
+
+    rng = numpy.random.RandomState(1)
+
+    times = [numpy.arange(200.0)] * 3
+    values = [numpy.sin(numpy.arange(200.0) / 10.0) * 10.0 + rng.uniform(-0.01, 0.01, 200) for i in range(3)]
+    tolerances = [0.05, 0.5, 5.0]
+
+    keep, errors = UnrealExporter.reduction.reduceArrays(times, values, tolerances)
+
+    counts = [mask.sum() for mask in keep]
+
+    for curveTimes, curveValues, mask, error, tolerance in zip(times, values, keep, errors, tolerances):
+
+        assert mask[0] and mask[-1]
+        assert error <= tolerance
+        assert numpy.isclose(getMaxError(curveTimes, curveValues, mask), error)
+
+    # Looser tolerances keep fewer keys
+    assert counts[0] > counts[1] > counts[2]
+
+# Curves with no keys, or too few to reduce, are kept as they are
+def testReduceShortCurves():
+
+    keep, errors = UnrealExporter.reduction.reduceArrays([[], [1.0], [1.0, 2.0]], [[], [5.0], [5.0, 6.0]], [0.1, 0.1, 0.1])
+
+    assert [mask.tolist() for mask in keep] == [[], [True], [True, True]]
+    assert numpy.allclose(errors, 0.0)
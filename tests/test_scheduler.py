@@ -0,0 +1,68 @@
+'''
+Tests for splitting scene jobs across workers in UnrealExporter.scheduler
+'''
+
+# Import scheduler module from UnrealExporter package
+import UnrealExporter.scheduler
+
+# Builds scene jobs with the given number of assets each
+def buildJobs(*assetCounts):
+
+    return [{"scene" : "sh%d.ma" % index,
+                "assets" : [{"node" : "asset%d" % asset, "output" : "sh%d_%d.fbx" % (index, asset)} for asset in range(count)]}
+                for index, count in enumerate(assetCounts)]
+
+# Builds the result a worker writes for a job, every asset exported
+def buildResult(job):
+
+    return {"scene" : job["scene"],
+            "status" : "ok",
+            "elapsed" : float(len(job["assets"])),
+            "attempts" : 1,
+            "assets" : [{"node" : assetJob["node"], "output" : assetJob["output"], "status" : "exported"}
+                            for assetJob in job["assets"]]}
+
+# Scenes aren't split when there are as many as workers
+def testSplitEnoughScenes():
+
+    jobs = buildJobs(3, 3, 3, 3)
+
+    parts, owners = UnrealExporter.scheduler.splitJobs(jobs, 4)
+
+    assert parts == jobs
+    assert owners == [0, 1, 2, 3]
+
+# Fewer scenes than workers share the workers out, never more parts than a scene has assets
+def testSplitFewScenes():
+
+    jobs = buildJobs(10, 2)
+
+    parts, owners = UnrealExporter.scheduler.splitJobs(jobs, 8)
+
+    assert owners == [0, 0, 0, 0, 1, 1]
+    assert [len(part["assets"]) for part in parts] == [2, 3, 2, 3, 1, 1]
+
+    # Every asset lands in exactly one part, in job order
+    assert [assetJob for part in parts[:4] for assetJob in part["assets"]] == jobs[0]["assets"]
+
+# Split results come back as one result per scene, with the assets in job order
+def testMergeResults():
+
+    jobs = buildJobs(5, 1)
+
+    parts, owners = UnrealExporter.scheduler.splitJobs(jobs, 4)
+
+    results = [buildResult(part) for part in parts]
+
+    # One part of the first scene fails
+    results[1]["status"] = "failed"
+    results[1]["error"] = "crashed"
+
+    merged = UnrealExporter.scheduler.mergeResults(jobs, owners, results)
+
+    assert [result["scene"] for result in merged] == ["sh0.ma", "sh1.ma"]
+    assert [assetResult["output"] for assetResult in merged[0]["assets"]] == [assetJob["output"] for assetJob in jobs[0]["assets"]]
+    assert merged[0]["status"] == "failed"
+    assert merged[0]["error"] == "crashed"
+    assert merged[0]["parts"] == 2
+    assert merged[1] is results[-1]
@@ -0,0 +1,91 @@
+'''
+Tests for picking the joints to strip in UnrealExporter.skeleton
+'''
+
+# Import skeleton module from UnrealExporter package
+import UnrealExporter.skeleton
+
+# A root with a spine and two arms, as full paths in hierarchy order
+PATHS = ["|root",
+            "|root|spine",
+            "|root|spine|armL",
+            "|root|spine|armL|handL",
+            "|root|spine|armL|handL|fingerL",
+            "|root|spine|armR",
+            "|root|spine|armR|handR",
+            "|root|twist"]
+
+TOLERANCE = UnrealExporter.skeleton.DEFAULT_WEIGHT_TOLERANCE
+
+# Keys weights given by leaf name by the full path of the joint in the given paths, as getMaxWeights returns them
+def byPath(weights, paths = PATHS):
+
+    return dict((path, weights[path.split("|")[-1]]) for path in paths if path.split("|")[-1] in weights)
+
+# Unweighted joints with nothing weighted under them are stripped, unweighted joints above weighted ones stay
+def testFindStrippedJoints():
+
+    maxWeights = byPath({"root" : 0.5, "armL" : 0.0, "handL" : 0.0, "fingerL" : 0.3, "armR" : 0.2, "handR" : 0.0, "twist" : 0.0})
+
+    stripped = UnrealExporter.skeleton.findStrippedJoints(PATHS, maxWeights, TOLERANCE)
+
+    assert stripped == ["|root|spine|armR|handR", "|root|twist"]
+
+# Weights within tolerance count as no weight, joints missing from the weights have none
+def testFindStrippedJointsTolerance():
+
+    maxWeights = byPath({"root" : 1.0, "handL" : TOLERANCE / 2.0, "fingerL" : TOLERANCE * 2.0})
+
+    stripped = UnrealExporter.skeleton.findStrippedJoints(PATHS, maxWeights, TOLERANCE)
+
+    assert stripped == ["|root|spine|armR", "|root|spine|armR|handR", "|root|twist"]
+
+# Each branch is kept or stripped on its own, a weighted joint only keeps the joints above it
+def testFindStrippedJointsBranches():
+
+    paths = ["|root", "|root|a", "|root|a|end", "|root|b", "|root|b|tip"]
+
+    stripped = UnrealExporter.skeleton.findStrippedJoints(paths, byPath({"root" : 1.0, "end" : 1.0}, paths), TOLERANCE)
+
+    assert stripped == ["|root|b", "|root|b|tip"]
+
+# The bone map lists the kept bones parents first with their parent bone, and the stripped joints by name
+def testCreateBoneMap():
+
+    maxWeights = byPath({"root" : 0.5, "fingerL" : 0.3, "armR" : 0.2})
+
+    boneMap = UnrealExporter.skeleton.createBoneMap(PATHS, maxWeights, TOLERANCE)
+
+    assert boneMap["bones"] == [["root", None],
+                                ["spine", "root"],
+                                ["armL", "spine"],
+                                ["handL", "armL"],
+                                ["fingerL", "handL"],
+                                ["armR", "spine"]]
+    assert boneMap["stripped"] == ["handR", "twist"]
+
+# Without any weights every joint would go, so none does
+def testCreateBoneMapNoWeights():
+
+    boneMap = UnrealExporter.skeleton.createBoneMap(PATHS, {}, TOLERANCE)
+
+    assert boneMap["stripped"] == []
+    assert len(boneMap["bones"]) == len(PATHS)
+
+# Joints with the same name in different places are weighted on their own, a weighted one isn't stripped for its twin
+def testFindStrippedJointsSameName():
+
+    paths = ["|root", "|root|a", "|root|a|end", "|root|b", "|root|b|end"]
+
+    stripped = UnrealExporter.skeleton.findStrippedJoints(paths, {"|root" : 1.0, "|root|b|end" : 1.0}, TOLERANCE)
+
+    assert stripped == ["|root|a", "|root|a|end"]
+
+# The bone map names joints by leaf name, so with two joints of the same name nothing is stripped
+def testCreateBoneMapSameName():
+
+    paths = ["|root", "|root|a", "|root|a|end", "|root|b", "|root|b|end"]
+
+    boneMap = UnrealExporter.skeleton.createBoneMap(paths, {"|root" : 1.0, "|root|b|end" : 1.0}, TOLERANCE)
+
+    assert boneMap["stripped"] == []
@@ -0,0 +1,67 @@
+'''
+The ueBakeShard module, the worker that bakes one shard of a sharded bake
+
+Usage:
+    mayapy ueBakeShard.py shard.json --result keys.json [--standin]
+
+Started by UnrealExporter.sharding.bakeSharded, the shard file gives the scene copy,
+the nodes to bake, the frame range and the frame the scene is run up from before it:
+
+    {"scene": "/tmp/ueShard/shardScene.mb", "nodes": ["hero:root", "hero:joint0"],
+     "startTime": 501, "endTime": 1000, "preRollStart": 491}
+'''
+
+# Import statements
+import argparse
+import json
+import os
+import sys
+import traceback
+
+def main(argv = None):
+
+    parser = argparse.ArgumentParser(description = "Bake one shard of a frame range and write out its keys")
+    parser.add_argument("shardFile", help = "json shard file")
+    parser.add_argument("--result", required = True, help = "write the json keys here")
+    parser.add_argument("--standin", action = "store_true",
+                        help = "run against the in-memory stand-in scene instead of Maya")
+
+    args = parser.parse_args(argv)
+
+    if args.standin:
+
+        # The stand-in lives with the benchmarks, it isn't part of the package
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+        import standin
+        standin.install()
+
+    else:
+
+        import maya.standalone
+        maya.standalone.initialize(name = "python")
+
+    # Import the exporter once Maya, or the stand-in, is up
+    import UnrealExporter.sharding
+
+    with open(args.shardFile) as shardFile:
+
+        job = json.load(shardFile)
+
+    try:
+
+        result = UnrealExporter.sharding.bakeShard(job)
+
+    except Exception as e:
+
+        result = {"status" : "failed", "error" : str(e), "traceback" : traceback.format_exc()}
+
+    with open(args.result, "w") as resultFile:
+
+        json.dump(result, resultFile)
+
+    return 0 if result["status"] == "ok" else 1
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,399 @@
+'''
+The ueBatch module for headless exports driven by a job file
+
+Usage:
+    mayapy ueBatch.py jobs.json [--result result.json] [--incremental] [--standin] [--trace trace.json]
+                                [--workers N [--timeout SECONDS] [--retries N] [--interpreter mayapy]]
+
+Job files are json, or yaml when PyYAML is installed:
+
+    {"incremental": false,
+     "keyReduction": {"rotate": 0.01},
+     "selectiveBake": true,
+     "autoRange": 5,
+     "importReferences": false,
+     "jointStrip": true,
+     "exportProfiles": "profiles/unreal.json",
+     "jobs": [{"scene": "shots/sh010.ma",
+               "assets": [{"node": "hero:main_ctrl", "output": "fbx/hero_sh010.fbx"},
+                          {"node": "shotCam", "output": "fbx/cam_sh010.fbx", "type": "animation"},
+                          {"node": "villain:main_ctrl", "output": "fbx/villain_sh010.fbx", "type": "animation",
+                           "boneMap": "fbx/villain.boneMap.json"}]}]}
+
+The asset type is optional, when it is left out it is picked the same way as the UI.
+keyReduction is optional, true or tolerances by channel group reduce the baked keys (see UnrealExporter.reduction),
+a job's own keyReduction overrides the job file's.
+selectiveBake is optional, true only bakes the channels driven over time and keys the rest once (see UnrealExporter.drivers),
+a job's own selectiveBake overrides the job file's.
+autoRange is optional, true or handles in frames bake each asset over the range its keys move over (see UnrealExporter.keyRange),
+frameRange is optional, [start, end] bakes every asset over that range instead, a job's own entries override the job file's.
+importReferences is optional, false exports skeletal and static meshes straight from their referenced namespace without importing the rig,
+a job's own importReferences overrides the job file's.
+jointStrip is optional, true or a weight tolerance strip the joints that don't influence the exported meshes (see UnrealExporter.skeleton),
+and writes a bone map next to each skeletal fbx, a job's own jointStrip overrides the job file's.
+An asset's boneMap is optional, it strips the joints a bone map written with an earlier export stripped.
+exportProfiles is optional, a json or yaml file tuning the FBX export profiles (see UnrealExporter.fbxOptions),
+a job's own exportProfiles overrides the job file's.
+Relative paths are relative to the job file.
+'''
+
+# Import statements
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+# Loads a job file
+def loadJobFile(jobFilePath):
+
+    with open(jobFilePath) as jobFile:
+
+        # Yaml job files need PyYAML
+        if os.path.splitext(jobFilePath)[1].lower() in (".yaml", ".yml"):
+
+            try:
+
+                import yaml
+
+            except ImportError:
+
+                raise RuntimeError("PyYAML is needed to read yaml job files: " + jobFilePath)
+
+            jobs = yaml.safe_load(jobFile)
+
+        else:
+
+            jobs = json.load(jobFile)
+
+    # Resolve relative paths against the job file
+    rootDir = os.path.dirname(os.path.abspath(jobFilePath))
+
+    for job in jobs.get("jobs", []):
+
+        job["scene"] = os.path.join(rootDir, job["scene"])
+
+        # Jobs carry their bake settings and export profiles, so workers don't need the whole job file
+        job.setdefault("keyReduction", jobs.get("keyReduction"))
+        job.setdefault("selectiveBake", jobs.get("selectiveBake", False))
+        job.setdefault("autoRange", jobs.get("autoRange"))
+        job.setdefault("frameRange", jobs.get("frameRange"))
+        job.setdefault("importReferences", jobs.get("importReferences", True))
+        job.setdefault("jointStrip", jobs.get("jointStrip"))
+        job.setdefault("exportProfiles", jobs.get("exportProfiles"))
+
+        if job["exportProfiles"]:
+
+            job["exportProfiles"] = os.path.join(rootDir, job["exportProfiles"])
+
+        for assetJob in job.get("assets", []):
+
+            assetJob["output"] = os.path.join(rootDir, assetJob["output"])
+
+            if assetJob.get("boneMap"):
+
+                assetJob["boneMap"] = os.path.join(rootDir, assetJob["boneMap"])
+
+    return jobs
+
+# Creates the result summary for a job file
+def createSummary(jobFilePath, incremental, results, elapsed):
+
+    # Count up every asset
+    totals = {"exported" : 0, "skipped" : 0, "failed" : 0}
+
+    for result in results:
+
+        for assetResult in result["assets"]:
+
+            totals[assetResult["status"]] = totals.get(assetResult["status"], 0) + 1
+
+    return {"jobFile" : os.path.abspath(jobFilePath),
+            "incremental" : incremental,
+            "elapsed" : elapsed,
+            "totals" : totals,
+            "jobs" : results}
+
+# Runs every job in a job file and returns the result summary
+def runJobFile(jobFilePath, incremental = None):
+
+    jobs = loadJobFile(jobFilePath)
+
+    if incremental is None:
+
+        incremental = jobs.get("incremental", False)
+
+    start = time.time()
+
+    results = [runJob(job, incremental) for job in jobs.get("jobs", [])]
+
+    return createSummary(jobFilePath, incremental, results, time.time() - start)
+
+# Runs every job in a job file across a pool of worker processes and returns the result summary
+def runJobFileParallel(jobFilePath, workers, incremental = None, timeout = None, retries = 0,
+                        interpreter = None, standin = False):
+
+    import UnrealExporter.scheduler
+
+    jobs = loadJobFile(jobFilePath)
+
+    if incremental is None:
+
+        incremental = jobs.get("incremental", False)
+
+    scheduler = UnrealExporter.scheduler.Scheduler(workers = workers,
+                                                    timeout = timeout,
+                                                    retries = retries,
+                                                    interpreter = interpreter,
+                                                    standin = standin)
+
+    start = time.time()
+
+    # Scenes are split into asset groups when there are fewer of them than workers
+    parts, owners = UnrealExporter.scheduler.splitJobs(jobs.get("jobs", []), scheduler.workers)
+
+    results = UnrealExporter.scheduler.mergeResults(jobs.get("jobs", []), owners, scheduler.run(parts, incremental))
+
+    summary = createSummary(jobFilePath, incremental, results, time.time() - start)
+    summary["workers"] = scheduler.workers
+    summary["log"] = scheduler.log
+
+    return summary
+
+# Opens a scene and exports its assets in one batch
+def runJob(job, incremental = False):
+
+    # Import the exporter when it is first needed, so the stand-in can be installed first
+    import pymel.core
+    import ueExport
+    import UnrealExporter.batch
+    import UnrealExporter.incremental
+    import UnrealExporter.sceneIndex
+    import UnrealExporter.utils
+    import UnrealExporter.validation
+
+    start = time.time()
+
+    result = {"scene" : job["scene"], "status" : "ok", "assets" : []}
+
+    # One result per asset, in job order
+    for assetJob in job.get("assets", []):
+
+        result["assets"].append({"node" : assetJob["node"],
+                                    "output" : assetJob["output"],
+                                    "type" : assetJob.get("type"),
+                                    "status" : "failed",
+                                    "reason" : None})
+
+    try:
+
+        # Open the scene
+        pymel.core.openFile(job["scene"], force = True)
+        UnrealExporter.utils.loadFBXPlugin()
+        UnrealExporter.sceneIndex.invalidate()
+
+        UnrealExporter.utils.setKeyReduction(job.get("keyReduction"))
+        UnrealExporter.utils.setSelectiveBake(job.get("selectiveBake", False))
+        UnrealExporter.utils.setAutoBakeRange(job.get("autoRange"))
+        UnrealExporter.utils.setBakeRange(job.get("frameRange"))
+        UnrealExporter.utils.setImportReferences(job.get("importReferences", True))
+        UnrealExporter.utils.setJointStripping(job.get("jointStrip"))
+
+        # Profiles tuned by another job don't carry over
+        UnrealExporter.utils.resetExportProfiles()
+
+        if job.get("exportProfiles"):
+
+            UnrealExporter.utils.loadExportProfiles(job["exportProfiles"])
+
+        if incremental:
+
+            batch = UnrealExporter.incremental.IncrementalExporter()
+
+        else:
+
+            batch = UnrealExporter.batch.BatchExporter()
+
+        queued = []
+
+        # Create every asset, any that fail are reported and skipped
+        for assetJob, assetResult in zip(job.get("assets", []), result["assets"]):
+
+            try:
+
+                node = pymel.core.PyNode(assetJob["node"])
+                shape = UnrealExporter.utils.getShape(node)
+
+                asset = ueExport.setUnrealAssetObject(shape, node)
+                asset.setFileName(assetJob["output"])
+
+                if assetJob.get("boneMap"):
+
+                    asset.setBoneMapFile(assetJob["boneMap"])
+
+                if assetResult["type"] is None:
+
+                    assetResult["type"] = ueExport.getExportType(asset)
+
+                # Validate before anything is baked, broken assets are skipped
+                issues = UnrealExporter.validation.validateAsset(asset, assetResult["type"])
+
+                if issues:
+
+                    assetResult["issues"] = issues
+
+                errors = UnrealExporter.validation.getErrors(issues)
+
+                if errors:
+
+                    assetResult["reason"] = "; ".join(error["message"] for error in errors)
+
+                    continue
+
+                batch.addAsset(asset, assetResult["type"])
+
+                queued.append((assetResult, asset))
+
+            except Exception as e:
+
+                assetResult["reason"] = str(e)
+
+        # Make sure the output directories exist
+        for assetResult, asset in queued:
+
+            outputDir = os.path.dirname(assetResult["output"])
+
+            if outputDir and not os.path.isdir(outputDir):
+
+                os.makedirs(outputDir)
+
+        # Export them all
+        report = batch.export() if queued else None
+
+        for index, (assetResult, asset) in enumerate(queued):
+
+            if report is None:
+
+                assetResult["status"] = "exported"
+
+            else:
+
+                assetResult["status"] = report[index]["status"]
+                assetResult["reason"] = report[index]["reason"]
+
+            if asset.reductionReport is not None:
+
+                assetResult["reduction"] = asset.reductionReport
+
+    except Exception as e:
+
+        result["status"] = "failed"
+        result["error"] = str(e)
+        result["traceback"] = traceback.format_exc()
+
+        for assetResult in result["assets"]:
+
+            if assetResult["status"] != "failed":
+
+                continue
+
+            assetResult["reason"] = assetResult["reason"] or "scene failed: " + str(e)
+
+    if any(assetResult["status"] == "failed" for assetResult in result["assets"]):
+
+        result["status"] = "failed"
+
+    result["elapsed"] = time.time() - start
+
+    return result
+
+def main(argv = None):
+
+    parser = argparse.ArgumentParser(description = "Export Unreal assets from Maya scenes listed in a job file")
+    parser.add_argument("jobFile", help = "json or yaml job file")
+    parser.add_argument("--result", help = "write the json result summary here instead of stdout")
+    parser.add_argument("--incremental", action = "store_true", default = None,
+                        help = "skip assets that have not changed since the last export")
+    parser.add_argument("--standin", action = "store_true",
+                        help = "run against the in-memory stand-in scene instead of Maya")
+    parser.add_argument("--workers", type = int,
+                        help = "run each scene in its own worker process, this many at once, "
+                               "with fewer scenes than workers a scene's assets are split across workers")
+    parser.add_argument("--timeout", type = float,
+                        help = "seconds a worker may spend on its scene or asset group before it is killed")
+    parser.add_argument("--retries", type = int, default = 0,
+                        help = "times a worker job is run again after its worker crashes or times out")
+    parser.add_argument("--interpreter",
+                        help = "interpreter the workers run in, defaults to this one")
+    parser.add_argument("--trace",
+                        help = "write per-stage export timings here, Chrome trace format for .json, json lines otherwise")
+
+    args = parser.parse_args(argv)
+
+    # Workers run in their own processes, only in process runs can be traced
+    if args.trace and args.workers:
+
+        parser.error("--trace can't be used with --workers")
+
+    # The parent only schedules, the workers load Maya
+    if args.workers:
+
+        summary = runJobFileParallel(args.jobFile,
+                                        args.workers,
+                                        incremental = args.incremental,
+                                        timeout = args.timeout,
+                                        retries = args.retries,
+                                        interpreter = args.interpreter,
+                                        standin = args.standin)
+
+    else:
+
+        if args.standin:
+
+            # The stand-in lives with the benchmarks, it isn't part of the package
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+            import standin
+            standin.install()
+
+        else:
+
+            import maya.standalone
+            maya.standalone.initialize(name = "python")
+
+        # Imported once Maya or the stand-in is there
+        import UnrealExporter.tracer
+
+        tracer = UnrealExporter.tracer.getTracer()
+
+        if args.trace:
+
+            tracer.start()
+
+        summary = runJobFile(args.jobFile, args.incremental)
+
+        if args.trace:
+
+            tracer.stop()
+            tracer.write(args.trace)
+
+            summary["trace"] = os.path.abspath(args.trace)
+
+    output = json.dumps(summary, indent = 2, sort_keys = True)
+
+    if args.result:
+
+        with open(args.result, "w") as resultFile:
+
+            resultFile.write(output)
+
+    else:
+
+        print(output)
+
+    return 1 if summary["totals"]["failed"] else 0
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -3,12 +3,11 @@ The ueExport module for Maya UI useage
 '''
 
 # Import statements
-import pymel.core
+# Only maya.cmds is imported up front, so the UI opens without loading PyMEL,
+# PyMEL and the UnrealExporter package are imported when an export needs them
+import maya.cmds
 import os
 
-# Import utils and ueAsset modules from UnrealExport package
-import UnrealExporter.utils, UnrealExporter.ueAsset
-
 # UI variables
 global WINDOW_NAME
 
@@ -22,7 +21,7 @@ UI Code start
 def browseDirFilePath():
 
     # Grab the filepath
-    filepath = pymel.core.fileDialog2(ds = 1, cap = "Select Folder for export", fm = 3)
+    filepath = maya.cmds.fileDialog2(ds = 1, cap = "Select Folder for export", fm = 3)
     
     # Check if the filepath is none
     if filepath != None:
@@ -31,31 +30,31 @@ def browseDirFilePath():
         filepath = filepath[0].replace("\\", "/")
         
         # Add to the textfield for UI
-        pymel.core.textField("ExportDirTF", e = True, tx = filepath)
+        maya.cmds.textField("ExportDirTF", e = True, tx = filepath)
     
     # If file was not chosen, error out    
     else:
         
-        pymel.core.error("No Folder chosen, please select a directory")
+        maya.cmds.error("No Folder chosen, please select a directory")
 
 # Creates the file for FBX
 def createExportFile():
 
     # Query the directory UI textfield
-    fileDir = pymel.core.textField("ExportDirTF", q = True, tx = True)
+    fileDir = maya.cmds.textField("ExportDirTF", q = True, tx = True)
 
     # if the directory in UI is empty
     if not fileDir:
 
-        pymel.core.error("Must select a directory to export to")
+        maya.cmds.error("Must select a directory to export to")
 
     # Query the file name UI textfield
-    fileName = pymel.core.textField("ExportFileTF", q = True, tx = True)
+    fileName = maya.cmds.textField("ExportFileTF", q = True, tx = True)
 
     # If the filename in UI is empty
     if not fileName:
 
-        pymel.core.error("Must give FBX a name for export")
+        maya.cmds.error("Must give FBX a name for export")
 
     # If user did not put ".fbx" in the ui
     if ".fbx" not in fileName:
@@ -73,9 +72,9 @@ def deleteDisplay():
 
     global WINDOW_NAME
 
-    if pymel.core.window(WINDOW_NAME, ex = True):
+    if maya.cmds.window(WINDOW_NAME, ex = True):
         
-        pymel.core.deleteUI(WINDOW_NAME)
+        maya.cmds.deleteUI(WINDOW_NAME)
 
 def displayUI():
 
@@ -83,114 +82,91 @@ def displayUI():
     
     deleteDisplay()
     
-    pymel.core.window(WINDOW_NAME, t = "Export FBX for Unreal", h = 60, w = 150, sizeable = False, mxb = False, mnb = True)
+    maya.cmds.window(WINDOW_NAME, t = "Export FBX for Unreal", h = 60, w = 150, sizeable = False, mxb = False, mnb = True)
 
-    pymel.core.columnLayout(adj = True)
+    maya.cmds.columnLayout(adj = True)
 
-    pymel.core.separator(h = 5, st = "none")
+    maya.cmds.separator(h = 5, st = "none")
     
-    pymel.core.rowLayout(cat = (1, "both", 7.5))
+    maya.cmds.rowLayout(cat = (1, "both", 7.5))
     
-    pymel.core.text("Select an Object (Ctrl, Mesh, Camera) to Export for Unreal")
+    maya.cmds.text("Select an Object (Ctrl, Mesh, Camera) to Export for Unreal")
     
-    pymel.core.setParent('..')
+    maya.cmds.setParent('..')
     
-    pymel.core.separator(h = 5, st = "none")
+    maya.cmds.separator(h = 5, st = "none")
     
-    pymel.core.rowLayout(nc = 3,cw3 = (65, 170, 30), cat = [(1, "both", 2), (2, "both", 2), (3, "both", 5)])
+    maya.cmds.rowLayout(nc = 3,cw3 = (65, 170, 30), cat = [(1, "both", 2), (2, "both", 2), (3, "both", 5)])
 
-    pymel.core.text("Export Dir:")
+    maya.cmds.text("Export Dir:")
 
-    pymel.core.textField("ExportDirTF", w = 175)
+    maya.cmds.textField("ExportDirTF", w = 175)
 
-    pymel.core.button(l = "Browse", w = 50, c = "ueExport.browseDirFilePath()")
+    maya.cmds.button(l = "Browse", w = 50, c = "ueExport.browseDirFilePath()")
 
-    pymel.core.setParent('..')
+    maya.cmds.setParent('..')
 
-    pymel.core.separator(h = 10, st = "none")
+    maya.cmds.separator(h = 10, st = "none")
     
-    pymel.core.setParent('..')
+    maya.cmds.setParent('..')
     
-    pymel.core.rowLayout(nc = 2,cw2 = (68, 170), cat = [(1, "both", 2), (2, "both", 2)])
+    maya.cmds.rowLayout(nc = 2,cw2 = (68, 170), cat = [(1, "both", 2), (2, "both", 2)])
 
-    pymel.core.text("Export FBX:")
+    maya.cmds.text("Export FBX:")
 
-    pymel.core.textField("ExportFileTF", w = 235)
+    maya.cmds.textField("ExportFileTF", w = 235)
 
-    pymel.core.setParent('..')
+    maya.cmds.setParent('..')
 
-    pymel.core.separator(h = 10, st = "none")
+    maya.cmds.separator(h = 10, st = "none")
 
-    pymel.core.rowLayout(nc = 2, cat = [(1, "both", 2), (2, "both", 2)])
+    maya.cmds.rowLayout(nc = 2, cat = [(1, "both", 2), (2, "both", 2)])
 
-    pymel.core.button(l = "Cancel", w = 150, c = "ueExport.deleteDisplay()")
+    maya.cmds.button(l = "Cancel", w = 150, c = "ueExport.deleteDisplay()")
 
-    pymel.core.button(l = "Export", w = 150, c = "ueExport.runProcess()")
+    maya.cmds.button(l = "Export", w = 150, c = "ueExport.runProcess()")
     
-    pymel.core.setParent('..')
+    maya.cmds.setParent('..')
     
-    pymel.core.separator(h = 5, st = "none")
+    maya.cmds.separator(h = 5, st = "none")
 
-    pymel.core.showWindow()
+    maya.cmds.showWindow()
 
 '''
 UI Code end
 '''
 
 # Checks if there's any animation in the asset
+# The asset is animated when any of its controls has a translate curve
 def checkAnimation(asset):
 
-    print asset.namespace
+    import UnrealExporter.backend
+    import UnrealExporter.sceneIndex
 
-    # Variable to check if animation is fasle
-    isAnimated = False
+    sceneIndex = UnrealExporter.sceneIndex.getSceneIndex()
 
-    # Grab all transforms in the asset's namespace
-    transforms = pymel.core.ls(asset.namespace + "*", type = "transform")
+    # Grab the hierarchy snapshot, every node's type and children are in it
+    hierarchy = sceneIndex.getHierarchy()
 
-    # Loop through all transforms
-    for transform in transforms:
+    controls = []
 
-        # If the value for isAnimated has changed, break the loop
-        if isAnimated:
+    # Loop through all transforms in the asset's namespace
+    for index, path in enumerate(hierarchy.paths):
 
-            break
+        if hierarchy.namespaces[index] != asset.namespace or "transform" not in sceneIndex.getInheritedTypes(hierarchy.types[index]):
 
-        # Try to see if transform has a shape
-        try:
+            continue
 
-            # If not, then skip
-            if transform.getShape().type() == None:
+        # Grab the shapes under the transform
+        shapes = [child for child in hierarchy.children[index] if "shape" in sceneIndex.getInheritedTypes(hierarchy.types[child])]
 
-                continue
+        # If the first shape is a nurbsCurve, it's a control
+        if shapes and hierarchy.types[shapes[0]] == "nurbsCurve":
 
-        # If errors out, continue
-        except:
+            controls.append(path)
 
-            continue
-
-        # Grab the shape type
-        shapeType = transform.getShape().type()
-
-        # If the shape type is a nurbsCurve
-        if shapeType == "nurbsCurve":
-            
-            # Grab all connections
-            connections = transform.listConnections()
-            
-            # Loop through all connections
-            for connection in connections:
-                
-                # If the connection type is an animation curve
-                if connection.type() == "animCurveTL":
-                    
-                    # Set isAnimated to True
-                    isAnimated = True
-
-                    # Break the loop
-                    break
-
-    return isAnimated
+    # One query for the translate curves on every control
+    return bool(UnrealExporter.backend.getBackend().listConnections(controls, "animCurveTL"))
 
 # Exports animation for skeltal mesh and camera
 def exportAnimAsset(asset):
@@ -210,11 +186,54 @@ def exportSkelAsset(asset):
     # Exports the skeltal mesh
     asset.exportSkeletonMesh()
 
+# Gets the export type for an asset
+# Animated skeletal meshes and cameras export animation,
+# skeletal meshes without animation export the skeletal mesh
+def getExportType(asset):
+
+    import UnrealExporter.batch
+
+    # Grab the class name
+    assetType = asset.__class__.__name__
+
+    # If its a skeletal mesh
+    if assetType == "SkeletalMesh":
+
+        # Check the animation
+        if checkAnimation(asset):
+
+            return UnrealExporter.batch.ANIMATION
+
+        return UnrealExporter.batch.SKELETON
+
+    # Else if its a camera
+    elif assetType == "Camera":
+
+        return UnrealExporter.batch.ANIMATION
+
+    # Else, it's a static mesh
+    return UnrealExporter.batch.MESH
+
 # Run process for UI
 def runProcess():
 
+    import pymel.core
+    import UnrealExporter.batch
+    import UnrealExporter.utils
+    import UnrealExporter.validation
+
+    selection = pymel.core.selected()
+
+    # Error out if nothing is selected
+    if not selection:
+
+        pymel.core.error("Nothing selected to export")
+
     # Grabs the first selected item
-    selectedItem = pymel.core.selected()[0]
+    selectedItem = selection[0]
+
+    # The FBX export dialog may have changed the fbx options since the last export
+    UnrealExporter.utils.invalidateExportOptions()
 
     # Grabs the shape node of selection
     shape = UnrealExporter.utils.getShape(selectedItem)
@@ -228,29 +247,32 @@ def runProcess():
     # Sets the file export name
     asset.setFileName(ueFbx)
 
-    # Grab the class name
-    assetType = asset.__class__.__name__
+    # Grab the export type
+    exportType = getExportType(asset)
 
-    # If its a skeletal mesh
-    if assetType == "SkeletalMesh":
+    # Validate before anything is baked
+    issues = UnrealExporter.validation.validateAsset(asset, exportType)
 
-        # Check the animation
-        if checkAnimation(asset):
+    # Error out with every error found, warn about the rest
+    if UnrealExporter.validation.getErrors(issues):
 
-            # Export animation
-            exportAnimAsset(asset)
+        pymel.core.error("Asset can't be exported\n" + UnrealExporter.validation.formatIssues(issues))
 
-        # Else export the skeletal mesh
-        else:
+    for issue in issues:
 
-            exportSkelAsset(asset)
+        pymel.core.warning(issue["message"])
 
-    # Else if its a camera
-    elif assetType == "Camera":
+    # If its an animation
+    if exportType == UnrealExporter.batch.ANIMATION:
 
-        # Export the animation
+        # Export animation
         exportAnimAsset(asset)
 
+    # Else if its a skeletal mesh
+    elif exportType == UnrealExporter.batch.SKELETON:
+
+        exportSkelAsset(asset)
+
     # Else, it's a static mesh
     else:
 
@@ -262,22 +284,27 @@ def runProcess():
 # Checks the asset to determine the ueAsset
 def setUnrealAssetObject(shape, item):
 
+    import UnrealExporter.ueAsset
+
     asset = None
 
+    # Grab the shape type
+    shapeType = shape.type()
+
     # If the asset is a camera
-    if shape.type() == "camera":
+    if shapeType == "camera":
 
         # Create a camera object
         asset = UnrealExporter.ueAsset.Camera(item)
 
     # If the asset is a nurbsCurve or a joint
-    elif shape.type() == "nurbsCurve" or shape.type() == "joint":
+    elif shapeType == "nurbsCurve" or shapeType == "joint":
 
         # Create a skeletal mesh object
         asset = UnrealExporter.ueAsset.SkeletalMesh(item)
 
     # If the asset is a mesh
-    elif shape.type() == "mesh":
+    elif shapeType == "mesh":
 
         # Create a static mesh object
         asset = UnrealExporter.ueAsset.StaticMesh(item)
@@ -286,7 +313,7 @@ def setUnrealAssetObject(shape, item):
     else:
 
         # Error out
-        pymel.core.error("Asset could not be exported ")
+        maya.cmds.error("Asset could not be exported ")
 
     # Return the asset
     return asset